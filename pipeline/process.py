@@ -16,6 +16,7 @@ import yaml
 
 from pipeline.schemas import (
     SchemaVersion,
+    ValidationMode,
     get_dataset_schema,
     validate_dataframe,
 )
@@ -45,6 +46,7 @@ class DataProcessor:
         processed_dir: Path,
         cache_dir: Path | None = None,
         config_data: dict[str, Any] | None = None,
+        validation_mode: ValidationMode = "full",
     ):
         """Initialize data processor.
 
@@ -53,11 +55,14 @@ class DataProcessor:
             raw_dir: Directory containing raw data
             processed_dir: Directory for processed outputs
             cache_dir: Optional directory for processing cache
+            validation_mode: Schema validation mode ("full", "fast" or
+                "sample")
         """
         self.config_path = Path(config_path)
         self.raw_dir = Path(raw_dir)
         self.processed_dir = Path(processed_dir)
         self.cache_dir = cache_dir or (processed_dir / ".cache")
+        self.validation_mode = validation_mode
 
         if config_data is not None:
             # Copy so worker processes cannot mutate shared config state.
@@ -386,6 +391,7 @@ class DataProcessor:
                     is_valid, error_msg, validated_df = validate_dataframe(
                         df,
                         schema_version,
+                        self.validation_mode,
                     )
                     if not is_valid:
                         logger.error(f"Schema validation failed: {error_msg}")
@@ -570,6 +576,7 @@ class DataProcessor:
                 "raw_dir": self.raw_dir,
                 "processed_dir": self.processed_dir,
                 "cache_dir": self.cache_dir,
+                "validation_mode": self.validation_mode,
                 "force": force,
                 "dry_run": dry_run,
                 "config_data": config_snapshot,
@@ -679,6 +686,7 @@ def _process_dataset_worker(payload: dict[str, Any]) -> ProcessingResult:
         processed_dir=payload["processed_dir"],
         cache_dir=payload["cache_dir"],
         config_data=payload["config_data"],
+        validation_mode=payload["validation_mode"],
     )
     return processor.process_dataset(
         payload["dataset"],
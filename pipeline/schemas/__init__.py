@@ -17,6 +17,13 @@ import pandera
 import pandera.pandas as pa
 from pandera.pandas import Check, Column, DataFrameSchema
 
+from pipeline.schemas.validation import (
+    DEFAULT_SAMPLE_ROWS,
+    VALIDATION_MODES,
+    ValidationMode,
+    validate_with_mode,
+)
+
 # Common field types and validations
 COMMON_CHECKS = {
     "positive": Check.greater_than_or_equal_to(0),
@@ -521,12 +528,15 @@ def get_active_schema_version(dataset_name: str) -> SchemaVersion | None:
 def validate_dataframe(
     df: pd.DataFrame,
     schema: DataFrameSchema | SchemaVersion,
+    mode: ValidationMode = "full",
 ) -> tuple[bool, str | None, pd.DataFrame]:
     """Validate a DataFrame against a schema.
 
     Args:
         df: pandas DataFrame to validate
         schema: Pandera DataFrameSchema
+        mode: Validation mode ("full", "fast" or "sample"); see
+            ``validate_with_mode``
 
     Returns:
         Tuple of (is_valid, error_message, validated_df)
@@ -536,7 +546,7 @@ def validate_dataframe(
         schema_obj = (
             schema.schema if isinstance(schema, SchemaVersion) else schema
         )
-        validated_df = schema_obj.validate(df, lazy=True)
+        validated_df = validate_with_mode(schema_obj, df, mode)
         return True, None, validated_df
     except pandera.errors.SchemaErrors as e:
         return False, str(e), df
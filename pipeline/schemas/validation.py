@@ -0,0 +1,266 @@
+"""Validation modes for the pandera schemas used across the pipelines.
+
+``full`` is plain ``schema.validate(df, lazy=True)``. ``fast`` evaluates
+the same column rules (dtype, nullability, uniqueness, built-in checks) as
+vectorised Arrow/pandas expressions and only falls back to pandera when a rule
+fails, so failure reports are always pandera's own. ``sample`` coerces the
+whole frame but runs the checks on a random subset of rows.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Any, Literal
+
+import pandas as pd
+import pyarrow
+import pyarrow.compute as pc
+from pandera.engines import pandas_engine
+from pandera.pandas import Check, Column, DataFrameSchema
+
+ValidationMode = Literal["full", "fast", "sample"]
+VALIDATION_MODES: tuple[ValidationMode, ...] = ("full", "fast", "sample")
+DEFAULT_SAMPLE_ROWS = 10_000
+
+logger = logging.getLogger(__name__)
+
+# Built-in checks with an Arrow equivalent, keyed by ``Check.name``. Each
+# takes the non-null values and the check statistics and returns a boolean
+# array; nulls never fail these checks (``ignore_na``).
+_ArrowCheck = Callable[[pyarrow.Array, dict[str, Any]], pyarrow.Array]
+_ARROW_CHECKS: dict[str, _ArrowCheck] = {
+    "isin": lambda values, stats: pc.is_in(
+        values, value_set=pyarrow.array(list(stats["allowed_values"]))
+    ),
+    "notin": lambda values, stats: pc.invert(
+        pc.is_in(
+            values, value_set=pyarrow.array(list(stats["forbidden_values"]))
+        )
+    ),
+    "equal_to": lambda values, stats: pc.equal(values, stats["value"]),
+    "not_equal_to": lambda values, stats: pc.not_equal(values, stats["value"]),
+    "greater_than": lambda values, stats: pc.greater(
+        values, stats["min_value"]
+    ),
+    "greater_than_or_equal_to": lambda values, stats: pc.greater_equal(
+        values, stats["min_value"]
+    ),
+    "less_than": lambda values, stats: pc.less(values, stats["max_value"]),
+    "less_than_or_equal_to": lambda values, stats: pc.less_equal(
+        values, stats["max_value"]
+    ),
+    "in_range": lambda values, stats: pc.and_(
+        (pc.greater_equal if stats["include_min"] else pc.greater)(
+            values, stats["min_value"]
+        ),
+        (pc.less_equal if stats["include_max"] else pc.less)(
+            values, stats["max_value"]
+        ),
+    ),
+    "str_length": lambda values, stats: _length_between(
+        pc.utf8_length(values), stats["min_value"], stats["max_value"]
+    ),
+}
+
+__all__ = [
+    "DEFAULT_SAMPLE_ROWS",
+    "VALIDATION_MODES",
+    "ValidationMode",
+    "validate_with_mode",
+]
+
+
+def validate_with_mode(
+    schema: DataFrameSchema,
+    df: pd.DataFrame,
+    mode: ValidationMode = "full",
+    *,
+    sample_rows: int = DEFAULT_SAMPLE_ROWS,
+    random_state: int = 0,
+) -> pd.DataFrame:
+    """Validate ``df`` against ``schema`` using the requested mode.
+
+    Args:
+        schema: Pandera DataFrameSchema
+        df: pandas DataFrame to validate
+        mode: "full", "fast" or "sample"
+        sample_rows: Rows checked in "sample" mode
+        random_state: Seed for the "sample" mode row sample
+
+    Returns:
+        The validated DataFrame with coerced types, as pandera returns it
+
+    Raises:
+        pandera.errors.SchemaErrors: When validation fails; the report is
+            the one ``schema.validate(df, lazy=True)`` raises in every mode
+    """
+    if mode == "full":
+        return schema.validate(df, lazy=True)
+    if mode == "sample":
+        if len(df) <= sample_rows:
+            return schema.validate(df, lazy=True)
+        return schema.validate(
+            df, sample=sample_rows, random_state=random_state, lazy=True
+        )
+    if mode != "fast":
+        msg = f"Unknown validation mode: {mode}"
+        raise ValueError(msg)
+
+    validated = _fast_validate(schema, df)
+    if validated is not None:
+        return validated
+    # Let pandera find (and report) whatever the fast path rejected
+    logger.debug("Fast validation rejected the frame; running pandera")
+    return schema.validate(df, lazy=True)
+
+
+def _fast_validate(
+    schema: DataFrameSchema,
+    df: pd.DataFrame,
+) -> pd.DataFrame | None:
+    """Return the coerced frame if every rule passes, else ``None``.
+
+    ``None`` also covers schema features this path does not model, so the
+    caller can always defer to pandera.
+    """
+
+    if not _supports_fast_path(schema) or df.columns.duplicated().any():
+        return None
+    if schema.strict and not set(df.columns) <= set(schema.columns):
+        return None
+
+    validated = df.copy()
+    for name, column in schema.columns.items():
+        if name not in validated.columns:
+            if column.required:
+                return None
+            continue
+        series = validated[name]
+        values = _to_arrow(series)
+        if not _dtype_matches(column, series, values):
+            if not (column.coerce or schema.coerce):
+                return None
+            try:
+                series = column.dtype.try_coerce(series)
+            except Exception:  # noqa: BLE001 - pandera reports it
+                return None
+            values = _to_arrow(series)
+            if not _dtype_matches(column, series, values):
+                return None
+            validated[name] = series
+        # A matching dtype makes pandera's own coercion an identity cast
+        if values is None or not _column_passes(column, series, values):
+            return None
+    return validated
+
+
+def _supports_fast_path(schema: DataFrameSchema) -> bool:
+    if (
+        schema.checks
+        or schema.parsers
+        or schema.unique
+        or schema.dtype is not None
+        or schema.index is not None
+        or schema.strict not in (True, False)
+        or schema.ordered
+        or schema.unique_column_names
+        or schema.add_missing_columns
+        or schema.drop_invalid_rows
+    ):
+        return False
+    return not any(
+        column.regex
+        or column.parsers
+        or column.default is not None
+        or column.drop_invalid_rows
+        for column in schema.columns.values()
+    )
+
+
+def _dtype_matches(
+    column: Column,
+    series: pd.Series,
+    values: pyarrow.Array | None,
+) -> bool:
+    if column.dtype is None:
+        return True
+    pandera_dtype = pandas_engine.Engine.dtype(series.dtype)
+    if isinstance(column.dtype, pandas_engine.NpString):
+        # pandera checks every object value is a str or missing, which is
+        # exactly when Arrow infers a string (or all-null) array
+        return (
+            column.dtype.check(pandera_dtype)
+            and values is not None
+            and values.type in (pyarrow.string(), pyarrow.null())
+        )
+    matches = column.dtype.check(pandera_dtype, series)
+    return bool(matches if isinstance(matches, bool) else matches.all())
+
+
+def _column_passes(
+    column: Column,
+    series: pd.Series,
+    values: pyarrow.Array,
+) -> bool:
+    if not column.nullable and values.null_count:
+        return False
+    # Same hashing (and NaN handling) as pandera's own uniqueness check
+    if column.unique and series.duplicated().any():
+        return False
+    present = pc.drop_null(values)
+    return all(
+        _check_passes(check, series, present) for check in column.checks
+    )
+
+
+def _check_passes(
+    check: Check,
+    series: pd.Series,
+    present: pyarrow.Array,
+) -> bool:
+    arrow_check = _ARROW_CHECKS.get(check.name)
+    if (
+        arrow_check is None
+        or not check.ignore_na
+        or check.element_wise
+        or check.groupby is not None
+    ):
+        return _generic_check_passes(check, series)
+    try:
+        result = arrow_check(present, check.statistics)
+    except (
+        pyarrow.ArrowInvalid,
+        pyarrow.ArrowNotImplementedError,
+        pyarrow.ArrowTypeError,
+    ):
+        return False
+    return bool(pc.all(result).as_py())
+
+
+def _generic_check_passes(check: Check, series: pd.Series) -> bool:
+    """Run a custom check pandera's way, still once over the column."""
+
+    DataFrameSchema.register_default_backends(pd.DataFrame)
+    try:
+        return bool(check(series).check_passed)
+    except Exception:  # noqa: BLE001 - pandera reports the check error
+        return False
+
+
+def _to_arrow(series: pd.Series) -> pyarrow.Array | None:
+    try:
+        return pyarrow.array(series, from_pandas=True)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        return None
+
+
+def _length_between(
+    lengths: pyarrow.Array,
+    min_value: int | None,
+    max_value: int | None,
+) -> pyarrow.Array:
+    within = pc.greater_equal(lengths, min_value or 0)
+    if max_value is not None:
+        within = pc.and_(within, pc.less_equal(lengths, max_value))
+    return within
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Time entity alias resolution against the per-alias regex scan it replaced."""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import random
+import re
+import statistics
+import time
+from collections.abc import Callable
+
+import pandas as pd
+
+from pipelines.build_lore_corpus import (
+    EntityAlias,
+    _alias_specificity,
+    _apply_entity_aliases,
+)
+
+
+def synthetic_aliases(count: int, *, seed: int = 0) -> list[EntityAlias]:
+    """Carian-speaker style aliases: exact ids plus trailing wildcards."""
+
+    rng = random.Random(seed)
+    aliases: list[EntityAlias] = []
+    for index in range(count):
+        speaker = rng.randrange(10_000, 99_999_999)
+        pattern = f"npc:carian_speaker_{speaker}"
+        if rng.random() < 0.4:
+            pattern = pattern[: rng.randint(20, len(pattern))] + "*"
+        aliases.append(
+            EntityAlias(
+                raw_pattern=pattern,
+                canonical_id=f"npc:speaker_{index % 250}",
+                confidence=0.9,
+                comment="",
+                pattern_regex=re.compile(fnmatch.translate(pattern)),
+            )
+        )
+    return aliases
+
+
+def synthetic_lore_frame(rows: int, *, seed: int = 0) -> pd.DataFrame:
+    """Dialogue rows keyed by raw speaker ids, a few repeated per speaker."""
+
+    rng = random.Random(seed)
+    speakers = [
+        f"npc:carian_speaker_{rng.randrange(10_000, 99_999_999)}"
+        for _ in range(max(rows // 4, 1))
+    ]
+    canonical_ids = [rng.choice(speakers) for _ in range(rows)]
+    return pd.DataFrame(
+        {"canonical_id": canonical_ids, "text_type": "dialogue"}
+    )
+
+
+def reference_apply(frame: pd.DataFrame, aliases: list[EntityAlias]) -> int:
+    """One ``str.match`` over the whole column per alias."""
+
+    frame["raw_canonical_id"] = frame["canonical_id"]
+    replacements = 0
+    for alias in sorted(aliases, key=_alias_specificity):
+        raw_mask = (
+            frame["raw_canonical_id"]
+            .astype(str)
+            .str.match(alias.pattern_regex)
+        )
+        target_mask = raw_mask & (
+            frame["canonical_id"] == frame["raw_canonical_id"]
+        )
+        if target_mask.any():
+            frame.loc[target_mask, "canonical_id"] = alias.canonical_id
+            replacements += int(target_mask.sum())
+    return replacements
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--aliases",
+        type=int,
+        default=10_000,
+        help="Synthetic aliases to resolve",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=100_000,
+        help="Lore rows in the synthetic frame",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Timed runs; the median is reported",
+    )
+    parser.add_argument(
+        "--skip-reference",
+        action="store_true",
+        help="Do not time (or compare against) the per-alias scan",
+    )
+    return parser.parse_args()
+
+
+def _time(
+    apply: Callable[[pd.DataFrame, list[EntityAlias]], int],
+    base: pd.DataFrame,
+    aliases: list[EntityAlias],
+    repeat: int,
+) -> tuple[float, pd.DataFrame, int]:
+    timings: list[float] = []
+    frame = base.copy()
+    replacements = 0
+    for _ in range(repeat):
+        frame = base.copy()
+        started = time.perf_counter()
+        replacements = apply(frame, aliases)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), frame, replacements
+
+
+def main() -> None:
+    args = parse_args()
+    aliases = synthetic_aliases(args.aliases)
+    base = synthetic_lore_frame(args.rows)
+
+    median, result, replacements = _time(
+        _apply_entity_aliases, base, aliases, args.repeat
+    )
+    print(
+        f"{len(aliases)} aliases x {len(base)} rows: median {median:.3f}s "
+        f"({replacements} replacements)"
+    )
+    if args.skip_reference:
+        return
+
+    reference_median, expected, expected_replacements = _time(
+        reference_apply, base, aliases, 1
+    )
+    identical = replacements == expected_replacements and result.equals(
+        expected
+    )
+    print(
+        f"per-alias scan: {reference_median:.3f}s "
+        f"({reference_median / median:.0f}x slower), "
+        f"identical output: {identical}"
+    )
+
+
+if __name__ == "__main__":
+    main()
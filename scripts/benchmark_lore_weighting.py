@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Time the weighted text-type concatenation on a scaled-up lore corpus."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from pipelines.build_lore_embeddings import (
+    DEFAULT_TEXT_TYPE_WEIGHTS,
+    _apply_weighted_concatenation,
+    _sanitize_lore_frame,
+)
+
+TEXT_TYPES = (*DEFAULT_TEXT_TYPE_WEIGHTS, "text", "location")
+WORDS = (
+    "erdtree grace rune tarnished golden order marika radagon ranni moon "
+    "frenzied flame crucible haligtree rot scarlet aeonia glintstone sorcery"
+).split()
+
+
+def synthetic_lore_frame(canonicals: int, *, seed: int = 0) -> pd.DataFrame:
+    """Lore rows shaped like the curated corpus: 1-6 rows per canonical."""
+
+    rng = random.Random(seed)
+    rows: list[dict[str, object]] = []
+    for index in range(canonicals):
+        canonical_id = f"item:{index:07d}"
+        category = rng.choice(("weapon", "armor", "spell", "npc", "boss"))
+        for part in range(rng.randint(1, 6)):
+            words = rng.choices(WORDS, k=rng.randint(5, 80))
+            rows.append(
+                {
+                    "lore_id": f"{canonical_id}:{part}",
+                    "canonical_id": canonical_id,
+                    "category": category,
+                    "text_type": rng.choice(TEXT_TYPES),
+                    "source": rng.choice(
+                        ("kaggle_base", "kaggle_dlc", "carian")
+                    ),
+                    "text": " ".join(words),
+                    "language": "en",
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def scale_frame(frame: pd.DataFrame, factor: int) -> pd.DataFrame:
+    """Repeat a lore frame ``factor`` times under distinct canonical ids."""
+
+    copies = [
+        frame.assign(
+            canonical_id=frame["canonical_id"].astype(str) + f"#{copy}",
+        )
+        for copy in range(factor)
+    ]
+    return pd.concat(copies, ignore_index=True)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--lore-path",
+        type=Path,
+        default=None,
+        help="Curated lore parquet to scale (default: synthetic corpus)",
+    )
+    parser.add_argument(
+        "--canonicals",
+        type=int,
+        default=5000,
+        help="Canonicals in the synthetic base corpus",
+    )
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=10,
+        help="How many copies of the base corpus to weight",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Timed runs; the median is reported",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    base = (
+        pd.read_parquet(args.lore_path)
+        if args.lore_path
+        else synthetic_lore_frame(args.canonicals)
+    )
+    frame = _sanitize_lore_frame(scale_frame(base, args.scale))
+    weights = dict(DEFAULT_TEXT_TYPE_WEIGHTS)
+
+    timings: list[float] = []
+    result = frame.head(0)
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        result = _apply_weighted_concatenation(frame, weights)
+        timings.append(time.perf_counter() - started)
+
+    median = statistics.median(timings)
+    print(
+        f"{len(frame)} rows -> {len(result)} canonicals: "
+        f"median {median:.3f}s over {args.repeat} runs "
+        f"({len(frame) / median:,.0f} rows/sec)"
+    )
+
+
+if __name__ == "__main__":
+    main()
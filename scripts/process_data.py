@@ -12,6 +12,7 @@ import sys
 from pathlib import Path
 
 from pipeline.process import DataProcessor
+from pipeline.schemas import VALIDATION_MODES
 
 
 def setup_logging(verbose: bool = False):
@@ -112,6 +113,17 @@ Examples:
         ),
     )
 
+    parser.add_argument(
+        "--validate",
+        choices=VALIDATION_MODES,
+        default="full",
+        help=(
+            "Schema validation mode: full (pandera on every row), fast "
+            "(vectorised rules, pandera only on failure) or sample "
+            "(checks on a random row sample) (default: full)"
+        ),
+    )
+
     args = parser.parse_args()
 
     # Setup logging
@@ -136,6 +148,7 @@ Examples:
     logger.info(f"Processed directory: {args.processed_dir}")
     logger.info(f"Force reprocess: {args.force}")
     logger.info(f"Dry run: {args.dry_run}")
+    logger.info(f"Validation: {args.validate}")
     logger.info(
         "Workers: %s",
         "auto" if args.workers == 0 else args.workers or "config",
@@ -148,6 +161,7 @@ Examples:
         raw_dir=args.raw_dir,
         processed_dir=args.processed_dir,
         cache_dir=args.cache_dir,
+        validation_mode=args.validate,
     )
 
     pending = processor.get_pending_datasets(force=args.force)
@@ -1,4 +1,6 @@
 -- Schema for Elden Ring corpus data
+-- Template rendered by PgVectorLoader (render_schema_sql); sql/010_schema.sql
+-- is its default rendering, run by the Postgres container on first start.
 
 CREATE SCHEMA IF NOT EXISTS elden;
 
@@ -13,8 +15,10 @@ CREATE TABLE IF NOT EXISTS elden.corpus_document (
 );
 
 -- Chunks/records: normalized rows with rich text for RAG
+-- Optionally list-partitioned by entity_type (see PgVectorLoader.create_schema);
+-- partitions are then created per entity type when data is loaded.
 CREATE TABLE IF NOT EXISTS elden.corpus_chunk (
-    id UUID PRIMARY KEY,
+    id UUID NOT NULL,
     document_id UUID REFERENCES elden.corpus_document(id) ON DELETE CASCADE,
     entity_type TEXT NOT NULL,         -- 'weapon','armor','boss','npc','item','incantation', etc.
     game_entity_id TEXT,               -- stable slug/key when available
@@ -24,9 +28,16 @@ CREATE TABLE IF NOT EXISTS elden.corpus_chunk (
     meta JSONB NOT NULL DEFAULT '{}',  -- stats, scaling, acquisition, etc.
     span_start INT,
     span_end INT,
-    embedding vector(1536)             -- optional; allow null initially
+    content_hash TEXT,                 -- CorpusChunk.compute_hash(); drives re-embedding
+    row_hash TEXT,                     -- content_hash + is_dlc + meta; drives updates
+    embedding vector(1536),  -- optional; allow null initially
+    PRIMARY KEY (id)
 );
 
+-- Columns added after the initial schema (kept idempotent for existing databases)
+ALTER TABLE elden.corpus_chunk ADD COLUMN IF NOT EXISTS content_hash TEXT;
+ALTER TABLE elden.corpus_chunk ADD COLUMN IF NOT EXISTS row_hash TEXT;
+
 -- Comments for documentation
 COMMENT ON TABLE elden.corpus_document IS 'Source documents/datasets for corpus';
 COMMENT ON TABLE elden.corpus_chunk IS 'Individual entity chunks for RAG';
@@ -49,7 +60,7 @@ CREATE TABLE IF NOT EXISTS elden.community_annotation (
     id UUID PRIMARY KEY,
     contributor_id UUID NOT NULL REFERENCES elden.community_contributor(id) ON DELETE RESTRICT,
     canonical_id TEXT NOT NULL,
-    chunk_id UUID REFERENCES elden.corpus_chunk(id) ON DELETE SET NULL,
+    chunk_id UUID REFERENCES elden.corpus_chunk(id) ON DELETE SET NULL,  -- FK only without partitioning (PK is then id alone)
     submission_channel TEXT NOT NULL CHECK (submission_channel IN ('manual','import','llm','curated')),
     status TEXT NOT NULL DEFAULT 'draft' CHECK (status IN ('draft','submitted','approved','rejected','archived')),
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
@@ -21,9 +21,6 @@ CREATE INDEX IF NOT EXISTS corpus_chunk_meta_gin_idx
 CREATE INDEX IF NOT EXISTS corpus_chunk_text_idx 
     ON elden.corpus_chunk USING GIN (to_tsvector('english', text));
 
--- HNSW index for vector similarity (only if embeddings present)
--- This will be created automatically, but explicit for documentation
-CREATE INDEX IF NOT EXISTS corpus_chunk_embedding_hnsw_idx 
-    ON elden.corpus_chunk 
-    USING hnsw (embedding vector_l2_ops)
-    WHERE embedding IS NOT NULL;
+-- HNSW index for vector similarity is built after bulk loads by
+-- PgVectorLoader.build_vector_index (see 030_vector_index.sql) so inserts do
+-- not pay incremental graph maintenance.
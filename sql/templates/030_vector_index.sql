@@ -0,0 +1,12 @@
+-- HNSW index for vector similarity, rebuilt after bulk loads.
+-- Placeholders are rendered by PgVectorLoader from Settings / CLI options.
+
+-- With a partitioned corpus_chunk this is rendered once per partition.
+
+DROP INDEX IF EXISTS elden.${index_name};
+
+CREATE INDEX ${index_name}
+    ON elden.${table_name}
+    USING hnsw (embedding ${operator_class})
+    WITH (m = ${m}, ef_construction = ${ef_construction})
+    WHERE embedding IS NOT NULL;
@@ -64,6 +64,15 @@ def analysis() -> None:
     type=click.Choice(["local", "openai"]),
     default=None,
 )
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help=(
+        "Processes for local embedding (0 = one per CPU core; "
+        "defaults to a single process)."
+    ),
+)
 @click.option("--max-rows", type=int, default=None)
 @click.option("--min-cluster", type=int, default=None)
 @click.option("--min-samples", type=int, default=None)
@@ -79,6 +88,7 @@ def clusters(
     output_dir: Path | None,
     model: str | None,
     provider: str | None,
+    workers: int | None,
     max_rows: int | None,
     min_cluster: int | None,
     min_samples: int | None,
@@ -105,6 +115,9 @@ def clusters(
         output_dir=output_dir or defaults.output_dir,
         embedding_model=model or defaults.embedding_model,
         embedding_provider=provider_value,
+        embedding_workers=(
+            defaults.embedding_workers if workers is None else workers
+        ),
         max_rows=max_rows or defaults.max_rows,
         min_cluster_size=min_cluster or defaults.min_cluster_size,
         min_samples=min_samples or defaults.min_samples,
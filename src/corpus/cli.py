@@ -1,5 +1,6 @@
 """Command-line interface for corpus management."""
 
+import json
 import sys
 from pathlib import Path
 from typing import Literal, cast
@@ -20,7 +21,11 @@ from corpus.ingest_carian_fmg import fetch_carian_fmg_files
 from corpus.ingest_github_json import fetch_github_api_data
 from corpus.ingest_impalers import fetch_impalers_data
 from corpus.ingest_kaggle import fetch_kaggle_data
-from corpus.pgvector_loader import load_to_postgres
+from corpus.pgvector_loader import (
+    HNSWIndexConfig,
+    PgVectorLoader,
+    load_to_postgres,
+)
 from corpus.reconcile import reconcile_all_sources
 
 
@@ -280,11 +285,60 @@ def curate(
     default="none",
     help="Generate embeddings",
 )
+@click.option(
+    "--build-index/--no-build-index",
+    default=True,
+    help="Rebuild the HNSW vector index after the bulk load",
+)
+@click.option(
+    "--distance",
+    type=click.Choice(["cosine", "ip", "l2"]),
+    default=None,
+    help="Vector distance / HNSW operator class (default from env)",
+)
+@click.option(
+    "--hnsw-m",
+    type=int,
+    default=None,
+    help="HNSW graph degree m (default from env)",
+)
+@click.option(
+    "--hnsw-ef-construction",
+    type=int,
+    default=None,
+    help="HNSW ef_construction (default from env)",
+)
+@click.option(
+    "--maintenance-work-mem",
+    default=None,
+    help="maintenance_work_mem used for the index build, e.g. '1GB'",
+)
+@click.option(
+    "--partitioned/--no-partitioned",
+    default=None,
+    help=(
+        "Partition corpus_chunk by entity type when creating the schema "
+        "(default: keep the existing layout, unpartitioned for a new table)"
+    ),
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Load entity-type partitions concurrently over N connections",
+)
 def load(
     dsn: str | None,
     parquet: str | None,
     create_schema: bool,
     embed: str,  # Type narrowed by click.Choice validation
+    build_index: bool,
+    distance: str | None,
+    hnsw_m: int | None,
+    hnsw_ef_construction: int | None,
+    maintenance_work_mem: str | None,
+    partitioned: bool | None,
+    workers: int,
 ) -> None:
     """Load curated data into PostgreSQL."""
     try:
@@ -309,22 +363,150 @@ def load(
                 embed,
             )
 
-        load_to_postgres(
+        index_config = HNSWIndexConfig(
+            m=hnsw_m or settings.pgvector_hnsw_m,
+            ef_construction=(
+                hnsw_ef_construction or settings.pgvector_hnsw_ef_construction
+            ),
+            distance=cast(
+                Literal["cosine", "ip", "l2"],
+                distance or settings.pgvector_distance,
+            ),
+            maintenance_work_mem=(
+                maintenance_work_mem or settings.pgvector_maintenance_work_mem
+            ),
+        )
+
+        report = load_to_postgres(
             dsn=dsn,
             parquet_path=parquet_path,
             create=create_schema,
             embed=(embed != "none"),
+            index_config=index_config,
+            build_index=build_index,
+            partitioned=partitioned,
+            workers=workers,
         )
 
         if embed != "none":
             settings.embed_provider = original_provider
 
         click.echo("✓ Data loaded successfully")
+        click.echo(f"  Inserted: {report.inserted}")
+        click.echo(f"  Updated: {report.updated}")
+        click.echo(f"  Deleted: {report.deleted}")
+        click.echo(f"  Unchanged: {report.unchanged}")
+        click.echo(f"  Embedded: {report.embedded}")
 
     except Exception as e:
         click.echo(f"Error during load: {e}", err=True)
         sys.exit(1)
 
 
+def _parse_meta_filters(values: tuple[str, ...]) -> dict[str, object]:
+    """Parse repeated ``key=value`` options into a JSONB containment filter."""
+    meta: dict[str, object] = {}
+    for raw in values:
+        key, sep, value = raw.partition("=")
+        if not sep or not key.strip():
+            raise click.BadParameter(
+                f"Expected key=value, got '{raw}'", param_hint="--meta"
+            )
+        try:
+            meta[key.strip()] = json.loads(value)
+        except json.JSONDecodeError:
+            meta[key.strip()] = value
+    return meta
+
+
+@main.command()
+@click.argument("query")
+@click.option(
+    "--dsn",
+    default=None,
+    help="PostgreSQL DSN (default from env)",
+)
+@click.option("--limit", default=10, show_default=True, help="Result count")
+@click.option("--entity-type", default=None, help="Filter by entity type")
+@click.option(
+    "--dlc/--base",
+    "is_dlc",
+    default=None,
+    help="Only DLC (--dlc) or only base game (--base) entities",
+)
+@click.option(
+    "--meta",
+    "meta_filters",
+    multiple=True,
+    help=(
+        "JSONB metadata filter as key=value (value parsed as JSON when "
+        "possible). Repeatable."
+    ),
+)
+@click.option(
+    "--candidate-pool",
+    default=50,
+    show_default=True,
+    help="Candidates taken from each ranking before fusion",
+)
+@click.option(
+    "--rrf-k",
+    default=60,
+    show_default=True,
+    help="Reciprocal rank fusion constant",
+)
+@click.option(
+    "--ef-search",
+    type=int,
+    default=None,
+    help="hnsw.ef_search for this query (default from env)",
+)
+def search(
+    query: str,
+    dsn: str | None,
+    limit: int,
+    entity_type: str | None,
+    is_dlc: bool | None,
+    meta_filters: tuple[str, ...],
+    candidate_pool: int,
+    rrf_k: int,
+    ef_search: int | None,
+) -> None:
+    """Hybrid full-text + vector search over the loaded corpus."""
+    try:
+        meta = _parse_meta_filters(meta_filters)
+        loader = PgVectorLoader(dsn or settings.postgres_dsn)
+        results = loader.hybrid_search(
+            query,
+            limit=limit,
+            entity_type=entity_type,
+            is_dlc=is_dlc,
+            meta=meta or None,
+            candidate_pool=candidate_pool,
+            rrf_k=rrf_k,
+            ef_search=ef_search,
+        )
+    except click.BadParameter:
+        raise
+    except Exception as e:
+        click.echo(f"Error during search: {e}", err=True)
+        sys.exit(1)
+
+    if not results:
+        click.echo("No matches found")
+        return
+
+    for idx, row in enumerate(results, start=1):
+        dlc_label = " [DLC]" if row["is_dlc"] else ""
+        vector_rank = row["vector_rank"] or "-"
+        text_rank = row["text_rank"] or "-"
+        click.echo(
+            f"{idx}. [{float(cast(float, row['score'])):.4f} "
+            f"vec={vector_rank} fts={text_rank}] "
+            f"{row['entity_type']} | {row['name']}{dlc_label}"
+        )
+        click.echo(f"    {row['text']}")
+
+
 if __name__ == "__main__":
     main()
@@ -40,6 +40,34 @@ class Settings(BaseSettings):
         description="Embedding model name",
     )
 
+    # pgvector HNSW index configuration
+    pgvector_distance: Literal["cosine", "ip", "l2"] = Field(
+        default="cosine",
+        description=(
+            "Distance metric for the HNSW index and similarity queries "
+            "(cosine matches the normalised inner product FAISS path)"
+        ),
+    )
+    pgvector_hnsw_m: int = Field(
+        default=16,
+        description="HNSW graph degree (m) used when building the index",
+    )
+    pgvector_hnsw_ef_construction: int = Field(
+        default=64,
+        description="HNSW candidate list size used while building the index",
+    )
+    pgvector_maintenance_work_mem: str = Field(
+        default="512MB",
+        description="maintenance_work_mem applied while building the index",
+    )
+    pgvector_ef_search: int | None = Field(
+        default=None,
+        description=(
+            "Default hnsw.ef_search for similarity queries (None keeps the "
+            "server default)"
+        ),
+    )
+
     # Reranker configuration
     reranker_name: str = Field(
         default="identity",
@@ -53,6 +81,14 @@ class Settings(BaseSettings):
         default=16,
         description="Batch size used when scoring reranker candidates",
     )
+    reranker_precision: Literal["float32", "float16", "bfloat16"] = Field(
+        default="float32",
+        description=(
+            "Weight precision for the cross-encoder reranker (kept separate "
+            "from EMBED_LOCAL_PRECISION so reduced-precision embeddings do "
+            "not change reranking scores)"
+        ),
+    )
     reranker_candidate_pool: int = Field(
         default=50,
         description=(
@@ -63,6 +99,29 @@ class Settings(BaseSettings):
 
     # OpenAI API key (when using openai provider)
     openai_api_key: str = Field(default="", description="OpenAI API key")
+    openai_base_url: str = Field(
+        default="https://api.openai.com/v1",
+        description="Base URL for the OpenAI-compatible embeddings endpoint",
+    )
+    openai_max_concurrency: int = Field(
+        default=1,
+        description=(
+            "Concurrent embedding requests for lore embeddings (values above "
+            "1 enable the rate-limited concurrent encoder)"
+        ),
+    )
+    openai_requests_per_minute: int | None = Field(
+        default=None,
+        description="Client-side requests/min limit for embedding requests",
+    )
+    openai_tokens_per_minute: int | None = Field(
+        default=None,
+        description="Client-side tokens/min limit for embedding requests",
+    )
+    openai_max_retries: int = Field(
+        default=6,
+        description="Retries for 429/5xx embedding responses",
+    )
 
     # Data paths
     data_dir: Path = Field(
@@ -106,6 +165,38 @@ class Settings(BaseSettings):
         default=128,
         description="Batch size for embedding generation",
     )
+    embed_local_workers: int = Field(
+        default=1,
+        description=(
+            "Processes for local sentence-transformers embedding "
+            "(0 = one per CPU core)"
+        ),
+    )
+    embed_local_device: str | None = Field(
+        default=None,
+        description=(
+            "Torch device for local sentence-transformers models "
+            "(None lets the library choose)"
+        ),
+    )
+    embed_local_precision: Literal["float32", "float16", "bfloat16"] = Field(
+        default="float32",
+        description="Weight precision for local sentence-transformers models",
+    )
+    embed_local_exact_tokens: bool = Field(
+        default=False,
+        description=(
+            "Size local batches with the model tokenizer instead of the "
+            "character estimate (tokenizes every input twice)"
+        ),
+    )
+    embed_max_batch_tokens: int | None = Field(
+        default=100_000,
+        description=(
+            "Estimated-token budget per embedding request "
+            "(None or 0 disables it)"
+        ),
+    )
 
     def __init__(self, **kwargs: object) -> None:
         super().__init__(**kwargs)  # type: ignore[arg-type]
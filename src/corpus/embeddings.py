@@ -1,12 +1,20 @@
 """Embedding generation for corpus chunks."""
 
-import json
+from collections.abc import Sequence
+from pathlib import Path
 from typing import Literal
 
+import numpy as np
 import polars as pl
+import pyarrow as pa
 from tqdm import tqdm
 
 from corpus.config import settings
+from corpus.model_registry import get_sentence_transformer
+
+# Embeddings are stored as float32 lists of a fixed width. Polars' Array dtype
+# would encode the width too, but polars 0.19 cannot write it to parquet.
+EMBEDDING_DTYPE = pl.List(pl.Float32)
 
 
 def generate_embeddings(
@@ -70,30 +78,19 @@ def _generate_openai_embeddings(
         batch_embeddings = [item.embedding for item in response.data]
         embeddings.extend(batch_embeddings)
 
-    # Add embeddings as JSON strings for Polars
-    df = df.with_columns(
-        pl.Series(
-            "embedding",
-            [json.dumps(emb) for emb in embeddings],
-        )
-    )
-
-    return df
+    return df.with_columns(embeddings_to_series(embeddings))
 
 
 def _generate_local_embeddings(
     df: pl.DataFrame, model: str, batch_size: int
 ) -> pl.DataFrame:
     """Generate embeddings using local sentence-transformers."""
-    try:
-        from sentence_transformers import SentenceTransformer
-    except ImportError as err:
-        raise ImportError(
-            "sentence-transformers not installed. Install with: poetry add sentence-transformers"
-        ) from err
-
     print(f"Loading local embedding model: {model}...")
-    encoder = SentenceTransformer(model)
+    encoder = get_sentence_transformer(
+        model,
+        device=settings.embed_local_device,
+        precision=settings.embed_local_precision,
+    )
 
     texts = df.select("description").to_series().to_list()
 
@@ -105,15 +102,166 @@ def _generate_local_embeddings(
         convert_to_numpy=True,
     )
 
-    # Convert to list of lists
-    embedding_lists = embeddings.tolist()
+    return df.with_columns(embeddings_to_series(embeddings))
+
+
+def embeddings_to_series(
+    vectors: np.ndarray | Sequence[Sequence[float]],
+    name: str = "embedding",
+) -> pl.Series:
+    """
+    Build a float32 list column from a batch of vectors.
+
+    Args:
+        vectors: 2D array (or equal-length sequences) of embeddings
+        name: Column name
 
-    # Add embeddings as JSON strings
-    df = df.with_columns(
-        pl.Series(
-            "embedding",
-            [json.dumps(emb) for emb in embedding_lists],
+    Returns:
+        Series of dtype :data:`EMBEDDING_DTYPE`
+    """
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim != 2:
+        if matrix.size:
+            raise ValueError("Embeddings must be a 2D batch of vectors")
+        matrix = matrix.reshape(0, 0)
+    rows, width = matrix.shape
+    offsets = pa.array(np.arange(rows + 1, dtype=np.int32) * width)
+    values = pa.array(np.ascontiguousarray(matrix).reshape(-1))
+    return pl.Series(name, pa.ListArray.from_arrays(offsets, values))
+
+
+def normalize_embedding_column(
+    df: pl.DataFrame, column: str = "embedding"
+) -> pl.DataFrame:
+    """
+    Coerce an embedding column to :data:`EMBEDDING_DTYPE`.
+
+    Parquet files written before embeddings were stored in binary form hold
+    JSON strings; those are decoded once here so downstream code only deals
+    with float32 lists.
+
+    Args:
+        df: DataFrame that may contain ``column``
+        column: Embedding column name
+
+    Returns:
+        DataFrame with the column converted (unchanged if absent)
+    """
+    if column not in df.columns:
+        return df
+    dtype = df.schema[column]
+    if dtype == EMBEDDING_DTYPE:
+        return df
+    if dtype == pl.Utf8:
+        # Empty strings were written for rows without an embedding
+        expr = (
+            pl.when(pl.col(column).str.len_bytes() > 0)
+            .then(pl.col(column))
+            .otherwise(None)
+            .str.json_decode(pl.List(pl.Float64))
         )
-    )
+    else:
+        expr = pl.col(column)
+    return df.with_columns(expr.cast(EMBEDDING_DTYPE).alias(column))
+
+
+def read_embeddings_parquet(
+    path: str | Path, column: str = "embedding"
+) -> pl.DataFrame:
+    """
+    Read a parquet file with embeddings in either storage format.
 
-    return df
+    Args:
+        path: Parquet path
+        column: Embedding column name
+
+    Returns:
+        DataFrame whose embedding column is :data:`EMBEDDING_DTYPE`
+    """
+    return normalize_embedding_column(pl.read_parquet(path), column)
+
+
+def embedding_matrix(series: pl.Series) -> np.ndarray:
+    """
+    View a float32 list column as a ``(rows, dimension)`` matrix.
+
+    Args:
+        series: Embedding column without nulls
+
+    Returns:
+        float32 matrix sharing the column's buffer where possible
+    """
+    if series.null_count():
+        raise ValueError("Embedding column contains missing vectors")
+    if series.dtype == pl.Utf8:
+        series = normalize_embedding_column(series.to_frame()).to_series()
+    lengths = series.list.len().unique()
+    if len(lengths) > 1:
+        raise ValueError("Embedding column has vectors of different sizes")
+    width = int(lengths[0]) if len(lengths) else 0
+    values = series.cast(EMBEDDING_DTYPE).to_arrow().flatten()
+    matrix = values.to_numpy(zero_copy_only=False)
+    return matrix.reshape(len(series), width)
+
+
+def fixed_size_embedding_array(
+    vectors: np.ndarray | Sequence[Sequence[float]],
+) -> pa.FixedSizeListArray:
+    """
+    Build an Arrow ``fixed_size_list<float32>[dimension]`` array.
+
+    Unlike :func:`embeddings_to_series`, the width is part of the type, so
+    readers can view the values buffer as a matrix without checking offsets.
+
+    Args:
+        vectors: 2D array (or equal-length sequences) of embeddings
+
+    Returns:
+        Arrow array with one fixed-size list per vector
+    """
+    matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+    if matrix.ndim != 2:
+        raise ValueError("Embeddings must be a 2D batch of vectors")
+    values = pa.array(matrix.reshape(-1), type=pa.float32())
+    return pa.FixedSizeListArray.from_arrays(values, matrix.shape[1])
+
+
+def arrow_embedding_matrix(column: pa.Array | pa.ChunkedArray) -> np.ndarray:
+    """
+    View an Arrow embedding column as a ``(rows, dimension)`` matrix.
+
+    Single-chunk float32 fixed-size or uniform-width list columns are
+    returned zero-copy (as a read-only view of the Arrow buffer); other
+    layouts are converted once.
+
+    Args:
+        column: Fixed-size or variable-size list column without nulls
+
+    Returns:
+        float32 matrix
+    """
+    if isinstance(column, pa.ChunkedArray):
+        column = (
+            column.chunk(0)
+            if column.num_chunks == 1
+            else column.combine_chunks()
+        )
+    if column.null_count:
+        raise ValueError("Embedding column contains missing vectors")
+    if pa.types.is_fixed_size_list(column.type):
+        width = column.type.list_size
+    elif pa.types.is_list(column.type) or pa.types.is_large_list(column.type):
+        offsets = column.offsets.to_numpy()
+        widths = np.unique(np.diff(offsets))
+        if len(widths) > 1:
+            raise ValueError("Embedding column has vectors of different sizes")
+        width = int(widths[0]) if len(widths) else 0
+    else:
+        raise ValueError(f"Unsupported embedding column type: {column.type}")
+    values = column.flatten()
+    if values.null_count:
+        raise ValueError("Embedding column contains missing values")
+    matrix = values.to_numpy(zero_copy_only=False)
+    if matrix.dtype != np.float32:
+        matrix = matrix.astype(np.float32)
+    return matrix.reshape(len(column), width)
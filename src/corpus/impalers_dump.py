@@ -0,0 +1,597 @@
+"""Single-pass parser and parquet cache for the Impalers ``Master.html``.
+
+One streaming pass yields both what the lore build reads (h2/h3/p
+entries) and what the ingester reads (table rows, definition lists and
+h4-h6 headings with the paragraphs that follow them).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from corpus.utils import compute_file_hash
+
+LOGGER = logging.getLogger(__name__)
+
+# Bump when the entry rules change so stale caches are re-parsed
+PARSER_VERSION = "2"
+SOURCE_HASH_KEY = b"impalers_source_sha256"
+PARSER_VERSION_KEY = b"impalers_parser_version"
+READ_CHUNK_CHARS = 1 << 20
+
+ENTRY_KIND = "entry"
+TABLE_ROW_KIND = "table_row"
+DEFINITION_LIST_KIND = "definition_list"
+HEADING_KIND = "heading"
+
+# Entries and blocks share one table, told apart by ``kind``
+ENTRY_SCHEMA = pa.schema(
+    [
+        pa.field("kind", pa.string()),
+        pa.field("section", pa.string()),
+        pa.field("name", pa.string()),
+        pa.field("entry_id", pa.string()),
+        pa.field("terms", pa.list_(pa.string())),
+        pa.field("paragraphs", pa.list_(pa.string())),
+    ]
+)
+
+_ENTRY_TAGS = frozenset({"h2", "h3", "p"})
+_SECTION_TAGS = frozenset({"h1", "h2", "h3"})
+_MINOR_HEADING_TAGS = frozenset({"h4", "h5", "h6"})
+_HEADING_TAGS = _SECTION_TAGS | _MINOR_HEADING_TAGS
+_CELL_TAGS = frozenset({"td", "th"})
+_DEFINITION_TAGS = frozenset({"dt", "dd"})
+# Text inside these never reaches get_text() in BeautifulSoup either
+_HIDDEN_TEXT_TAGS = frozenset({"script", "style", "template"})
+_VOID_TAGS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+__all__ = [
+    "ENTRY_SCHEMA",
+    "ImpalersDump",
+    "cache_path_for",
+    "load_impalers_dump",
+    "load_impalers_entries",
+    "parse_impalers_html",
+]
+
+
+@dataclass(slots=True)
+class ImpalersDump:
+    """Parsed contents of ``Master.html``.
+
+    ``entries`` are ``{section, name, entry_id, paragraphs}`` dicts in
+    document order. ``blocks`` are ``{kind, section, name, terms,
+    paragraphs}`` dicts: every table row after a table's first (first two
+    cells as ``name`` and ``paragraphs``), every definition list (``terms``
+    and definitions) and every h4-h6 heading (the ``<p>`` siblings that
+    follow it up to the next heading), grouped in that order. Their section
+    is the last non-empty h1-h3 of the document. Element text matches
+    BeautifulSoup's ``get_text(strip=True)``.
+    """
+
+    entries: list[dict[str, Any]] = field(default_factory=list)
+    blocks: list[dict[str, Any]] = field(default_factory=list)
+
+
+def cache_path_for(html_path: Path) -> Path:
+    """Default parquet cache next to the HTML dump."""
+
+    return html_path.with_name(f"{html_path.stem}.entries.parquet")
+
+
+def load_impalers_dump(
+    html_path: Path,
+    *,
+    cache_path: Path | None = None,
+    sha256: str | None = None,
+) -> ImpalersDump:
+    """
+    Return the parsed dump, parsing the HTML only when the cache is stale.
+
+    The cache records the sha256 of the HTML it was built from and is
+    rebuilt whenever the file (or the parser version) changes.
+
+    Args:
+        html_path: Path to Master.html
+        cache_path: Parquet cache (default: ``Master.entries.parquet``)
+        sha256: Precomputed hash of ``html_path``, if the caller has one
+
+    Returns:
+        Parsed entries and blocks
+    """
+    cache_path = cache_path or cache_path_for(html_path)
+    digest = sha256 or compute_file_hash(html_path)
+
+    cached = _read_cache(cache_path, digest)
+    if cached is not None:
+        LOGGER.info(
+            "Loaded %s Impalers entries from cache %s",
+            len(cached.entries),
+            cache_path,
+        )
+        return cached
+
+    dump = parse_impalers_html(html_path)
+    _write_cache(cache_path, dump, digest)
+    return dump
+
+
+def load_impalers_entries(
+    html_path: Path,
+    *,
+    cache_path: Path | None = None,
+    sha256: str | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Return the dump's entries, parsing the HTML only when the cache is stale.
+
+    Args:
+        html_path: Path to Master.html
+        cache_path: Parquet cache (default: ``Master.entries.parquet``)
+        sha256: Precomputed hash of ``html_path``, if the caller has one
+
+    Returns:
+        ``{section, name, entry_id, paragraphs}`` entries with at least one
+        paragraph each, in document order
+    """
+    return load_impalers_dump(
+        html_path, cache_path=cache_path, sha256=sha256
+    ).entries
+
+
+def parse_impalers_html(html_path: Path) -> ImpalersDump:
+    """
+    Stream ``html_path`` through an event parser and collect its contents.
+
+    ``<h2>`` opens a section (the FMG file name), ``<h3>Name [id]</h3>``
+    opens an entry and the following ``<p>`` elements are its paragraphs.
+    Sections that list names as ``<p>[id] Name</p>`` start an entry from
+    that paragraph instead; an entry still open when the next ``<h2>``
+    starts is dropped. Entry text matches BeautifulSoup's
+    ``get_text(" ", strip=True)`` (``get_text(strip=True)`` for sections).
+
+    Args:
+        html_path: Path to Master.html
+
+    Returns:
+        Entries with at least one paragraph, in document order, and blocks
+    """
+    builder = _EntryBuilder()
+    collector = _BlockCollector()
+    parser = _DumpParser(builder, collector)
+    with html_path.open(encoding="utf-8") as handle:
+        for chunk in iter(lambda: handle.read(READ_CHUNK_CHARS), ""):
+            parser.feed(chunk)
+    parser.close()
+    dump = ImpalersDump(builder.finish(), collector.finish())
+    LOGGER.info(
+        "Parsed %s Impalers entries from %s", len(dump.entries), html_path
+    )
+    return dump
+
+
+def _read_cache(cache_path: Path, digest: str) -> ImpalersDump | None:
+    if not cache_path.exists():
+        return None
+    try:
+        table = pq.read_table(cache_path)
+    except (OSError, pa.ArrowInvalid) as err:
+        LOGGER.warning("Ignoring unreadable cache %s: %s", cache_path, err)
+        return None
+    metadata = table.schema.metadata or {}
+    if (
+        metadata.get(SOURCE_HASH_KEY) != digest.encode()
+        or metadata.get(PARSER_VERSION_KEY) != PARSER_VERSION.encode()
+    ):
+        return None
+    dump = ImpalersDump()
+    for row in table.to_pylist():
+        if row["kind"] == ENTRY_KIND:
+            del row["kind"], row["terms"]
+            dump.entries.append(row)
+        else:
+            del row["entry_id"]
+            dump.blocks.append(row)
+    return dump
+
+
+def _write_cache(
+    cache_path: Path,
+    dump: ImpalersDump,
+    digest: str,
+) -> None:
+    schema = ENTRY_SCHEMA.with_metadata(
+        {
+            SOURCE_HASH_KEY: digest.encode(),
+            PARSER_VERSION_KEY: PARSER_VERSION.encode(),
+        }
+    )
+    rows = [
+        {"kind": ENTRY_KIND, "terms": None, **entry} for entry in dump.entries
+    ]
+    rows.extend({"entry_id": None, **block} for block in dump.blocks)
+    table = pa.Table.from_pylist(rows, schema=schema)
+    staging = cache_path.with_name(f"{cache_path.name}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table, staging)
+        os.replace(staging, cache_path)
+    except OSError as err:
+        LOGGER.warning(
+            "Could not write Impalers cache %s: %s", cache_path, err
+        )
+
+
+@dataclass(slots=True, eq=False)
+class _Element:
+    """A captured element; its text is final once closed."""
+
+    tag: str
+    strings: list[str] = field(default_factory=list)
+    closed: bool = False
+
+    def text(self) -> str:
+        # BeautifulSoup joins section headings without a separator
+        separator = "" if self.tag == "h2" else " "
+        return separator.join(self.strings)
+
+    def stripped_text(self) -> str:
+        """Text as ``get_text(strip=True)`` returns it."""
+
+        return "".join(self.strings)
+
+
+@dataclass(slots=True)
+class _TableRow:
+    # The first two td/th descendants; only rows with two are kept
+    cells: list[_Element] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _Table:
+    # Every tr descendant after the first
+    rows: list[_TableRow] = field(default_factory=list)
+    seen_rows: int = 0
+
+
+@dataclass(slots=True)
+class _DefinitionList:
+    terms: list[_Element] = field(default_factory=list)
+    definitions: list[_Element] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _MinorHeading:
+    element: _Element
+    paragraphs: list[_Element] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _Frame:
+    """An open element on the parser stack."""
+
+    tag: str
+    position: int = 0
+    element: _Element | None = None
+    table: _Table | None = None
+    row: _TableRow | None = None
+    definitions: _DefinitionList | None = None
+    # h4-h6 child still collecting the <p> siblings that follow it
+    heading: _MinorHeading | None = None
+
+
+@dataclass(slots=True)
+class _EntryBuilder:
+    """Turn h2/h3/p elements, in document order, into entries."""
+
+    entries: list[dict[str, Any]] = field(default_factory=list)
+    section: str | None = None
+    current: dict[str, Any] | None = None
+
+    def add(self, element: _Element) -> None:
+        text = element.text()
+        if element.tag == "h2":
+            # The lore build never kept the entry a new section cuts off
+            self.current = None
+            self.section = text
+            return
+        if element.tag == "h3":
+            self._flush()
+            self._start(*_parse_heading(text))
+            return
+        if not text:
+            return
+        if self.current is None:
+            # Some sections emit names via <p>[123] Name
+            parsed = _parse_name_from_paragraph(text)
+            if parsed:
+                self._start(*parsed)
+            return
+        self.current["paragraphs"].append(text)
+
+    def finish(self) -> list[dict[str, Any]]:
+        self._flush()
+        return self.entries
+
+    def _start(self, name: str, entry_id: str | None) -> None:
+        self.current = {
+            "section": self.section,
+            "name": name,
+            "entry_id": entry_id,
+            "paragraphs": [],
+        }
+
+    def _flush(self) -> None:
+        if self.current and self.current["paragraphs"]:
+            self.entries.append(self.current)
+        self.current = None
+
+
+class _BlockCollector:
+    """Collect the table, definition-list and h4-h6 blocks of the dump.
+
+    Each block mirrors one of BeautifulSoup's recursive lookups
+    (``find_all`` over descendants, ``find_next_siblings`` for headings),
+    worked out from the open-element stack as tags start, so no tree is
+    kept and no sibling list is walked more than once.
+    """
+
+    def __init__(self) -> None:
+        self._tables: list[_Table] = []
+        self._lists: list[_DefinitionList] = []
+        self._headings: list[_MinorHeading] = []
+        self._section: str | None = None
+        self._section_position = -1
+
+    def start(
+        self, frame: _Frame, parent: _Frame, stack: list[_Frame]
+    ) -> None:
+        """Register a starting element; ``stack`` holds its ancestors."""
+
+        tag = frame.tag
+        if tag in _HEADING_TAGS:
+            # Any heading ends the sibling run of the previous one
+            parent.heading = None
+            if tag in _MINOR_HEADING_TAGS:
+                heading = _MinorHeading(_capture(frame))
+                self._headings.append(heading)
+                parent.heading = heading
+            else:
+                _capture(frame)
+        elif tag == "p":
+            if parent.heading is not None:
+                parent.heading.paragraphs.append(_capture(frame))
+        elif tag == "table":
+            frame.table = _Table()
+            self._tables.append(frame.table)
+        elif tag == "tr":
+            frame.row = _TableRow()
+            for ancestor in stack:
+                if ancestor.table is not None:
+                    ancestor.table.seen_rows += 1
+                    if ancestor.table.seen_rows > 1:
+                        ancestor.table.rows.append(frame.row)
+        elif tag in _CELL_TAGS:
+            for ancestor in stack:
+                if ancestor.row is not None and len(ancestor.row.cells) < 2:
+                    ancestor.row.cells.append(_capture(frame))
+        elif tag == "dl":
+            frame.definitions = _DefinitionList()
+            self._lists.append(frame.definitions)
+        elif tag in _DEFINITION_TAGS:
+            for ancestor in stack:
+                if ancestor.definitions is not None:
+                    target = (
+                        ancestor.definitions.terms
+                        if tag == "dt"
+                        else ancestor.definitions.definitions
+                    )
+                    target.append(_capture(frame))
+
+    def close(self, frame: _Frame) -> None:
+        if frame.tag not in _SECTION_TAGS or frame.element is None:
+            return
+        text = frame.element.stripped_text()
+        # The section is the last non-empty h1-h3 in document order
+        if text and frame.position > self._section_position:
+            self._section = text
+            self._section_position = frame.position
+
+    def finish(self) -> list[dict[str, Any]]:
+        section = self._section or "Unknown"
+        blocks: list[dict[str, Any]] = []
+        for table in self._tables:
+            for row in table.rows:
+                if len(row.cells) < 2:
+                    continue
+                blocks.append(
+                    {
+                        "kind": TABLE_ROW_KIND,
+                        "section": section,
+                        "name": row.cells[0].stripped_text(),
+                        "terms": None,
+                        "paragraphs": [row.cells[1].stripped_text()],
+                    }
+                )
+        for definitions in self._lists:
+            if not definitions.terms and not definitions.definitions:
+                continue
+            blocks.append(
+                {
+                    "kind": DEFINITION_LIST_KIND,
+                    "section": section,
+                    "name": None,
+                    "terms": [
+                        term.stripped_text() for term in definitions.terms
+                    ],
+                    "paragraphs": [
+                        definition.stripped_text()
+                        for definition in definitions.definitions
+                    ],
+                }
+            )
+        for heading in self._headings:
+            blocks.append(
+                {
+                    "kind": HEADING_KIND,
+                    "section": section,
+                    "name": heading.element.stripped_text(),
+                    "terms": None,
+                    "paragraphs": [
+                        paragraph.stripped_text()
+                        for paragraph in heading.paragraphs
+                    ],
+                }
+            )
+        return blocks
+
+
+class _DumpParser(HTMLParser):
+    """Event parser that mirrors BeautifulSoup's html.parser tree.
+
+    Open tags are tracked on a stack so an end tag closes everything opened
+    after its match, exactly like BeautifulSoup. Captured h2/h3/p elements
+    are handed to the builder in start-tag order as soon as they and every
+    element started before them are closed, so memory stays bounded by
+    nesting (plus the blocks, which the dump barely has).
+    """
+
+    def __init__(
+        self, builder: _EntryBuilder, collector: _BlockCollector
+    ) -> None:
+        super().__init__(convert_charrefs=True)
+        self._builder = builder
+        self._collector = collector
+        self._root = _Frame("[document]")
+        self._stack: list[_Frame] = []
+        self._open: list[_Element] = []
+        self._pending: deque[_Element] = deque()
+        self._data: list[str] = []
+        self._hidden = 0
+        self._started = 0
+
+    def handle_starttag(
+        self, tag: str, attrs: list[tuple[str, str | None]]
+    ) -> None:
+        self._end_data()
+        if tag in _VOID_TAGS:
+            return
+        frame = _Frame(tag, position=self._started)
+        self._started += 1
+        if tag in _ENTRY_TAGS:
+            frame.element = _Element(tag)
+            self._pending.append(frame.element)
+        parent = self._stack[-1] if self._stack else self._root
+        self._collector.start(frame, parent, self._stack)
+        if frame.element is not None:
+            self._open.append(frame.element)
+        elif tag in _HIDDEN_TEXT_TAGS:
+            self._hidden += 1
+        self._stack.append(frame)
+
+    def handle_startendtag(
+        self, tag: str, attrs: list[tuple[str, str | None]]
+    ) -> None:
+        self.handle_starttag(tag, attrs)
+        self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        self._end_data()
+        if not any(frame.tag == tag for frame in self._stack):
+            return
+        while self._stack:
+            frame = self._stack.pop()
+            self._close(frame)
+            if frame.tag == tag:
+                break
+        self._drain()
+
+    def handle_data(self, data: str) -> None:
+        self._data.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        self._end_data()
+
+    def handle_decl(self, decl: str) -> None:
+        self._end_data()
+
+    def handle_pi(self, data: str) -> None:
+        self._end_data()
+
+    def close(self) -> None:
+        super().close()
+        self._end_data()
+        while self._stack:
+            self._close(self._stack.pop())
+        self._drain()
+
+    def _end_data(self) -> None:
+        if not self._data:
+            return
+        text = "".join(self._data).strip()
+        self._data.clear()
+        if text and not self._hidden:
+            for element in self._open:
+                element.strings.append(text)
+
+    def _close(self, frame: _Frame) -> None:
+        if frame.element is not None:
+            frame.element.closed = True
+            self._open.remove(frame.element)
+            self._collector.close(frame)
+        elif frame.tag in _HIDDEN_TEXT_TAGS:
+            self._hidden -= 1
+
+    def _drain(self) -> None:
+        while self._pending and self._pending[0].closed:
+            self._builder.add(self._pending.popleft())
+
+
+def _capture(frame: _Frame) -> _Element:
+    """Return the frame's element, creating one to collect its text."""
+
+    if frame.element is None:
+        frame.element = _Element(frame.tag)
+    return frame.element
+
+
+def _parse_heading(raw: str) -> tuple[str, str | None]:
+    match = re.match(r"^(.*)\[(\d+)]$", raw)
+    if match:
+        return match.group(1).strip(), match.group(2)
+    return raw.strip(), None
+
+
+def _parse_name_from_paragraph(raw: str) -> tuple[str, str] | None:
+    match = re.match(r"^\[(\d+)]\s*(.+)$", raw)
+    if not match:
+        return None
+    return match.group(2).strip(), match.group(1)
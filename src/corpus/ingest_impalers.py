@@ -5,9 +5,13 @@ from pathlib import Path
 from typing import Any
 
 import requests
-from bs4 import BeautifulSoup
 
 from corpus.config import settings
+from corpus.impalers_dump import (
+    DEFINITION_LIST_KIND,
+    HEADING_KIND,
+    load_impalers_dump,
+)
 from corpus.incremental import IncrementalManifest, build_signature
 from corpus.models import Provenance, RawEntity
 from corpus.utils import compute_file_hash
@@ -50,93 +54,49 @@ class ImpalersIngester:
 
         return cache_file
 
-    def parse_master_html(self, html_path: Path) -> list[dict[str, Any]]:
+    def parse_master_html(
+        self,
+        html_path: Path,
+        *,
+        sha256: str | None = None,
+    ) -> list[dict[str, Any]]:
         """
         Parse Master.html into structured text records.
 
+        Records come from the table rows, definition lists and h4-h6
+        headings in the shared parquet cache (see :mod:`corpus.impalers_dump`),
+        so the HTML is only parsed again when its hash changes.
+
         Args:
             html_path: Path to Master.html
+            sha256: Precomputed hash of ``html_path``, if already known
 
         Returns:
             List of text records with name, text, section
         """
-        with open(html_path, encoding="utf-8") as f:
-            soup = BeautifulSoup(f, "html.parser")
-
         records: list[dict[str, Any]] = []
-
-        # Parse structure - this depends on actual HTML format
-        # The Impalers Archive typically has sections with headers and text
-        # This is a generic parser that can be adjusted
-
-        current_section = "Unknown"
-
-        # Find all major sections (h1, h2, h3)
-        for header in soup.find_all(["h1", "h2", "h3"]):
-            section_name = header.get_text(strip=True)
-            if section_name:
-                current_section = section_name
-
-        # Find text blocks (this varies by actual format)
-        # Common patterns: divs with class, paragraphs, tables
-
-        # Strategy 1: Look for tables with name/description columns
-        for table in soup.find_all("table"):
-            rows = table.find_all("tr")
-            for row in rows[1:]:  # Skip header
-                cells = row.find_all(["td", "th"])
-                if len(cells) >= 2:
-                    name = cells[0].get_text(strip=True)
-                    text = cells[1].get_text(strip=True)
-
-                    if name and text and len(text) > 10:
-                        records.append(
-                            {
-                                "name": name,
-                                "text": text,
-                                "section": current_section,
-                                "language": "en",
-                            }
-                        )
-
-        # Strategy 2: Look for definition lists (dt/dd pairs)
-        for dl in soup.find_all("dl"):
-            terms = dl.find_all("dt")
-            definitions = dl.find_all("dd")
-
-            for term, definition in zip(terms, definitions, strict=True):
-                name = term.get_text(strip=True)
-                text = definition.get_text(strip=True)
-
+        dump = load_impalers_dump(html_path, sha256=sha256)
+        for block in dump.blocks:
+            paragraphs: list[str] = block["paragraphs"]
+            pairs: list[tuple[str, str]]
+            if block["kind"] == DEFINITION_LIST_KIND:
+                # Lists with unequal dt/dd counts raise, as they always did
+                pairs = list(zip(block["terms"], paragraphs, strict=True))
+            elif block["kind"] == HEADING_KIND:
+                pairs = (
+                    [(block["name"], "\n\n".join(paragraphs))]
+                    if paragraphs
+                    else []
+                )
+            else:
+                pairs = [(block["name"], paragraphs[0])]
+            for name, text in pairs:
                 if name and text and len(text) > 10:
                     records.append(
                         {
                             "name": name,
                             "text": text,
-                            "section": current_section,
-                            "language": "en",
-                        }
-                    )
-
-        # Strategy 3: Look for heading + paragraph pairs
-        for heading in soup.find_all(["h4", "h5", "h6"]):
-            name = heading.get_text(strip=True)
-            # Get next sibling paragraphs
-            text_parts = []
-            for sibling in heading.find_next_siblings():
-                if sibling.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-                    break
-                if sibling.name == "p":
-                    text_parts.append(sibling.get_text(strip=True))
-
-            if name and text_parts:
-                text = "\n\n".join(text_parts)
-                if len(text) > 10:
-                    records.append(
-                        {
-                            "name": name,
-                            "text": text,
-                            "section": current_section,
+                            "section": block["section"],
                             "language": "en",
                         }
                     )
@@ -155,8 +115,8 @@ class ImpalersIngester:
         """Ingest DLC text dump."""
 
         html_path = self.fetch_master_html()
-        records = self.parse_master_html(html_path)
         file_hash = compute_file_hash(html_path)
+        records = self.parse_master_html(html_path, sha256=file_hash)
         if manifest and record_state:
             manifest.update_file_hash(
                 DATASET_KEY_IMPALERS,
@@ -0,0 +1,228 @@
+"""Process-wide registry of loaded sentence-transformers models."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Any
+
+LOGGER = logging.getLogger(__name__)
+
+SENTENCE_TRANSFORMER = "sentence_transformer"
+CROSS_ENCODER = "cross_encoder"
+PRECISIONS = ("float32", "float16", "bfloat16")
+
+__all__ = [
+    "CROSS_ENCODER",
+    "SENTENCE_TRANSFORMER",
+    "LoadedModel",
+    "ModelKey",
+    "ModelRegistry",
+    "get_cross_encoder",
+    "get_sentence_transformer",
+    "model_registry",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class ModelKey:
+    """Identity of a loaded model: kind, name, device and precision."""
+
+    kind: str
+    model_name: str
+    device: str | None = None
+    precision: str = "float32"
+
+
+@dataclass(slots=True)
+class LoadedModel:
+    """A shared model instance plus its load statistics."""
+
+    key: ModelKey
+    model: Any
+    load_seconds: float
+    memory_bytes: int | None
+    uses: int = 1
+
+
+ModelLoader = Callable[[ModelKey], Any]
+
+
+class ModelRegistry:
+    """Load each (kind, model, device, precision) at most once per process.
+
+    Lookups are thread-safe; concurrent requests for the same key wait for
+    a single load instead of reading the weights twice.
+    """
+
+    def __init__(self) -> None:
+        self._models: dict[ModelKey, LoadedModel] = {}
+        self._lock = threading.Lock()
+        self._key_locks: dict[ModelKey, threading.Lock] = {}
+
+    def get(self, key: ModelKey, loader: ModelLoader) -> Any:
+        """Return the shared model for ``key``, loading it on first use.
+
+        Args:
+            key: Model identity
+            loader: Builds the model when it is not loaded yet
+
+        Returns:
+            The shared model instance
+        """
+        if key.precision not in PRECISIONS:
+            msg = (
+                f"Unsupported precision {key.precision!r}; expected one of "
+                f"{', '.join(PRECISIONS)}"
+            )
+            raise ValueError(msg)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            loaded = self._models.get(key)
+            if loaded is not None:
+                loaded.uses += 1
+                return loaded.model
+
+            started = time.perf_counter()
+            model = _apply_precision(loader(key), key.precision)
+            loaded = LoadedModel(
+                key=key,
+                model=model,
+                load_seconds=time.perf_counter() - started,
+                memory_bytes=_parameter_bytes(model),
+            )
+            self._models[key] = loaded
+        LOGGER.info(
+            "Loaded %s %s (device=%s, precision=%s) in %.2fs, %s",
+            key.kind,
+            key.model_name,
+            key.device or "auto",
+            key.precision,
+            loaded.load_seconds,
+            _format_bytes(loaded.memory_bytes),
+        )
+        return model
+
+    def loaded(self) -> list[LoadedModel]:
+        """Return load statistics for every model currently held."""
+
+        with self._lock:
+            return list(self._models.values())
+
+    def clear(self) -> None:
+        """Drop every shared model (mainly for tests and notebooks)."""
+
+        with self._lock:
+            self._models.clear()
+            self._key_locks.clear()
+
+
+_REGISTRY = ModelRegistry()
+
+
+def model_registry() -> ModelRegistry:
+    """Return the process-wide registry."""
+
+    return _REGISTRY
+
+
+def get_sentence_transformer(
+    model_name: str,
+    *,
+    device: str | None = None,
+    precision: str | None = None,
+) -> Any:
+    """
+    Return a shared ``SentenceTransformer`` instance.
+
+    Args:
+        model_name: Hugging Face model identifier or local path
+        device: Torch device (None lets sentence-transformers choose)
+        precision: float32 (default), float16 or bfloat16
+
+    Returns:
+        SentenceTransformer model
+    """
+    key = ModelKey(
+        SENTENCE_TRANSFORMER, model_name, device, precision or "float32"
+    )
+    return _REGISTRY.get(key, _load_sentence_transformer)
+
+
+def get_cross_encoder(
+    model_name: str,
+    *,
+    device: str | None = None,
+    precision: str | None = None,
+) -> Any:
+    """
+    Return a shared ``CrossEncoder`` instance.
+
+    Args:
+        model_name: Hugging Face model identifier or local path
+        device: Torch device (None lets sentence-transformers choose)
+        precision: float32 (default), float16 or bfloat16
+
+    Returns:
+        CrossEncoder model
+    """
+    key = ModelKey(CROSS_ENCODER, model_name, device, precision or "float32")
+    return _REGISTRY.get(key, _load_cross_encoder)
+
+
+def _sentence_transformers() -> Any:
+    try:
+        return import_module("sentence_transformers")
+    except ImportError as err:
+        raise ImportError(
+            "sentence-transformers is not installed. "
+            "Install with 'poetry add sentence-transformers'"
+        ) from err
+
+
+def _load_sentence_transformer(key: ModelKey) -> Any:
+    module = _sentence_transformers()
+    return module.SentenceTransformer(key.model_name, device=key.device)
+
+
+def _load_cross_encoder(key: ModelKey) -> Any:
+    module = _sentence_transformers()
+    kwargs: dict[str, Any] = {"model_name": key.model_name}
+    if key.device:
+        kwargs["device"] = key.device
+    return module.CrossEncoder(**kwargs)
+
+
+def _apply_precision(model: Any, precision: str) -> Any:
+    if precision == "float32":
+        return model
+    # CrossEncoder keeps its torch module on ``.model``
+    module = model if hasattr(model, "half") else getattr(model, "model", None)
+    if module is None:
+        LOGGER.warning("Cannot cast %s to %s", type(model).__name__, precision)
+        return model
+    if precision == "float16":
+        module.half()
+    else:
+        module.to(import_module("torch").bfloat16)
+    return model
+
+
+def _parameter_bytes(model: Any) -> int | None:
+    module = model if hasattr(model, "parameters") else None
+    module = module or getattr(model, "model", None)
+    parameters = getattr(module, "parameters", None)
+    if not callable(parameters):
+        return None
+    return sum(param.numel() * param.element_size() for param in parameters())
+
+
+def _format_bytes(size: int | None) -> str:
+    if size is None:
+        return "size unknown"
+    return f"{size / (1024 * 1024):.1f} MiB of weights"
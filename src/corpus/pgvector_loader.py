@@ -1,84 +1,733 @@
 """PostgreSQL + pgvector loader."""
 
+import hashlib
 import json
+import re
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from string import Template
+from typing import Any, Literal
 
+import numpy as np
 import polars as pl
 import psycopg
+from pgvector.psycopg import register_vector
+from psycopg import sql
 from psycopg.rows import dict_row
 from tqdm import tqdm
 
 from corpus.config import settings
-from corpus.embeddings import generate_embeddings
+from corpus.embeddings import (
+    embedding_matrix,
+    generate_embeddings,
+    normalize_embedding_column,
+)
+from corpus.models import CorpusChunk
+
+SQL_DIR = Path(__file__).parent.parent.parent / "sql"
+# Templates live outside SQL_DIR so docker-entrypoint-initdb.d (which mounts
+# sql/) only ever runs rendered files
+SQL_TEMPLATE_DIR = SQL_DIR / "templates"
+CHUNK_TABLE = "corpus_chunk"
+# Catch-all partition of a partitioned corpus_chunk
+DEFAULT_PARTITION = f"{CHUNK_TABLE}_default"
+
+# Namespace for deterministic document/chunk UUIDs (uuid5)
+CORPUS_ID_NAMESPACE = uuid.UUID("6f1d3c52-8f0e-4f7a-9a59-2f4f8c1d7e3b")
+
+# Rebuild the HNSW index instead of maintaining it incrementally once at
+# least this fraction of the corpus is written in a single sync
+INDEX_REBUILD_FRACTION = 0.2
+
+DistanceMetric = Literal["cosine", "ip", "l2"]
+
+# pgvector operator class used by the HNSW index for each metric
+OPERATOR_CLASSES: dict[str, str] = {
+    "cosine": "vector_cosine_ops",
+    "ip": "vector_ip_ops",
+    "l2": "vector_l2_ops",
+}
+
+# Query operator matching each operator class (smaller is closer)
+DISTANCE_OPERATORS: dict[str, str] = {
+    "cosine": "<=>",
+    "ip": "<#>",
+    "l2": "<->",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class HNSWIndexConfig:
+    """Build parameters for the pgvector HNSW index."""
+
+    m: int = 16
+    ef_construction: int = 64
+    distance: DistanceMetric = "cosine"
+    maintenance_work_mem: str = "512MB"
+
+    def __post_init__(self) -> None:
+        if self.distance not in OPERATOR_CLASSES:
+            raise ValueError(f"Unknown distance metric: {self.distance}")
+        if self.m < 2:
+            raise ValueError("HNSW m must be at least 2")
+        if self.ef_construction < 2 * self.m:
+            raise ValueError("HNSW ef_construction must be at least 2 * m")
+
+    @classmethod
+    def from_settings(cls) -> "HNSWIndexConfig":
+        """Build an index config from the global settings."""
+        return cls(
+            m=settings.pgvector_hnsw_m,
+            ef_construction=settings.pgvector_hnsw_ef_construction,
+            distance=settings.pgvector_distance,
+            maintenance_work_mem=settings.pgvector_maintenance_work_mem,
+        )
+
+    @property
+    def operator_class(self) -> str:
+        """pgvector operator class for the configured metric."""
+        return OPERATOR_CLASSES[self.distance]
+
+    @property
+    def distance_operator(self) -> str:
+        """SQL distance operator for the configured metric."""
+        return DISTANCE_OPERATORS[self.distance]
+
+
+def render_sql(name: str, **params: object) -> str:
+    """
+    Read a template from ``sql/templates/`` and substitute placeholders.
+
+    Args:
+        name: File name inside the SQL template directory
+        **params: Placeholder values
+
+    Returns:
+        Rendered SQL text
+    """
+    template = Template((SQL_TEMPLATE_DIR / name).read_text(encoding="utf-8"))
+    # safe_substitute leaves bare "$" (e.g. regex anchors) untouched
+    rendered = template.safe_substitute(
+        {key: str(value) for key, value in params.items()}
+    )
+    if "${" in rendered:
+        raise ValueError(f"Unrendered placeholder left in {name}")
+    return rendered
+
+
+def render_schema_sql(
+    embed_dimension: int | None = None, partitioned: bool = False
+) -> str:
+    """
+    Render ``010_schema.sql``.
+
+    Args:
+        embed_dimension: Vector dimension (default from settings)
+        partitioned: List-partition ``corpus_chunk`` by ``entity_type``. The
+            primary key then has to include ``entity_type``, so
+            ``community_annotation.chunk_id`` loses its foreign key.
+
+    Returns:
+        Rendered SQL text
+    """
+    dimension = embed_dimension or settings.embed_dimension
+    if dimension <= 0:
+        raise ValueError("Embedding dimension must be positive")
+    if partitioned:
+        layout = {
+            "chunk_primary_key": "id, entity_type",
+            "chunk_partitioning": " PARTITION BY LIST (entity_type)",
+            "chunk_reference": "",
+        }
+    else:
+        layout = {
+            "chunk_primary_key": "id",
+            "chunk_partitioning": "",
+            "chunk_reference": (
+                " REFERENCES elden.corpus_chunk(id) ON DELETE SET NULL"
+            ),
+        }
+    return render_sql("010_schema.sql", embed_dimension=dimension, **layout)
+
+
+def vector_index_name(table: str = CHUNK_TABLE) -> str:
+    """Name of the HNSW index on ``table`` (a chunk table or partition)."""
+    return f"{table}_embedding_hnsw_idx"
+
+
+def render_vector_index_sql(
+    config: HNSWIndexConfig, table: str = CHUNK_TABLE
+) -> str:
+    """Render ``030_vector_index.sql`` for the given index config and table."""
+    return render_sql(
+        "030_vector_index.sql",
+        table_name=table,
+        index_name=vector_index_name(table),
+        operator_class=config.operator_class,
+        m=config.m,
+        ef_construction=config.ef_construction,
+    )
+
+
+# pgvector's build parameters when an index was created without WITH (...)
+_HNSW_DEFAULT_OPTIONS = {"m": 16, "ef_construction": 64}
+
+
+def vector_index_matches(
+    definition: str | None, config: HNSWIndexConfig
+) -> bool:
+    """
+    Whether an existing index was built the way ``config`` asks for.
+
+    Args:
+        definition: ``pg_get_indexdef`` output, or None without an index
+        config: Wanted HNSW build parameters
+
+    Returns:
+        True if access method, operator class, m and ef_construction match
+    """
+    if definition is None:
+        return False
+    method = re.search(r"USING hnsw \(embedding (\w+)\)", definition)
+    if method is None or method.group(1) != config.operator_class:
+        return False
+    # pg_get_indexdef renders reloptions as WITH (m='16', ef_construction='64')
+    with_clause = re.search(r"\bWITH \(([^)]*)\)", definition)
+    options = dict(_HNSW_DEFAULT_OPTIONS)
+    if with_clause:
+        for key, value in re.findall(
+            r"(\w+)\s*=\s*'?(\d+)'?", with_clause.group(1)
+        ):
+            options[key] = int(value)
+    return (
+        options["m"] == config.m
+        and options["ef_construction"] == config.ef_construction
+    )
+
+
+def partition_table_name(entity_type: str) -> str:
+    """
+    Table name of the ``corpus_chunk`` partition holding ``entity_type``.
+
+    Entity types that are not already plain lowercase identifiers get a short
+    hash suffix so distinct values (e.g. ``Boss`` and ``boss``) never share a
+    name, and long values stay within Postgres' 63-byte identifier limit
+    once the index suffix is added.
+
+    Args:
+        entity_type: Entity type value
+
+    Returns:
+        Unqualified partition table name
+    """
+    slug = re.sub(r"[^a-z0-9]+", "_", entity_type.lower()).strip("_")
+    if slug != entity_type or len(slug) > 20:
+        digest = hashlib.sha1(entity_type.encode("utf-8")).hexdigest()[:8]
+        slug = f"{slug[:20]}_{digest}".lstrip("_")
+    return f"{CHUNK_TABLE}_{slug}"
+
+
+@dataclass(slots=True)
+class ChunkRow:
+    """Corpus chunk prepared for syncing into ``elden.corpus_chunk``."""
+
+    id: uuid.UUID
+    entity_type: str
+    game_entity_id: str
+    is_dlc: bool
+    name: str
+    text: str
+    meta: dict[str, Any]
+    content_hash: str
+    row_hash: str
+    embedding: np.ndarray | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ExistingChunk:
+    """Hashes recorded for a chunk already stored in Postgres."""
+
+    content_hash: str | None
+    row_hash: str | None
+    has_embedding: bool
+
+
+@dataclass(slots=True)
+class SyncReport:
+    """Outcome of an incremental corpus sync."""
+
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    embedded: int = 0
+    legacy_documents: int = 0
+
+    def summary(self) -> str:
+        """Human-readable one-line summary."""
+        return (
+            f"inserted={self.inserted} updated={self.updated} "
+            f"deleted={self.deleted} unchanged={self.unchanged} "
+            f"embedded={self.embedded}"
+        )
+
+    def add(self, other: "SyncReport") -> None:
+        """Accumulate the counts of another (partition) report."""
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.deleted += other.deleted
+        self.unchanged += other.unchanged
+        self.embedded += other.embedded
+        self.legacy_documents += other.legacy_documents
+
+
+@dataclass(slots=True)
+class SyncPlan:
+    """Rows to write and delete for a sync, plus its report."""
+
+    upserts: list[ChunkRow]
+    deletes: list[uuid.UUID]
+    needs_embedding: list[ChunkRow]
+    report: SyncReport
+
+
+def stable_document_id(source_type: str, source_key: str) -> uuid.UUID:
+    """Deterministic document id for a source type + key."""
+    return uuid.uuid5(
+        CORPUS_ID_NAMESPACE, f"document:{source_type}:{source_key}"
+    )
+
+
+def stable_chunk_id(entity_type: str, game_entity_id: str) -> uuid.UUID:
+    """Deterministic chunk id for an ``entity_type:slug`` pair."""
+    return uuid.uuid5(
+        CORPUS_ID_NAMESPACE, f"chunk:{entity_type}:{game_entity_id}"
+    )
+
+
+def prepare_chunk_rows(df: pl.DataFrame) -> list[ChunkRow]:
+    """
+    Convert unified parquet rows into hashed chunk rows.
+
+    ``content_hash`` comes from :meth:`CorpusChunk.compute_hash` and covers
+    the embedded text; ``row_hash`` additionally covers ``is_dlc`` and the
+    metadata so metadata-only edits update the row without re-embedding.
+
+    Args:
+        df: Unified corpus DataFrame
+
+    Returns:
+        One :class:`ChunkRow` per entity
+    """
+    # Legacy parquet files store embeddings as JSON strings
+    df = normalize_embedding_column(df)
+    rows: list[ChunkRow] = []
+    seen: set[uuid.UUID] = set()
+    for row in df.iter_rows(named=True):
+        # Parse meta_json
+        meta = row.get("meta_json") or {}
+        if isinstance(meta, str):
+            meta = json.loads(meta)
+
+        # Add sources to meta
+        sources = row.get("sources") or []
+        if isinstance(sources, str):
+            sources = json.loads(sources)
+        meta["sources"] = sources
+
+        chunk = CorpusChunk(
+            entity_type=row["entity_type"],
+            game_entity_id=row["slug"],
+            is_dlc=bool(row["is_dlc"]),
+            name=row["name"],
+            text=row["description"],
+            meta=meta,
+        )
+        chunk_id = stable_chunk_id(chunk.entity_type, chunk.game_entity_id)
+        if chunk_id in seen:
+            raise ValueError(
+                "Duplicate corpus entity: "
+                f"{chunk.entity_type}:{chunk.game_entity_id}"
+            )
+        seen.add(chunk_id)
+
+        content_hash = chunk.compute_hash()
+        meta_json = json.dumps(chunk.meta, sort_keys=True, default=str)
+        row_hash = hashlib.sha256(
+            f"{content_hash}:{chunk.is_dlc}:{meta_json}".encode()
+        ).hexdigest()
+
+        rows.append(
+            ChunkRow(
+                id=chunk_id,
+                entity_type=chunk.entity_type,
+                game_entity_id=chunk.game_entity_id,
+                is_dlc=chunk.is_dlc,
+                name=chunk.name,
+                text=chunk.text,
+                meta=chunk.meta,
+                content_hash=content_hash,
+                row_hash=row_hash,
+                embedding=_parse_embedding(row.get("embedding")),
+            )
+        )
+    return rows
+
+
+def plan_chunk_sync(
+    rows: list[ChunkRow],
+    existing: dict[uuid.UUID, ExistingChunk],
+    embed: bool = False,
+) -> SyncPlan:
+    """
+    Diff prepared rows against the chunks already stored for a document.
+
+    Args:
+        rows: Rows prepared from the parquet
+        existing: Stored hashes keyed by chunk id
+        embed: Whether missing embeddings will be generated for this sync
+
+    Returns:
+        Sync plan with upserts, deletes and rows that need new embeddings
+    """
+    report = SyncReport()
+    upserts: list[ChunkRow] = []
+    needs_embedding: list[ChunkRow] = []
+    incoming: set[uuid.UUID] = set()
+
+    for row in rows:
+        incoming.add(row.id)
+        stored = existing.get(row.id)
+        if stored is None:
+            report.inserted += 1
+            changed = text_changed = True
+        else:
+            text_changed = stored.content_hash != row.content_hash
+            changed = text_changed or stored.row_hash != row.row_hash
+            if changed:
+                report.updated += 1
+            else:
+                report.unchanged += 1
+
+        # Unchanged rows are only rewritten to fill in a missing vector
+        fill_vector = (
+            stored is not None
+            and not stored.has_embedding
+            and (row.embedding is not None or embed)
+        )
+        if embed and row.embedding is None and (text_changed or fill_vector):
+            needs_embedding.append(row)
+        if changed or fill_vector:
+            upserts.append(row)
+
+    deletes = [chunk_id for chunk_id in existing if chunk_id not in incoming]
+    report.deleted = len(deletes)
+    return SyncPlan(
+        upserts=upserts,
+        deletes=deletes,
+        needs_embedding=needs_embedding,
+        report=report,
+    )
+
+
+def _parse_embedding(value: object) -> np.ndarray | None:
+    if value is None or (isinstance(value, str) and not value):
+        return None
+    if isinstance(value, str):
+        value = json.loads(value)
+    return np.asarray(value, dtype=np.float32)
+
+
+def parquet_entity_types(parquet_path: str | Path) -> list[str]:
+    """Distinct entity types in a unified parquet, sorted."""
+    frame = (
+        pl.scan_parquet(parquet_path)
+        .select(pl.col("entity_type").unique())
+        .collect()
+    )
+    return sorted(frame.get_column("entity_type").drop_nulls().to_list())
+
+
+def read_chunk_slice(
+    parquet_path: str | Path, entity_type: str | None = None
+) -> pl.DataFrame:
+    """
+    Read the rows of one entity type from a unified parquet.
+
+    The filter is pushed down into the parquet scan, so concurrent partition
+    loads each only materialise their own slice.
+
+    Args:
+        parquet_path: Path to unified.parquet
+        entity_type: Entity type to keep (None reads every row)
+
+    Returns:
+        DataFrame slice
+    """
+    scan = pl.scan_parquet(parquet_path)
+    if entity_type is not None:
+        scan = scan.filter(pl.col("entity_type") == entity_type)
+    return scan.collect()
 
 
 class PgVectorLoader:
     """Load corpus data into PostgreSQL with pgvector."""
 
-    def __init__(self, dsn: str | None = None) -> None:
+    def __init__(
+        self,
+        dsn: str | None = None,
+        index_config: HNSWIndexConfig | None = None,
+    ) -> None:
         """
         Initialize loader.
 
         Args:
             dsn: PostgreSQL DSN (default from settings)
+            index_config: HNSW build parameters (default from settings)
         """
         self.dsn = dsn or settings.postgres_dsn
+        self.index_config = index_config or HNSWIndexConfig.from_settings()
 
-    def create_schema(self) -> None:
-        """Create database schema and enable extensions."""
-        print("Creating schema...")
+    def _connect(self, **kwargs: Any) -> psycopg.Connection[Any]:
+        """
+        Open a connection that exchanges vectors as binary float32.
+
+        pgvector's adapters dump numpy arrays in the binary ``vector`` wire
+        format, so embeddings never go through a text representation. The
+        ``vector`` extension must already exist (see :meth:`create_schema`).
+        """
+        conn = psycopg.connect(self.dsn, **kwargs)
+        try:
+            register_vector(conn)
+        except Exception:
+            conn.close()
+            raise
+        return conn
 
-        sql_dir = Path(__file__).parent.parent.parent / "sql"
+    def create_schema(self, partitioned: bool | None = None) -> None:
+        """
+        Create database schema and enable extensions.
+
+        The HNSW vector index is not created here; it is built by
+        :meth:`build_vector_index` once the data has been loaded.
+
+        Args:
+            partitioned: List-partition ``elden.corpus_chunk`` by
+                ``entity_type``. Only applies when the table does not exist
+                yet; an existing table with the other layout is an error.
+                None keeps the layout of an existing table (unpartitioned
+                when there is none).
+        """
+        print("Creating schema...")
 
         with psycopg.connect(self.dsn) as conn:
             # Enable extensions
-            with open(sql_dir / "001_enable_extensions.sql") as f:
-                conn.execute(f.read())
+            conn.execute(
+                (SQL_DIR / "001_enable_extensions.sql").read_text(
+                    encoding="utf-8"
+                )
+            )
+
+            if partitioned is None:
+                partitioned = self.is_partitioned(conn)
 
             # Create schema
-            with open(sql_dir / "010_schema.sql") as f:
-                conn.execute(f.read())
+            conn.execute(render_schema_sql(partitioned=partitioned))
+            if self.is_partitioned(conn) != partitioned:
+                layout = "partitioned" if not partitioned else "unpartitioned"
+                raise RuntimeError(
+                    f"elden.corpus_chunk already exists {layout}; drop it "
+                    "before switching layouts"
+                )
+            if partitioned:
+                # Catch-all so rows never fail to route while partitions for
+                # new entity types are being added
+                conn.execute(
+                    sql.SQL(
+                        "CREATE TABLE IF NOT EXISTS {} "
+                        "PARTITION OF elden.corpus_chunk DEFAULT"
+                    ).format(sql.Identifier("elden", DEFAULT_PARTITION))
+                )
 
             # Create indexes
-            with open(sql_dir / "020_indexes.sql") as f:
-                conn.execute(f.read())
+            conn.execute(
+                (SQL_DIR / "020_indexes.sql").read_text(encoding="utf-8")
+            )
 
             conn.commit()
 
         print("Schema created successfully")
 
+    def is_partitioned(self, conn: psycopg.Connection[Any]) -> bool:
+        """Whether ``elden.corpus_chunk`` is a partitioned table."""
+        result = conn.execute(
+            """
+            SELECT EXISTS (
+                SELECT 1 FROM pg_partitioned_table
+                WHERE partrelid = to_regclass('elden.corpus_chunk')
+            )
+            """
+        ).fetchone()
+        return bool(result and result[0])
+
+    def ensure_partitions(
+        self, conn: psycopg.Connection[Any], entity_types: list[str]
+    ) -> list[str]:
+        """
+        Create the ``corpus_chunk`` partitions for ``entity_types``.
+
+        Args:
+            conn: Open connection
+            entity_types: Entity types that need a dedicated partition
+
+        Returns:
+            Partition table names, in the order of ``entity_types``
+        """
+        existing = set(self._partition_tables(conn))
+        tables: list[str] = []
+        for entity_type in entity_types:
+            table = partition_table_name(entity_type)
+            if table not in existing:
+                conn.execute(
+                    sql.SQL(
+                        "CREATE TABLE {} PARTITION OF elden.corpus_chunk "
+                        "FOR VALUES IN ({})"
+                    ).format(
+                        sql.Identifier("elden", table),
+                        sql.Literal(entity_type),
+                    )
+                )
+            tables.append(table)
+        return tables
+
+    def _partition_tables(self, conn: psycopg.Connection[Any]) -> list[str]:
+        results = conn.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = 'elden.corpus_chunk'::regclass
+            ORDER BY child.relname
+            """
+        ).fetchall()
+        return [row[0] for row in results]
+
+    def drop_vector_index(
+        self, conn: psycopg.Connection[Any], table: str = CHUNK_TABLE
+    ) -> None:
+        """Drop the HNSW index so bulk inserts skip graph maintenance."""
+        conn.execute(
+            sql.SQL("DROP INDEX IF EXISTS {}").format(
+                sql.Identifier("elden", vector_index_name(table))
+            )
+        )
+
+    def build_vector_index(
+        self,
+        conn: psycopg.Connection[Any] | None = None,
+        tables: list[str] | None = None,
+    ) -> None:
+        """
+        (Re)build the HNSW vector index using the configured parameters.
+
+        On a partitioned ``corpus_chunk`` each partition gets its own index,
+        which is smaller to build and is the only one scanned when a query
+        is scoped to a single entity type.
+
+        Args:
+            conn: Open connection to reuse (a new one is opened otherwise)
+            tables: Tables to index (default: ``corpus_chunk`` or all of its
+                partitions)
+        """
+        config = self.index_config
+        print(
+            "Building HNSW index "
+            f"({config.operator_class}, m={config.m}, "
+            f"ef_construction={config.ef_construction})..."
+        )
+
+        if conn is None:
+            with psycopg.connect(self.dsn) as owned:
+                self._build_vector_index(owned, tables)
+                owned.commit()
+        else:
+            self._build_vector_index(conn, tables)
+
+        print("HNSW index built")
+
+    def _build_vector_index(
+        self, conn: psycopg.Connection[Any], tables: list[str] | None
+    ) -> None:
+        if tables is None:
+            tables = (
+                self._partition_tables(conn)
+                if self.is_partitioned(conn)
+                else [CHUNK_TABLE]
+            )
+        conn.execute(
+            "SELECT set_config('maintenance_work_mem', %s, true)",
+            (self.index_config.maintenance_work_mem,),
+        )
+        for table in tables:
+            conn.execute(render_vector_index_sql(self.index_config, table))
+
     def load_data(
         self,
         parquet_path: str | Path,
         embed_provider: Literal["openai", "local"] | None = None,
-    ) -> None:
+        build_index: bool = True,
+        workers: int = 1,
+    ) -> SyncReport:
         """
-        Load data from Parquet into PostgreSQL.
+        Sync data from Parquet into PostgreSQL.
+
+        Chunks get stable ids derived from ``entity_type:slug`` and a content
+        hash, so repeated loads only insert new rows, update changed rows and
+        delete rows that disappeared from the parquet. Embeddings are only
+        generated for rows whose text changed (or that have none yet).
+
+        When many rows change, the HNSW index is dropped before writing and
+        rebuilt afterwards, which is much cheaper than maintaining the graph
+        row by row. Small incremental syncs keep the existing index.
+
+        If ``corpus_chunk`` is partitioned, each entity type is synced as its
+        own slice of the parquet with its own index decision. With
+        ``workers > 1`` the slices run concurrently, each on its own
+        connection and transaction, so a failure only rolls back the slices
+        that had not committed yet.
 
         Args:
             parquet_path: Path to unified.parquet
             embed_provider: Generate embeddings ('openai', 'local', or None)
-        """
-        print(f"Loading data from {parquet_path}...")
+            build_index: Ensure the HNSW index is (re)built after the sync
+            workers: Connections used to load partitions concurrently
+                (requires a partitioned schema when greater than one)
 
-        df = pl.read_parquet(parquet_path)
+        Returns:
+            Counts of inserted/updated/deleted/unchanged chunks
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
 
-        # Generate embeddings if requested
-        if embed_provider:
-            df = generate_embeddings(df, provider=embed_provider)
+        print(f"Loading data from {parquet_path}...")
 
-        print(f"Inserting {len(df)} entities into database...")
+        doc_id = stable_document_id("curated_corpus", Path(parquet_path).name)
+        report = SyncReport()
 
-        with psycopg.connect(self.dsn) as conn:
-            # Create a document record for this load
-            doc_id = str(uuid.uuid4())
+        with self._connect() as conn:
+            report.legacy_documents = self._delete_legacy_documents(
+                conn, doc_id, parquet_path
+            )
             conn.execute(
                 """
                 INSERT INTO elden.corpus_document
                 (id, source_type, source_uri, title, language)
                 VALUES (%s, %s, %s, %s, %s)
+                ON CONFLICT (id) DO UPDATE
+                SET source_uri = EXCLUDED.source_uri,
+                    title = EXCLUDED.title
                 """,
                 (
                     doc_id,
@@ -89,57 +738,296 @@ class PgVectorLoader:
                 ),
             )
 
-            # Insert chunks
-            for row in tqdm(
-                df.iter_rows(named=True), total=len(df), desc="Inserting"
+            if not self.is_partitioned(conn):
+                if workers > 1:
+                    raise ValueError(
+                        "Concurrent loading requires a partitioned "
+                        "elden.corpus_chunk (create the schema with "
+                        "partitioned=True)"
+                    )
+                report.add(
+                    self._sync_slice(
+                        conn,
+                        parquet_path,
+                        doc_id,
+                        None,
+                        CHUNK_TABLE,
+                        embed_provider,
+                        build_index,
+                    )
+                )
+                conn.commit()
+                print(f"Data loaded successfully ({report.summary()})")
+                return report
+
+            entity_types = parquet_entity_types(parquet_path)
+            tables = self.ensure_partitions(conn, entity_types)
+            report.deleted += self._delete_missing_entity_types(
+                conn, doc_id, entity_types
+            )
+            slices = list(zip(entity_types, tables, strict=True))
+            if build_index and DEFAULT_PARTITION in self._partition_tables(
+                conn
             ):
-                chunk_id = str(uuid.uuid4())
-
-                # Parse embedding if present
-                embedding = None
-                if "embedding" in row and row["embedding"]:
-                    if isinstance(row["embedding"], str):
-                        embedding = json.loads(row["embedding"])
-                    else:
-                        embedding = row["embedding"]
-
-                # Parse meta_json
-                meta = row.get("meta_json", {})
-                if isinstance(meta, str):
-                    meta = json.loads(meta)
-
-                # Add sources to meta
-                sources = row.get("sources", [])
-                if isinstance(sources, str):
-                    sources = json.loads(sources)
-                meta["sources"] = sources
+                # No slice syncs into the DEFAULT partition, but rows routed
+                # there still need an index like every other partition
+                self._ensure_vector_index(conn, DEFAULT_PARTITION)
 
-                conn.execute(
-                    """
-                    INSERT INTO elden.corpus_chunk
-                    (id, document_id, entity_type, game_entity_id, is_dlc,
-                     name, text, meta, embedding)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """,
+            if workers == 1:
+                for entity_type, table in slices:
+                    report.add(
+                        self._sync_slice(
+                            conn,
+                            parquet_path,
+                            doc_id,
+                            entity_type,
+                            table,
+                            embed_provider,
+                            build_index,
+                        )
+                    )
+                conn.commit()
+                print(f"Data loaded successfully ({report.summary()})")
+                return report
+
+            # The document row and partitions must be visible to the workers
+            conn.commit()
+
+        def load_partition(entity_type: str, table: str) -> SyncReport:
+            with self._connect() as worker_conn:
+                partition_report = self._sync_slice(
+                    worker_conn,
+                    parquet_path,
+                    doc_id,
+                    entity_type,
+                    table,
+                    embed_provider,
+                    build_index,
+                )
+                worker_conn.commit()
+            return partition_report
+
+        print(f"Loading {len(slices)} partitions with {workers} workers...")
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(load_partition, entity_type, table)
+                for entity_type, table in slices
+            ]
+            for future in futures:
+                report.add(future.result())
+
+        print(f"Data loaded successfully ({report.summary()})")
+        return report
+
+    def _sync_slice(
+        self,
+        conn: psycopg.Connection[Any],
+        parquet_path: str | Path,
+        doc_id: uuid.UUID,
+        entity_type: str | None,
+        table: str,
+        embed_provider: Literal["openai", "local"] | None,
+        build_index: bool,
+    ) -> SyncReport:
+        """Sync one entity type (or everything, when None) on ``conn``."""
+        rows = prepare_chunk_rows(read_chunk_slice(parquet_path, entity_type))
+        existing = self._fetch_chunk_state(conn, doc_id, entity_type)
+        plan = plan_chunk_sync(
+            rows, existing, embed=embed_provider is not None
+        )
+        report = plan.report
+
+        if embed_provider:
+            report.embedded = self._embed_rows(
+                plan.needs_embedding, embed_provider
+            )
+
+        written = len(plan.upserts) + len(plan.deletes)
+        # A missing index, or one built with a different operator class / m /
+        # ef_construction than configured, is rebuilt however little changed
+        rebuild = build_index and (
+            not vector_index_matches(
+                self._vector_index_definition(conn, table), self.index_config
+            )
+            or written >= max(1, len(rows)) * INDEX_REBUILD_FRACTION
+        )
+        if rebuild:
+            self.drop_vector_index(conn, table)
+
+        label = entity_type or "all entity types"
+        print(f"Syncing {written} changed chunks ({label}) into database...")
+        self._delete_chunks(conn, plan.deletes)
+        self._upsert_chunks(
+            conn, doc_id, plan.upserts, partitioned=entity_type is not None
+        )
+
+        if rebuild:
+            self.build_vector_index(conn, tables=[table])
+
+        return report
+
+    def _delete_legacy_documents(
+        self,
+        conn: psycopg.Connection[Any],
+        doc_id: uuid.UUID,
+        parquet_path: str | Path,
+    ) -> int:
+        """Remove per-load documents written before ids were stable."""
+        cursor = conn.execute(
+            """
+            DELETE FROM elden.corpus_document
+            WHERE source_type = 'curated_corpus'
+              AND source_uri = %s
+              AND id <> %s
+            """,
+            (str(parquet_path), doc_id),
+        )
+        return cursor.rowcount
+
+    def _delete_missing_entity_types(
+        self,
+        conn: psycopg.Connection[Any],
+        doc_id: uuid.UUID,
+        entity_types: list[str],
+    ) -> int:
+        """Remove chunks whose entity type no longer appears at all."""
+        cursor = conn.execute(
+            """
+            DELETE FROM elden.corpus_chunk
+            WHERE document_id = %s
+              AND NOT (entity_type = ANY(%s))
+            """,
+            (doc_id, entity_types),
+        )
+        return cursor.rowcount
+
+    def _fetch_chunk_state(
+        self,
+        conn: psycopg.Connection[Any],
+        doc_id: uuid.UUID,
+        entity_type: str | None = None,
+    ) -> dict[uuid.UUID, ExistingChunk]:
+        query = """
+            SELECT id, content_hash, row_hash, embedding IS NOT NULL
+            FROM elden.corpus_chunk
+            WHERE document_id = %s
+        """
+        params: list[object] = [doc_id]
+        if entity_type is not None:
+            # Lets the planner prune to the entity type's partition
+            query += " AND entity_type = %s"
+            params.append(entity_type)
+        results = conn.execute(query, params).fetchall()
+        return {
+            row[0]: ExistingChunk(
+                content_hash=row[1],
+                row_hash=row[2],
+                has_embedding=bool(row[3]),
+            )
+            for row in results
+        }
+
+    def _embed_rows(
+        self,
+        rows: list[ChunkRow],
+        embed_provider: Literal["openai", "local"],
+    ) -> int:
+        if not rows:
+            return 0
+        texts = pl.DataFrame({"description": [row.text for row in rows]})
+        embedded = generate_embeddings(texts, provider=embed_provider)
+        matrix = embedding_matrix(embedded.get_column("embedding"))
+        for row, vector in zip(rows, matrix, strict=True):
+            row.embedding = vector
+        return len(rows)
+
+    def _delete_chunks(
+        self, conn: psycopg.Connection[Any], chunk_ids: list[uuid.UUID]
+    ) -> None:
+        if chunk_ids:
+            conn.execute(
+                "DELETE FROM elden.corpus_chunk WHERE id = ANY(%s)",
+                (chunk_ids,),
+            )
+
+    def _upsert_chunks(
+        self,
+        conn: psycopg.Connection[Any],
+        doc_id: uuid.UUID,
+        rows: list[ChunkRow],
+        partitioned: bool = False,
+    ) -> None:
+        # Partitioned tables key on (id, entity_type); ids are derived from
+        # the entity type, so both conflict targets identify the same row.
+        conflict = "id, entity_type" if partitioned else "id"
+        # A text change without a fresh vector clears the stale embedding;
+        # metadata-only changes keep the stored one.
+        with conn.cursor() as cur:
+            cur.executemany(
+                f"""
+                INSERT INTO elden.corpus_chunk
+                (id, document_id, entity_type, game_entity_id, is_dlc,
+                 name, text, meta, content_hash, row_hash, embedding)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %b::vector)
+                ON CONFLICT ({conflict}) DO UPDATE
+                SET document_id = EXCLUDED.document_id,
+                    is_dlc = EXCLUDED.is_dlc,
+                    name = EXCLUDED.name,
+                    text = EXCLUDED.text,
+                    meta = EXCLUDED.meta,
+                    row_hash = EXCLUDED.row_hash,
+                    embedding = CASE
+                        WHEN elden.corpus_chunk.content_hash
+                             IS DISTINCT FROM EXCLUDED.content_hash
+                        THEN EXCLUDED.embedding
+                        ELSE COALESCE(
+                            EXCLUDED.embedding, elden.corpus_chunk.embedding
+                        )
+                    END,
+                    content_hash = EXCLUDED.content_hash
+                """,
+                [
                     (
-                        chunk_id,
+                        row.id,
                         doc_id,
-                        row["entity_type"],
-                        row["slug"],
-                        row["is_dlc"],
-                        row["name"],
-                        row["description"],
-                        json.dumps(meta),
-                        embedding,
-                    ),
-                )
+                        row.entity_type,
+                        row.game_entity_id,
+                        row.is_dlc,
+                        row.name,
+                        row.text,
+                        json.dumps(row.meta),
+                        row.content_hash,
+                        row.row_hash,
+                        row.embedding,
+                    )
+                    for row in tqdm(rows, desc="Upserting")
+                ],
+            )
 
-            conn.commit()
+    def _ensure_vector_index(
+        self, conn: psycopg.Connection[Any], table: str
+    ) -> None:
+        """Build the HNSW index on ``table`` if missing or outdated."""
+        definition = self._vector_index_definition(conn, table)
+        if not vector_index_matches(definition, self.index_config):
+            self.build_vector_index(conn, tables=[table])
 
-        print("Data loaded successfully")
+    def _vector_index_definition(
+        self, conn: psycopg.Connection[Any], table: str = CHUNK_TABLE
+    ) -> str | None:
+        """``pg_get_indexdef`` of the HNSW index on ``table``, if any."""
+        result = conn.execute(
+            "SELECT pg_get_indexdef(to_regclass(%s))",
+            (f"elden.{vector_index_name(table)}",),
+        ).fetchone()
+        return result[0] if result else None
 
     def query_similar(
-        self, text: str, limit: int = 10, entity_type: str | None = None
+        self,
+        text: str,
+        limit: int = 10,
+        entity_type: str | None = None,
+        ef_search: int | None = None,
     ) -> list[dict[str, object]]:
         """
         Query similar entities using vector similarity.
@@ -148,10 +1036,93 @@ class PgVectorLoader:
             text: Query text
             limit: Number of results
             entity_type: Filter by entity type
+            ef_search: HNSW candidate list size for this query (default from
+                settings; larger values trade speed for recall)
 
         Returns:
             List of similar entities
         """
+        query_embedding = self._embed_query(text)
+
+        operator = self.index_config.distance_operator
+        where = "embedding IS NOT NULL"
+        params: list[object] = [query_embedding]
+        if entity_type:
+            where = f"entity_type = %s AND {where}"
+            params.append(entity_type)
+        params.append(limit)
+
+        with self._connect(row_factory=dict_row) as conn:
+            self._apply_ef_search(conn, ef_search)
+            results = conn.execute(
+                f"""
+                SELECT name, entity_type, text, is_dlc,
+                       embedding {operator} %b::vector AS distance
+                FROM elden.corpus_chunk
+                WHERE {where}
+                ORDER BY distance
+                LIMIT %s
+                """,
+                params,
+            ).fetchall()
+
+        return results
+
+    def hybrid_search(
+        self,
+        text: str,
+        limit: int = 10,
+        entity_type: str | None = None,
+        is_dlc: bool | None = None,
+        meta: dict[str, Any] | None = None,
+        candidate_pool: int = 50,
+        rrf_k: int = 60,
+        ef_search: int | None = None,
+    ) -> list[dict[str, object]]:
+        """
+        Query entities with full-text and vector ranking fused in Postgres.
+
+        Both rankings and the reciprocal rank fusion run in a single SQL
+        statement, and all filters are applied inside each ranking so the
+        database does the heavy lifting.
+
+        Args:
+            text: Query text (parsed with ``websearch_to_tsquery``)
+            limit: Number of results
+            entity_type: Filter by entity type
+            is_dlc: Filter by DLC flag
+            meta: JSONB containment filter applied to ``meta``
+            candidate_pool: Candidates taken from each ranking before fusion
+            rrf_k: Reciprocal rank fusion constant
+            ef_search: HNSW candidate list size for this query
+
+        Returns:
+            Fused matches with ``score``, ``vector_rank`` and ``text_rank``
+        """
+        query_embedding = self._embed_query(text)
+        search_sql, params = build_hybrid_search_sql(
+            distance_operator=self.index_config.distance_operator,
+            entity_type=entity_type,
+            is_dlc=is_dlc,
+            meta=meta,
+        )
+        params.update(
+            {
+                "query_vector": query_embedding,
+                "query_text": text,
+                "candidate_pool": max(candidate_pool, limit),
+                "rrf_k": rrf_k,
+                "limit": limit,
+            }
+        )
+
+        with self._connect(row_factory=dict_row) as conn:
+            self._apply_ef_search(conn, ef_search)
+            results = conn.execute(search_sql, params).fetchall()
+
+        return results
+
+    def _embed_query(self, text: str) -> np.ndarray:
         # Ensure embed_provider is valid for generating embeddings
         if settings.embed_provider == "none":
             raise ValueError(
@@ -164,35 +1135,129 @@ class PgVectorLoader:
         query_df = generate_embeddings(
             query_df, provider=settings.embed_provider
         )
-        query_embedding = json.loads(query_df.select("embedding").item(0, 0))
-
-        with psycopg.connect(self.dsn, row_factory=dict_row) as conn:
-            if entity_type:
-                results = conn.execute(
-                    """
-                    SELECT name, entity_type, text, is_dlc,
-                           embedding <-> %s::vector AS distance
-                    FROM elden.corpus_chunk
-                    WHERE entity_type = %s AND embedding IS NOT NULL
-                    ORDER BY distance
-                    LIMIT %s
-                    """,
-                    (query_embedding, entity_type, limit),
-                ).fetchall()
-            else:
-                results = conn.execute(
-                    """
-                    SELECT name, entity_type, text, is_dlc,
-                           embedding <-> %s::vector AS distance
-                    FROM elden.corpus_chunk
-                    WHERE embedding IS NOT NULL
-                    ORDER BY distance
-                    LIMIT %s
-                    """,
-                    (query_embedding, limit),
-                ).fetchall()
+        return embedding_matrix(query_df.get_column("embedding"))[0]
 
-        return results
+    def _apply_ef_search(
+        self, conn: psycopg.Connection[Any], ef_search: int | None
+    ) -> None:
+        resolved_ef_search = ef_search or settings.pgvector_ef_search
+        if resolved_ef_search:
+            conn.execute(
+                "SELECT set_config('hnsw.ef_search', %s, true)",
+                (str(resolved_ef_search),),
+            )
+
+
+def build_chunk_filters(
+    entity_type: str | None = None,
+    is_dlc: bool | None = None,
+    meta: dict[str, Any] | None = None,
+) -> tuple[list[str], dict[str, object]]:
+    """
+    Build SQL predicates and named parameters for chunk filters.
+
+    Args:
+        entity_type: Filter by entity type
+        is_dlc: Filter by DLC flag
+        meta: JSONB containment filter (uses the GIN index on ``meta``)
+
+    Returns:
+        Tuple of predicate strings and their named parameters
+    """
+    clauses: list[str] = []
+    params: dict[str, object] = {}
+    if entity_type:
+        clauses.append("entity_type = %(entity_type)s")
+        params["entity_type"] = entity_type
+    if is_dlc is not None:
+        clauses.append("is_dlc = %(is_dlc)s")
+        params["is_dlc"] = is_dlc
+    if meta:
+        clauses.append("meta @> %(meta)s::jsonb")
+        params["meta"] = json.dumps(meta)
+    return clauses, params
+
+
+def build_hybrid_search_sql(
+    distance_operator: str,
+    entity_type: str | None = None,
+    is_dlc: bool | None = None,
+    meta: dict[str, Any] | None = None,
+) -> tuple[str, dict[str, object]]:
+    """
+    Build the hybrid (tsvector + pgvector) reciprocal rank fusion query.
+
+    The caller supplies ``query_vector``, ``query_text``, ``candidate_pool``,
+    ``rrf_k`` and ``limit`` as additional named parameters.
+
+    Args:
+        distance_operator: pgvector operator matching the HNSW index
+        entity_type: Filter by entity type
+        is_dlc: Filter by DLC flag
+        meta: JSONB containment filter
+
+    Returns:
+        Tuple of SQL text and filter parameters
+    """
+    if distance_operator not in DISTANCE_OPERATORS.values():
+        raise ValueError(f"Unknown distance operator: {distance_operator}")
+
+    clauses, params = build_chunk_filters(entity_type, is_dlc, meta)
+    vector_where = " AND ".join(["embedding IS NOT NULL", *clauses])
+    text_where = " AND ".join(
+        ["to_tsvector('english', text) @@ query", *clauses]
+    )
+
+    search_sql = f"""
+        WITH vector_candidates AS (
+            SELECT id,
+                   embedding {distance_operator} %(query_vector)b::vector
+                       AS distance
+            FROM elden.corpus_chunk
+            WHERE {vector_where}
+            ORDER BY distance
+            LIMIT %(candidate_pool)s
+        ),
+        vector_ranked AS (
+            SELECT id, distance,
+                   ROW_NUMBER() OVER (ORDER BY distance) AS rank
+            FROM vector_candidates
+        ),
+        text_candidates AS (
+            SELECT id,
+                   ts_rank_cd(to_tsvector('english', text), query)
+                       AS text_score
+            FROM elden.corpus_chunk,
+                 websearch_to_tsquery('english', %(query_text)s) AS query
+            WHERE {text_where}
+            ORDER BY text_score DESC
+            LIMIT %(candidate_pool)s
+        ),
+        text_ranked AS (
+            SELECT id, text_score,
+                   ROW_NUMBER() OVER (ORDER BY text_score DESC) AS rank
+            FROM text_candidates
+        ),
+        fused AS (
+            SELECT COALESCE(v.id, t.id) AS id,
+                   COALESCE(1.0 / (%(rrf_k)s + v.rank), 0.0)
+                       + COALESCE(1.0 / (%(rrf_k)s + t.rank), 0.0) AS score,
+                   v.rank AS vector_rank,
+                   t.rank AS text_rank,
+                   v.distance,
+                   t.text_score
+            FROM vector_ranked v
+            FULL OUTER JOIN text_ranked t ON v.id = t.id
+        )
+        SELECT c.name, c.entity_type, c.game_entity_id, c.text, c.is_dlc,
+               c.meta, f.score, f.vector_rank, f.text_rank, f.distance,
+               f.text_score
+        FROM fused f
+        JOIN elden.corpus_chunk c ON c.id = f.id
+        ORDER BY f.score DESC, f.vector_rank NULLS LAST
+        LIMIT %(limit)s
+    """
+    return search_sql, params
 
 
 def load_to_postgres(
@@ -200,7 +1265,11 @@ def load_to_postgres(
     parquet_path: str | Path,
     create: bool = True,
     embed: bool = False,
-) -> None:
+    index_config: HNSWIndexConfig | None = None,
+    build_index: bool = True,
+    partitioned: bool | None = None,
+    workers: int = 1,
+) -> SyncReport:
     """
     Load corpus to PostgreSQL.
 
@@ -209,11 +1278,19 @@ def load_to_postgres(
         parquet_path: Path to unified.parquet
         create: Create schema first
         embed: Generate embeddings
+        index_config: HNSW build parameters (default from settings)
+        build_index: Rebuild the HNSW index after loading
+        partitioned: Partition ``corpus_chunk`` by entity type when creating
+            the schema (None follows an existing table)
+        workers: Connections used to load partitions concurrently
+
+    Returns:
+        Counts of inserted/updated/deleted/unchanged chunks
     """
-    loader = PgVectorLoader(dsn)
+    loader = PgVectorLoader(dsn, index_config=index_config)
 
     if create:
-        loader.create_schema()
+        loader.create_schema(partitioned=partitioned)
 
     # Only pass embed_provider if embed is True and provider is not "none"
     embed_provider: Literal["openai", "local"] | None = None
@@ -221,4 +1298,6 @@ def load_to_postgres(
         # Narrowing type through conditional check
         assert settings.embed_provider in ("openai", "local")
         embed_provider = settings.embed_provider
-    loader.load_data(parquet_path, embed_provider)
+    return loader.load_data(
+        parquet_path, embed_provider, build_index=build_index, workers=workers
+    )
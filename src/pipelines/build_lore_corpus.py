@@ -7,21 +7,47 @@ import fnmatch
 import hashlib
 import json
 import logging
+import multiprocessing
+import os
 import re
+import sys
+import time
 from collections import Counter, defaultdict
-from dataclasses import dataclass
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from re import Pattern
 from typing import Any, cast, no_type_check
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 import pandera as pa
-from bs4 import BeautifulSoup
+import pyarrow
+from corpus import impalers_dump
+from corpus import models as corpus_models
+from corpus.impalers_dump import load_impalers_entries
 from corpus.models import create_slug, normalize_name_for_matching
 from Levenshtein import ratio as levenshtein_ratio
 from pandera import Check, Column, DataFrameSchema
 
-from pipelines.io.carian_fmg_loader import load_carian_dialogue_lines
+from pipelines.io import carian_fmg_loader
+from pipelines.io.carian_fmg_loader import (
+    carian_dialogue_paths,
+    load_carian_dialogue_lines,
+)
+from pipelines.lore_domain_cache import (
+    ROW_SCHEMA,
+    CachedDomain,
+    LoreDomainCache,
+    code_fingerprint,
+    domain_cache_key,
+    lore_cache_dir_for,
+    rows_to_table,
+    tables_to_frame,
+)
+from pipelines.schema_loader import validate_with_mode, validation_modes
 
 LOGGER = logging.getLogger(__name__)
 
@@ -29,6 +55,18 @@ DEFAULT_CURATED_ROOT = Path("data/curated")
 DEFAULT_RAW_ROOT = Path("data/raw")
 DEFAULT_OUTPUT = Path("data/curated/lore_corpus.parquet")
 DEFAULT_ENTITY_ALIAS_PATH = Path("data/reference/entity_aliases.csv")
+IMPALERS_MATCH_THRESHOLD = 0.82
+CARIAN_DIALOGUE_DOMAIN = "carian_dialogue"
+IMPALERS_DOMAIN = "impalers"
+# Below this many rows, thread start-up costs more than lore id hashing
+LORE_ID_THREAD_ROWS = 100_000
+# Match slugs only hold [a-z0-9 ]; any other ASCII byte shares one bucket,
+# which can only loosen (never break) the histogram bound
+_SLUG_ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789 "
+_CHAR_BUCKETS = np.full(128, len(_SLUG_ALPHABET), dtype=np.intp)
+_CHAR_BUCKETS[[ord(char) for char in _SLUG_ALPHABET]] = np.arange(
+    len(_SLUG_ALPHABET)
+)
 
 ALLOWED_SOURCES = {
     "kaggle_base",
@@ -84,6 +122,58 @@ class EntityAlias:
     pattern_regex: Pattern[str]
 
 
+@dataclass(frozen=True, slots=True)
+class DomainTask:
+    """One domain to extract; plain paths so it pickles to a worker."""
+
+    domain: str
+    curated_root: Path
+    raw_root: Path
+
+
+@dataclass(slots=True)
+class DomainExtraction:
+    """Lore tables of every domain and which domains came from the cache."""
+
+    tables: list[pyarrow.Table] = field(default_factory=list)
+    cached: list[str] = field(default_factory=list)
+    extracted: list[str] = field(default_factory=list)
+    unmatched_impalers: int = 0
+
+
+@dataclass(frozen=True)
+class AliasMatcher:
+    """Entity aliases compiled for one lookup per distinct raw id.
+
+    Aliases are ranked by specificity (fewest wildcards, then longest
+    pattern, then file order). Patterns without wildcards resolve through
+    ``exact``; wildcard patterns are bucketed by their literal prefix so a
+    raw id only tests the regexes whose prefix it starts with.
+    """
+
+    exact: dict[str, tuple[EntityAlias, ...]]
+    by_prefix: dict[str, tuple[tuple[int, EntityAlias], ...]]
+    prefix_lengths: tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class MatchIndex:
+    """Canonical records of one category indexed for Impalers matching.
+
+    ``char_counts`` holds per-record character histograms of the ASCII
+    match slugs. The Levenshtein ratio is ``2 * LCS / (len_a + len_b)`` and the
+    LCS cannot exceed the shared character multiset, so the histograms give
+    an upper bound that rules out most records without scoring them.
+    """
+
+    records: list[dict[str, Any]]
+    exact: dict[str, int]
+    lengths: np.ndarray
+    char_counts: np.ndarray
+    # Non-ASCII slugs have no valid histogram bound; always score them
+    unbounded: np.ndarray
+
+
 DOMAIN_SPECS: tuple[DomainSpec, ...] = (
     DomainSpec(
         dataset="items",
@@ -139,6 +229,11 @@ DOMAIN_SPECS: tuple[DomainSpec, ...] = (
 )
 
 SPEC_BY_CATEGORY = {spec.category: spec for spec in DOMAIN_SPECS}
+LORE_DOMAINS: tuple[str, ...] = (
+    *(spec.category for spec in DOMAIN_SPECS),
+    CARIAN_DIALOGUE_DOMAIN,
+    IMPALERS_DOMAIN,
+)
 
 
 SECTION_CATEGORY = {
@@ -184,36 +279,41 @@ def build_lore_corpus(
     raw_root: Path,
     output_path: Path = DEFAULT_OUTPUT,
     dry_run: bool = False,
+    cache_dir: Path | None = None,
+    use_cache: bool = True,
+    workers: int = 1,
+    validation_mode: str = "full",
 ) -> pd.DataFrame:
-    """Aggregate lore lines from canonical datasets and Impalers dump."""
-
-    canonical_frames = {
-        spec.category: _load_domain_frame(spec, curated_root)
-        for spec in DOMAIN_SPECS
-    }
-    canonical_lookup = _build_canonical_lookup(canonical_frames)
-
-    lore_rows: list[dict[str, Any]] = []
-    for spec in DOMAIN_SPECS:
-        frame = canonical_frames[spec.category]
-        lore_rows.extend(_extract_canonical_lore(frame, spec))
-
-    carian_dialogue_rows = _load_carian_dialogue_lore(raw_root)
-    lore_rows.extend(carian_dialogue_rows)
-
-    impalers_entries = _parse_impalers_dump(
-        raw_root / "impalers" / "Master.html"
+    """Aggregate lore lines from canonical datasets and Impalers dump.
+
+    Each domain's extracted rows are cached under ``cache_dir`` (default:
+    next to ``output_path``), keyed by its input files and the extraction
+    code, so only domains whose inputs changed are re-extracted. Stale
+    domains are extracted on ``workers`` processes (0 = one per CPU core).
+    ``validation_mode`` picks how ``LORE_SCHEMA`` is enforced ("full",
+    "fast" or "sample"); failures raise the same pandera report either way.
+    """
+
+    cache = (
+        LoreDomainCache(cache_dir or lore_cache_dir_for(output_path))
+        if use_cache
+        else None
     )
-    matched_impalers, unmatched = _match_impalers_entries(
-        entries=impalers_entries,
-        canonical_lookup=canonical_lookup,
+    extraction = _extract_domains(
+        curated_root=curated_root,
+        raw_root=raw_root,
+        cache=cache,
+        write_cache=not dry_run,
+        workers=workers,
     )
-    lore_rows.extend(matched_impalers)
+    unmatched_count = extraction.unmatched_impalers
 
-    if not lore_rows:
+    if not extraction.tables or not any(
+        table.num_rows for table in extraction.tables
+    ):
         raise RuntimeError("No lore rows were produced")
 
-    lore_df = pd.DataFrame(lore_rows)
+    lore_df = tables_to_frame(extraction.tables)
     lore_df.drop_duplicates(subset=["lore_id"], inplace=True)
     lore_df["raw_canonical_id"] = lore_df["canonical_id"]
 
@@ -222,27 +322,25 @@ def build_lore_corpus(
     if replacements:
         changed_mask = lore_df["canonical_id"] != lore_df["raw_canonical_id"]
         if changed_mask.any():
-            lore_df.loc[changed_mask, "lore_id"] = [
-                _compute_lore_id(
-                    row["canonical_id"],
-                    row["text_type"],
-                    row["text"],
-                )
-                for _, row in lore_df.loc[changed_mask].iterrows()
-            ]
+            changed = lore_df.loc[changed_mask]
+            lore_df.loc[changed_mask, "lore_id"] = _compute_lore_ids(
+                changed["canonical_id"].tolist(),
+                changed["text_type"].tolist(),
+                changed["text"].tolist(),
+            )
         lore_df.drop_duplicates(subset=["lore_id"], inplace=True)
 
     lore_df.sort_values(["canonical_id", "text_type", "source"], inplace=True)
     lore_df.reset_index(drop=True, inplace=True)
 
     try:
-        validated = LORE_SCHEMA.validate(lore_df, lazy=True)
+        validated = validate_with_mode(LORE_SCHEMA, lore_df, validation_mode)
     except pa.errors.SchemaErrors as exc:
         LOGGER.error("Lore schema validation failed: %s", exc)
         raise
 
     validated_df = cast(pd.DataFrame, validated)
-    _log_corpus_stats(validated_df, unmatched)
+    _log_corpus_stats(validated_df, unmatched_count)
 
     if dry_run:
         LOGGER.info("Dry run enabled; skipping parquet write")
@@ -255,6 +353,146 @@ def build_lore_corpus(
     return validated_df
 
 
+def _extract_domains(
+    *,
+    curated_root: Path,
+    raw_root: Path,
+    cache: LoreDomainCache | None,
+    write_cache: bool = True,
+    workers: int = 1,
+) -> DomainExtraction:
+    """Collect every domain's lore rows, reusing cached domains when valid.
+
+    Stale domains are independent, so with ``workers > 1`` they run on a
+    process pool; results are still merged in ``LORE_DOMAINS`` order.
+    """
+
+    if workers < 0:
+        raise ValueError("workers must be zero (all cores) or positive")
+    code_version = _extraction_code_version() if cache else ""
+
+    results: dict[str, CachedDomain] = {}
+    keys: dict[str, str] = {}
+    extraction = DomainExtraction()
+    for domain in LORE_DOMAINS:
+        if cache is None:
+            continue
+        keys[domain] = domain_cache_key(
+            domain,
+            _domain_inputs(domain, curated_root, raw_root),
+            code_version=code_version,
+        )
+        cached = cache.load(domain, keys[domain])
+        if cached is not None:
+            results[domain] = cached
+            extraction.cached.append(domain)
+
+    tasks = [
+        DomainTask(domain, curated_root, raw_root)
+        for domain in LORE_DOMAINS
+        if domain not in results
+    ]
+    pool_size = min(workers or os.cpu_count() or 1, len(tasks))
+    started = time.perf_counter()
+    if pool_size > 1:
+        with ProcessPoolExecutor(
+            max_workers=pool_size,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            outcomes = list(pool.map(_run_domain_task, tasks))
+    else:
+        outcomes = [_run_domain_task(task) for task in tasks]
+
+    for task, (result, seconds) in zip(tasks, outcomes, strict=True):
+        LOGGER.info(
+            "Extracted %s lore rows for %s in %.2fs",
+            result.table.num_rows,
+            task.domain,
+            seconds,
+        )
+        results[task.domain] = result
+        extraction.extracted.append(task.domain)
+        if cache is not None and write_cache:
+            cache.store(
+                task.domain, keys[task.domain], result.table, result.metadata
+            )
+    if tasks:
+        LOGGER.info(
+            "Extracted %s lore domains on %s process(es) in %.2fs",
+            len(tasks),
+            max(pool_size, 1),
+            time.perf_counter() - started,
+        )
+
+    for domain in LORE_DOMAINS:
+        extraction.tables.append(results[domain].table)
+    extraction.unmatched_impalers = int(
+        results[IMPALERS_DOMAIN].metadata.get("unmatched", 0)
+    )
+    if cache is not None:
+        LOGGER.info(
+            "Lore domains from cache: %s; re-extracted: %s",
+            ", ".join(extraction.cached) or "none",
+            ", ".join(extraction.extracted) or "none",
+        )
+    return extraction
+
+
+def _domain_inputs(
+    domain: str, curated_root: Path, raw_root: Path
+) -> list[Path]:
+    canonical_paths = [curated_root / spec.file_name for spec in DOMAIN_SPECS]
+    if domain == CARIAN_DIALOGUE_DOMAIN:
+        return carian_dialogue_paths(raw_root)
+    if domain == IMPALERS_DOMAIN:
+        # Matching depends on every canonical table, not just the dump
+        return [_impalers_path(raw_root), *canonical_paths]
+    return [curated_root / SPEC_BY_CATEGORY[domain].file_name]
+
+
+def _impalers_path(raw_root: Path) -> Path:
+    return raw_root / "impalers" / "Master.html"
+
+
+def _run_domain_task(task: DomainTask) -> tuple[CachedDomain, float]:
+    """Extract one domain; runs in a worker process when parallel."""
+
+    started = time.perf_counter()
+    metadata: dict[str, str] = {}
+    if task.domain == CARIAN_DIALOGUE_DOMAIN:
+        rows = _load_carian_dialogue_lore(task.raw_root)
+    elif task.domain == IMPALERS_DOMAIN:
+        canonical_lookup = _build_canonical_lookup(
+            {
+                spec.category: _load_domain_frame(spec, task.curated_root)
+                for spec in DOMAIN_SPECS
+            }
+        )
+        rows, unmatched = _match_impalers_entries(
+            entries=_parse_impalers_dump(_impalers_path(task.raw_root)),
+            canonical_lookup=canonical_lookup,
+        )
+        metadata["unmatched"] = str(len(unmatched))
+    else:
+        spec = SPEC_BY_CATEGORY[task.domain]
+        table = _extract_canonical_lore(
+            _load_domain_frame(spec, task.curated_root), spec
+        )
+        return CachedDomain(table, metadata), time.perf_counter() - started
+    table = rows_to_table(rows)
+    return CachedDomain(table, metadata), time.perf_counter() - started
+
+
+def _extraction_code_version() -> str:
+    modules = (
+        sys.modules[__name__],
+        carian_fmg_loader,
+        impalers_dump,
+        corpus_models,
+    )
+    return code_fingerprint(Path(str(module.__file__)) for module in modules)
+
+
 def _load_domain_frame(spec: DomainSpec, curated_root: Path) -> pd.DataFrame:
     path = curated_root / spec.file_name
     if not path.exists():
@@ -273,57 +511,205 @@ def _load_domain_frame(spec: DomainSpec, curated_root: Path) -> pd.DataFrame:
 def _extract_canonical_lore(
     frame: pd.DataFrame,
     spec: DomainSpec,
-) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
+) -> pyarrow.Table:
+    """Melt a canonical frame's text fields into lore rows.
+
+    Works column by column: text is normalised with vectorised string ops,
+    canonical ids and provenance JSON are assembled from per-record pieces
+    and lore ids are hashed in one batch. Rows come out record by record,
+    then in ``spec.text_fields`` order, byte-identical to building a dict
+    and calling ``json.dumps`` per (record, field).
+    """
+    frame = frame.reset_index(drop=True)
+    canonical_ids = _canonical_id_column(frame, spec)
+    sources = _source_column(frame)
+    provenance_head = _provenance_head(frame, sources)
+
+    blocks: list[pd.DataFrame] = []
+    for order, text_field in enumerate(spec.text_fields):
+        if text_field.column not in frame.columns:
+            continue
+        text = _normalize_text_column(frame[text_field.column]).to_numpy()
+        keep = text != ""
+        if not keep.any():
+            continue
+        column_json = json.dumps(text_field.column, ensure_ascii=False)
+        blocks.append(
+            pd.DataFrame(
+                {
+                    "record": np.flatnonzero(keep),
+                    "field": order,
+                    "canonical_id": canonical_ids[keep],
+                    "source": sources[keep],
+                    "text_type": text_field.text_type,
+                    "text": text[keep],
+                    "provenance": provenance_head[keep]
+                    + f'"text_column": {column_json}}}',
+                }
+            )
+        )
+    if not blocks:
+        return rows_to_table([])
+
+    lore = pd.concat(blocks, ignore_index=True)
+    lore.sort_values(["record", "field"], inplace=True)
+    lore["lore_id"] = _compute_lore_ids(
+        lore["canonical_id"].tolist(),
+        lore["text_type"].tolist(),
+        lore["text"].tolist(),
+    )
+    lore["category"] = spec.category
+    lore["language"] = "en"
+    return pyarrow.Table.from_pandas(
+        lore[ROW_SCHEMA.names], schema=ROW_SCHEMA, preserve_index=False
+    )
 
-    records = cast(list[dict[str, Any]], frame.to_dict("records"))
-    for record in records:
-        canonical_id = _build_canonical_id(record, spec)
-        for field in spec.text_fields:
-            raw_text = record.get(field.column)
-            text = _normalize_text(raw_text)
-            if not text:
-                continue
 
-            source = str(record.get("source") or "").strip() or "github_api"
-            if source not in ALLOWED_SOURCES:
-                source = "github_api"
+def _canonical_id_column(
+    frame: pd.DataFrame, spec: DomainSpec
+) -> npt.NDArray[np.object_]:
+    canonical_ids = np.empty(len(frame), dtype=object)
+    if spec.id_column in frame.columns:
+        ids = frame[spec.id_column]
+        present = ids.notna().to_numpy()
+    else:
+        ids = pd.Series(dtype=object)
+        present = np.zeros(len(frame), dtype=bool)
+    if present.any():
+        values = ids[present]
+        numbers = (
+            values.astype("int64")
+            if pd.api.types.is_numeric_dtype(values)
+            else values.map(int)
+        )
+        canonical_ids[present] = (
+            f"{spec.category}:" + numbers.astype(str)
+        ).to_numpy()
+    if not present.all():
+        # Records without an id fall back to their slug
+        records = cast(
+            list[dict[str, Any]], frame.loc[~present].to_dict("records")
+        )
+        canonical_ids[~present] = [
+            _build_canonical_id(record, spec) for record in records
+        ]
+    return canonical_ids
 
-            payload = {
-                "source": source,
-                "source_id": record.get("source_id"),
-                "source_priority": record.get("source_priority"),
-                "text_column": field.column,
-            }
 
-            provenance_value = record.get("provenance")
-            if provenance_value:
-                try:
-                    payload["canonical_provenance"] = json.loads(
-                        provenance_value
-                    )
-                except (TypeError, json.JSONDecodeError):
-                    payload["canonical_provenance"] = provenance_value
-
-            lore_id = _compute_lore_id(canonical_id, field.text_type, text)
-            rows.append(
-                {
-                    "lore_id": lore_id,
-                    "canonical_id": canonical_id,
-                    "category": spec.category,
-                    "source": source,
-                    "text_type": field.text_type,
-                    "language": "en",
-                    "text": text,
-                    "provenance": json.dumps(
-                        payload,
-                        ensure_ascii=False,
-                        sort_keys=True,
-                    ),
-                }
-            )
+def _source_column(frame: pd.DataFrame) -> npt.NDArray[np.object_]:
+    if "source" not in frame.columns:
+        return np.full(len(frame), "github_api", dtype=object)
+    column = frame["source"]
+    resolved = {value: _lore_source(value) for value in column.unique()}
+    return column.map(resolved).to_numpy(dtype=object)
 
-    return rows
+
+def _lore_source(value: Any) -> str:
+    source = str(value or "").strip() or "github_api"
+    return source if source in ALLOWED_SOURCES else "github_api"
+
+
+def _provenance_head(
+    frame: pd.DataFrame, sources: npt.NDArray[np.object_]
+) -> npt.NDArray[np.object_]:
+    """Every provenance key but ``text_column``, as sorted JSON fragments."""
+
+    opening = np.array(
+        [
+            "{" if value is None else f'{{"canonical_provenance": {value}, '
+            for value in _canonical_provenance_json(frame)
+        ],
+        dtype=object,
+    )
+    source_json = {
+        source: json.dumps(source, ensure_ascii=False)
+        for source in set(sources.tolist())
+    }
+    return (
+        opening
+        + '"source": '
+        + np.array([source_json[source] for source in sources], dtype=object)
+        + ', "source_id": '
+        + _json_scalars(frame, "source_id")
+        + ', "source_priority": '
+        + _json_scalars(frame, "source_priority")
+        + ", "
+    )
+
+
+def _canonical_provenance_json(
+    frame: pd.DataFrame,
+) -> npt.NDArray[np.object_]:
+    encoded = np.full(len(frame), None, dtype=object)
+    if "provenance" not in frame.columns:
+        return encoded
+    memo: dict[str, str] = {}
+    for position, value in enumerate(_native_values(frame["provenance"])):
+        if not value:
+            continue
+        if isinstance(value, str) and value in memo:
+            encoded[position] = memo[value]
+            continue
+        try:
+            parsed = json.loads(value)
+        except (TypeError, json.JSONDecodeError):
+            parsed = value
+        result = json.dumps(parsed, ensure_ascii=False, sort_keys=True)
+        if isinstance(value, str):
+            memo[value] = result
+        encoded[position] = result
+    return encoded
+
+
+def _json_scalars(frame: pd.DataFrame, column: str) -> npt.NDArray[np.object_]:
+    if column not in frame.columns:
+        return np.full(len(frame), "null", dtype=object)
+    memo: dict[tuple[type, Any], str] = {}
+    encoded = np.empty(len(frame), dtype=object)
+    for position, value in enumerate(_native_values(frame[column])):
+        try:
+            key = (type(value), value)
+            result = memo.get(key)
+        except TypeError:
+            key, result = None, None
+        if result is None:
+            result = json.dumps(value, ensure_ascii=False, sort_keys=True)
+            if key is not None:
+                memo[key] = result
+        encoded[position] = result
+    return encoded
+
+
+def _native_values(column: pd.Series) -> list[Any]:
+    """Column values boxed the way ``DataFrame.to_dict`` boxes them."""
+
+    values = column.tolist()
+    if column.dtype == object:
+        return [
+            value.item() if isinstance(value, np.generic) else value
+            for value in values
+        ]
+    return values
+
+
+def _normalize_text_column(values: pd.Series) -> pd.Series:
+    """Vectorised :func:`_normalize_text`; missing values become ``""``."""
+
+    text = values.astype(str)
+    missing = np.flatnonzero(values.isna().to_numpy())
+    if len(missing):
+        # NaN stringifies like str(); only None counts as empty
+        raw = values.to_numpy(dtype=object)
+        text.iloc[missing] = [
+            "" if raw[position] is None else str(raw[position])
+            for position in missing
+        ]
+    return (
+        text.str.replace(r"\r\n?", "\n", regex=True)
+        .str.replace(r"[ \t]+", " ", regex=True)
+        .str.replace(r"\n{2,}", "\n", regex=True)
+        .str.strip()
+    )
 
 
 def _load_carian_dialogue_lore(raw_root: Path) -> list[dict[str, Any]]:
@@ -351,7 +737,6 @@ def _load_carian_dialogue_lore(raw_root: Path) -> list[dict[str, Any]]:
             canonical_id = f"npc:{speaker_slug}"
 
         source = str(entry.get("source") or "carian_dialogue_fmg")
-        lore_id = _compute_lore_id(canonical_id, "dialogue", text)
         provenance = {
             "source": source,
             "talk_id": entry.get("talk_id"),
@@ -365,7 +750,6 @@ def _load_carian_dialogue_lore(raw_root: Path) -> list[dict[str, Any]]:
 
         rows.append(
             {
-                "lore_id": lore_id,
                 "canonical_id": canonical_id,
                 "category": "npc",
                 "source": source,
@@ -380,6 +764,7 @@ def _load_carian_dialogue_lore(raw_root: Path) -> list[dict[str, Any]]:
             }
         )
 
+    _assign_lore_ids(rows)
     LOGGER.info("Loaded %s Carian dialogue lines", len(rows))
     return rows
 
@@ -389,65 +774,12 @@ def _parse_impalers_dump(html_path: Path) -> list[dict[str, Any]]:
         LOGGER.warning("Impalers HTML not found at %s", html_path)
         return []
 
-    soup = BeautifulSoup(html_path.read_text(encoding="utf-8"), "html.parser")
     entries: list[dict[str, Any]] = []
-
-    current_section: str | None = None
-    current_category: str | None = None
-    current_entry: dict[str, Any] | None = None
-
-    for node in soup.find_all(["h2", "h3", "p"]):
-        if node.name == "h2":
-            current_section = node.get_text(strip=True)
-            section_base = _section_base(current_section)
-            current_category = (
-                SECTION_CATEGORY.get(section_base) if section_base else None
-            )
-            current_entry = None
-            continue
-
-        if current_category is None:
-            continue
-
-        if node.name == "h3":
-            if current_entry and current_entry.get("paragraphs"):
-                entries.append(current_entry)
-            name, entry_id = _parse_heading(node.get_text(" ", strip=True))
-            current_entry = {
-                "name": name,
-                "entry_id": entry_id,
-                "section": current_section,
-                "category": current_category,
-                "paragraphs": [],
-            }
-            continue
-
-        if node.name == "p":
-            text = node.get_text(" ", strip=True)
-            if not text:
-                continue
-
-            if current_entry is None:
-                # Some sections emit names via <p>[123] Name
-                parsed = _parse_name_from_paragraph(text)
-                if parsed:
-                    name, entry_id = parsed
-                    current_entry = {
-                        "name": name,
-                        "entry_id": entry_id,
-                        "section": current_section,
-                        "category": current_category,
-                        "paragraphs": [],
-                    }
-                    continue
-
-            if current_entry is None:
-                continue
-
-            current_entry.setdefault("paragraphs", []).append(text)
-
-    if current_entry and current_entry.get("paragraphs"):
-        entries.append(current_entry)
+    for entry in load_impalers_entries(html_path):
+        section_base = _section_base(entry["section"])
+        category = SECTION_CATEGORY.get(section_base) if section_base else None
+        if category is not None:
+            entries.append({**entry, "category": category})
 
     LOGGER.info("Parsed %s Impalers entries", len(entries))
     return entries
@@ -458,6 +790,14 @@ def _match_impalers_entries(
     entries: list[dict[str, Any]],
     canonical_lookup: dict[str, list[dict[str, Any]]],
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Attach Impalers entries to the best-matching canonical record.
+
+    An exact match_slug wins outright; otherwise the highest Levenshtein
+    ratio at or above ``IMPALERS_MATCH_THRESHOLD`` wins, ties going to the
+    first record of the category. Only records whose character histogram
+    could reach the threshold are scored, so an unmatched entry's
+    ``match_score`` is the best score among those records.
+    """
     matched_rows: list[dict[str, Any]] = []
     unmatched_entries: list[dict[str, Any]] = []
 
@@ -465,29 +805,26 @@ def _match_impalers_entries(
     for bucket in canonical_lookup.values():
         for record in bucket:
             by_category[record["category"]].append(record)
+    indexes = {
+        category: _build_match_index(records)
+        for category, records in by_category.items()
+    }
 
+    pairs = 0
+    scored = 0
     for entry in entries:
         category = entry["category"]
-        candidates = by_category.get(category, [])
-        if not candidates:
+        index = indexes.get(category)
+        if index is None:
             unmatched_entries.append(entry)
             continue
 
         name_slug = normalize_name_for_matching(entry["name"])
-        best_record: dict[str, Any] | None = None
-        best_score = 0.0
-        for record in candidates:
-            slug = record["match_slug"]
-            if slug == name_slug:
-                best_record = record
-                best_score = 1.0
-                break
-            score = levenshtein_ratio(name_slug, slug)
-            if score > best_score:
-                best_record = record
-                best_score = score
-
-        if best_record is None or best_score < 0.82:
+        pairs += len(index.records)
+        best_record, best_score, compared = _best_match(index, name_slug)
+        scored += compared
+
+        if best_record is None or best_score < IMPALERS_MATCH_THRESHOLD:
             entry["match_score"] = best_score
             unmatched_entries.append(entry)
             continue
@@ -497,7 +834,6 @@ def _match_impalers_entries(
             continue
 
         canonical_id = best_record["canonical_id"]
-        lore_id = _compute_lore_id(canonical_id, "impalers_excerpt", text)
         provenance = {
             "source": "impalers",
             "section": entry.get("section"),
@@ -506,7 +842,6 @@ def _match_impalers_entries(
         }
         matched_rows.append(
             {
-                "lore_id": lore_id,
                 "canonical_id": canonical_id,
                 "category": category,
                 "source": "impalers",
@@ -521,9 +856,76 @@ def _match_impalers_entries(
             }
         )
 
+    if pairs:
+        LOGGER.info(
+            "Impalers matching scored %s of %s candidate pairs "
+            "(%s comparisons avoided)",
+            scored,
+            pairs,
+            pairs - scored,
+        )
+    _assign_lore_ids(matched_rows)
     return matched_rows, unmatched_entries
 
 
+def _build_match_index(records: list[dict[str, Any]]) -> MatchIndex:
+    exact: dict[str, int] = {}
+    counts = np.zeros((len(records), len(_SLUG_ALPHABET) + 1), dtype=np.int32)
+    lengths = np.zeros(len(records), dtype=np.int64)
+    unbounded = np.zeros(len(records), dtype=bool)
+    for position, record in enumerate(records):
+        slug = record["match_slug"]
+        exact.setdefault(slug, position)
+        lengths[position] = len(slug)
+        if slug.isascii():
+            counts[position] = _char_histogram(slug)
+        else:
+            unbounded[position] = True
+    return MatchIndex(
+        records=records,
+        exact=exact,
+        lengths=lengths,
+        char_counts=counts,
+        unbounded=unbounded,
+    )
+
+
+def _best_match(
+    index: MatchIndex, name_slug: str
+) -> tuple[dict[str, Any] | None, float, int]:
+    """Return the best record, its score and how many records were scored."""
+
+    position = index.exact.get(name_slug)
+    if position is not None:
+        return index.records[position], 1.0, 0
+
+    if name_slug.isascii():
+        overlap = np.minimum(index.char_counts, _char_histogram(name_slug))
+        totals = index.lengths + len(name_slug)
+        bound = 2.0 * overlap.sum(axis=1) / np.maximum(totals, 1)
+        # Small tolerance so float rounding never drops a borderline match
+        candidates = np.flatnonzero(
+            (bound >= IMPALERS_MATCH_THRESHOLD - 1e-9) | index.unbounded
+        )
+    else:
+        candidates = np.arange(len(index.records))
+
+    best_record: dict[str, Any] | None = None
+    best_score = 0.0
+    for position in candidates.tolist():
+        record = index.records[position]
+        score = levenshtein_ratio(name_slug, record["match_slug"])
+        if score > best_score:
+            best_record = record
+            best_score = score
+    return best_record, best_score, len(candidates)
+
+
+def _char_histogram(text: str) -> np.ndarray:
+    codes = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    return np.bincount(_CHAR_BUCKETS[codes], minlength=len(_SLUG_ALPHABET) + 1)
+
+
 def _build_canonical_lookup(
     frames: dict[str, pd.DataFrame],
 ) -> dict[str, list[dict[str, Any]]]:
@@ -580,6 +982,76 @@ def _compute_lore_id(canonical_id: str, text_type: str, text: str) -> str:
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
 
 
+def _compute_lore_ids(
+    canonical_ids: Sequence[str],
+    text_types: Sequence[str],
+    texts: Sequence[str],
+    *,
+    threads: int | None = None,
+) -> list[str]:
+    """
+    Batch :func:`_compute_lore_id` over aligned columns.
+
+    Frames of at least ``LORE_ID_THREAD_ROWS`` rows are split into one
+    contiguous chunk per thread. hashlib releases the GIL while hashing
+    payloads over 2 KiB, so long texts hash concurrently. The ids come
+    back in input order either way.
+
+    Args:
+        canonical_ids: Canonical id per row
+        text_types: Text type per row
+        texts: Normalized text per row
+        threads: Hashing threads (default: one per CPU core)
+
+    Returns:
+        Lore ids aligned with the inputs
+    """
+    total = len(texts)
+    if len(canonical_ids) != total or len(text_types) != total:
+        raise ValueError("Lore id columns must have the same length")
+    threads = min(threads or os.cpu_count() or 1, total)
+    if threads <= 1 or total < LORE_ID_THREAD_ROWS:
+        return _hash_lore_rows(canonical_ids, text_types, texts)
+
+    chunk = -(-total // threads)
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        parts = pool.map(
+            lambda start: _hash_lore_rows(
+                canonical_ids[start : start + chunk],
+                text_types[start : start + chunk],
+                texts[start : start + chunk],
+            ),
+            range(0, total, chunk),
+        )
+        return [lore_id for part in parts for lore_id in part]
+
+
+def _hash_lore_rows(
+    canonical_ids: Sequence[str],
+    text_types: Sequence[str],
+    texts: Sequence[str],
+) -> list[str]:
+    sha256 = hashlib.sha256
+    return [
+        sha256(f"{canonical_id}|{text_type}|{text}".encode()).hexdigest()[:16]
+        for canonical_id, text_type, text in zip(
+            canonical_ids, text_types, texts, strict=True
+        )
+    ]
+
+
+def _assign_lore_ids(rows: list[dict[str, Any]]) -> None:
+    """Fill ``lore_id`` on extracted row dicts in one batch."""
+
+    lore_ids = _compute_lore_ids(
+        [row["canonical_id"] for row in rows],
+        [row["text_type"] for row in rows],
+        [row["text"] for row in rows],
+    )
+    for row, lore_id in zip(rows, lore_ids, strict=True):
+        row["lore_id"] = lore_id
+
+
 def _load_entity_aliases(path: Path) -> list[EntityAlias]:
     if not path.exists():
         LOGGER.info("Entity alias file not found at %s; skipping", path)
@@ -633,48 +1105,83 @@ def _apply_entity_aliases(
     if "raw_canonical_id" not in frame.columns:
         frame["raw_canonical_id"] = frame["canonical_id"]
 
-    def _alias_specificity(alias: EntityAlias) -> tuple[int, int]:
-        wildcard_chars = sum(alias.raw_pattern.count(ch) for ch in "*?")
-        wildcard_chars += alias.raw_pattern.count("[")
-        return (wildcard_chars, -len(alias.raw_pattern))
+    matcher = _build_alias_matcher(aliases)
+    unchanged_mask = frame["canonical_id"] == frame["raw_canonical_id"]
+    resolved: dict[Any, str] = {}
+    applied: dict[Any, int] = {}
+    for raw in frame.loc[unchanged_mask, "raw_canonical_id"].unique():
+        canonical_id, hits = _resolve_alias(matcher, raw)
+        if canonical_id is not None:
+            resolved[raw] = canonical_id
+            applied[raw] = hits
 
     replacements = 0
-    for alias in sorted(aliases, key=_alias_specificity):
-        raw_mask = (
-            frame["raw_canonical_id"]
-            .astype(str)
-            .str.match(alias.pattern_regex)
-        )
-        if not raw_mask.any():
-            continue
-        unchanged_mask = frame["canonical_id"] == frame["raw_canonical_id"]
-        target_mask = raw_mask & unchanged_mask
-        if not target_mask.any():
-            continue
-        frame.loc[target_mask, "canonical_id"] = alias.canonical_id
-        replacements += int(target_mask.sum())
+    if resolved:
+        raw_ids = frame["raw_canonical_id"]
+        target_mask = unchanged_mask & raw_ids.isin(list(resolved))
+        targets = raw_ids[target_mask]
+        frame.loc[target_mask, "canonical_id"] = targets.map(
+            resolved
+        ).to_numpy()
+        replacements = int(targets.map(applied).sum())
 
     if replacements:
         LOGGER.info("Applied entity aliases to %s lore rows", replacements)
     return replacements
 
 
-def _parse_heading(raw: str) -> tuple[str, str | None]:
-    match = re.match(r"^(.*)\[(\d+)]$", raw)
-    if match:
-        name = match.group(1).strip()
-        entry_id = match.group(2)
-    else:
-        name = raw.strip()
-        entry_id = None
-    return name, entry_id
+def _alias_specificity(alias: EntityAlias) -> tuple[int, int]:
+    wildcard_chars = sum(alias.raw_pattern.count(ch) for ch in "*?")
+    wildcard_chars += alias.raw_pattern.count("[")
+    return (wildcard_chars, -len(alias.raw_pattern))
 
 
-def _parse_name_from_paragraph(raw: str) -> tuple[str, str] | None:
-    match = re.match(r"^\[(\d+)]\s*(.+)$", raw)
-    if not match:
-        return None
-    return match.group(2).strip(), match.group(1)
+def _build_alias_matcher(aliases: list[EntityAlias]) -> AliasMatcher:
+    exact: defaultdict[str, list[EntityAlias]] = defaultdict(list)
+    by_prefix: defaultdict[str, list[tuple[int, EntityAlias]]] = defaultdict(
+        list
+    )
+    for rank, alias in enumerate(sorted(aliases, key=_alias_specificity)):
+        prefix = re.split(r"[*?\[]", alias.raw_pattern, maxsplit=1)[0]
+        if prefix == alias.raw_pattern:
+            exact[prefix].append(alias)
+        else:
+            by_prefix[prefix].append((rank, alias))
+    return AliasMatcher(
+        exact={key: tuple(value) for key, value in exact.items()},
+        by_prefix={key: tuple(value) for key, value in by_prefix.items()},
+        prefix_lengths=tuple(sorted({len(key) for key in by_prefix})),
+    )
+
+
+def _resolve_alias(matcher: AliasMatcher, raw: Any) -> tuple[str | None, int]:
+    """Return the canonical id ``raw`` ends up with and the aliases applied.
+
+    Mirrors applying every alias in specificity order to rows still equal to
+    their raw id: the first matching alias wins, unless it maps the id onto
+    itself, in which case the row stays eligible for the next match.
+    """
+
+    raw_text = str(raw)
+    candidates = list(matcher.exact.get(raw_text, ()))
+    wildcard: list[tuple[int, EntityAlias]] = []
+    for length in matcher.prefix_lengths:
+        if length > len(raw_text):
+            break
+        wildcard.extend(matcher.by_prefix.get(raw_text[:length], ()))
+    wildcard.sort(key=lambda item: item[0])
+    candidates.extend(alias for _, alias in wildcard)
+
+    canonical_id: str | None = None
+    hits = 0
+    for alias in candidates:
+        if not alias.pattern_regex.match(raw_text):
+            continue
+        canonical_id = alias.canonical_id
+        hits += 1
+        if canonical_id != raw:
+            break
+    return canonical_id, hits
 
 
 def _section_base(section: str | None) -> str | None:
@@ -683,10 +1190,7 @@ def _section_base(section: str | None) -> str | None:
     return section.split("_")[0]
 
 
-def _log_corpus_stats(
-    df: pd.DataFrame,
-    unmatched: list[dict[str, Any]],
-) -> None:
+def _log_corpus_stats(df: pd.DataFrame, unmatched_count: int) -> None:
     LOGGER.info("Lore lines total: %s", len(df))
     for label, series in (
         ("by source", df["source"]),
@@ -701,8 +1205,8 @@ def _log_corpus_stats(
 
     impaler_count = len(df[df["source"] == "impalers"])
     LOGGER.info("Impalers matched entries: %s", impaler_count)
-    if unmatched:
-        LOGGER.warning("Impalers unmatched entries: %s", len(unmatched))
+    if unmatched_count:
+        LOGGER.warning("Impalers unmatched entries: %s", unmatched_count)
 
     multi_source = df.groupby("canonical_id")["source"].nunique()
     enriched = multi_source[multi_source > 1].head(5).index.tolist()
@@ -735,6 +1239,32 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Skip writes and report stats only",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Per-domain extraction cache (default: next to --output)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Processes extracting stale lore domains concurrently "
+            "(0 = one per CPU core)"
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-extract every domain without reading or writing the cache",
+    )
+    parser.add_argument(
+        "--validate",
+        choices=validation_modes(),
+        default="full",
+        help="Schema validation mode (fast/sample trade rigour for speed)",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -758,6 +1288,10 @@ def main() -> None:
             raw_root=args.raw_root,
             output_path=args.output,
             dry_run=args.dry_run,
+            cache_dir=args.cache_dir,
+            use_cache=not args.no_cache,
+            workers=args.workers,
+            validation_mode=args.validate,
         )
     except Exception as exc:  # noqa: BLE001
         LOGGER.error("Lore corpus pipeline failed: %s", exc)
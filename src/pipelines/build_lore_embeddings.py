@@ -9,19 +9,48 @@
 from __future__ import annotations
 
 import argparse
+import json
 import logging
 import statistics
-from collections.abc import Mapping, Sequence
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal, Protocol, SupportsFloat, cast
 
+import numpy as np
 import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
 import yaml
 from corpus.config import settings
+from corpus.embeddings import (
+    arrow_embedding_matrix,
+    fixed_size_embedding_array,
+)
 
 from pipelines import rag_guard
-from pipelines.embedding_backends import EncoderConfig, create_encoder
+from pipelines.embedding_backends import (
+    EmbeddingMatrix,
+    EncoderConfig,
+    TokenCounter,
+    as_embedding_matrix,
+    batch_by_token_budget,
+    create_encoder,
+    estimate_tokens,
+)
+from pipelines.embedding_cache import (
+    BLOCK_HASHES_COLUMN,
+    DEFAULT_CACHE_PATH,
+    INPUT_HASH_COLUMN,
+    EmbeddingCache,
+    embedding_input_hash,
+)
+from pipelines.embedding_checkpoint import (
+    EmbeddingCheckpoint,
+    checkpoint_dir_for,
+)
 
 ProviderName = Literal["local", "openai"]
 
@@ -29,8 +58,8 @@ ProviderName = Literal["local", "openai"]
 class EncoderProtocol(Protocol):
     """Local protocol for embedding encoders."""
 
-    def encode(self, texts: Sequence[str]) -> list[list[float]]:
-        """Encode input texts into vectors."""
+    def encode(self, texts: Sequence[str]) -> EmbeddingMatrix:
+        """Encode input texts into a (len(texts), dim) float32 array."""
 
         pass
         raise NotImplementedError
@@ -43,8 +72,19 @@ DEFAULT_OUTPUT_PATH = Path("data/embeddings/lore_embeddings.parquet")
 DEFAULT_WEIGHT_CONFIG = Path("config/text_type_weights.yml")
 TEXT_COLUMN = "text"
 EMBEDDING_INPUT_COLUMN = "embedding_text"
+EMBEDDING_BLOCKS_COLUMN = "embedding_blocks"
 EMBEDDING_STRATEGY = "weighted_text_types_v1"
+# Embed each (canonical_id, text_type) block once and pool with the weights
+BLOCK_POOLING_STRATEGY = "weighted_block_mean_v1"
+EMBEDDING_STRATEGIES = (EMBEDDING_STRATEGY, BLOCK_POOLING_STRATEGY)
+BLOCK_WEIGHTS_COLUMN = "embedding_block_weights"
+# Per-canonical attributes only written when at least one row carries them
+_OPTIONAL_ATTRIBUTE_COLUMNS = ("language", "provenance")
 INLINE_WEIGHT_SENTINEL = "<inline-text-type-weights>"
+# Rows encoded (and held in memory) between checkpoint writes
+DEFAULT_CHECKPOINT_ROWS = 2048
+# Row position of each canonical in the previous output (incremental runs)
+_PREVIOUS_ROW_COLUMN = "previous_row"
 REQUIRED_COLUMNS = (
     "lore_id",
     "canonical_id",
@@ -89,6 +129,53 @@ class WeightingStats:
     after_lengths: list[int] = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class EmbeddingChangeSet:
+    """Canonical-level diff between two lore embedding builds."""
+
+    mode: Literal["full", "incremental"]
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    reembedded: int = 0
+    reason: str | None = None
+    strategy: str = EMBEDDING_STRATEGY
+
+    def to_payload(self) -> dict[str, object]:
+        return {
+            "mode": self.mode,
+            "reason": self.reason,
+            "embedding_strategy": self.strategy,
+            "added": self.added,
+            "changed": self.changed,
+            "removed": self.removed,
+            "unchanged": self.unchanged,
+            "reembedded": self.reembedded,
+        }
+
+
+@dataclass(slots=True)
+class DuplicateInputs:
+    """Embedding inputs that occur more than once in a run.
+
+    Vectors for repeated inputs are kept for the whole run, so every copy
+    after the first is fanned out instead of encoded, even when the copies
+    land in different checkpoint chunks.
+    """
+
+    repeated: set[str]
+    vectors: dict[str, EmbeddingMatrix] = field(default_factory=dict)
+    collapsed: int = 0
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[str]) -> DuplicateInputs:
+        counts = Counter(embedding_input_hash(text) for text in texts)
+        return cls(
+            repeated={key for key, count in counts.items() if count > 1}
+        )
+
+
 class EmbeddingGenerationError(RuntimeError):
     """Raised when lore embedding generation fails."""
 
@@ -103,6 +190,8 @@ __all__ = [
     "LoreEmbeddingError",
     "main",
     "apply_text_type_weighting",
+    "changes_path_for",
+    "EmbeddingChangeSet",
 ]
 
 
@@ -118,13 +207,74 @@ def build_lore_embeddings(
     dry_run: bool = False,
     weights_path: Path | None = None,
     text_type_weights: Mapping[str, float] | None = None,
+    use_cache: bool = True,
+    cache_path: Path | None = None,
+    incremental: bool = False,
+    changes_path: Path | None = None,
+    max_concurrency: int | None = None,
+    max_batch_tokens: int | None = None,
+    local_workers: int | None = None,
+    strategy: str = EMBEDDING_STRATEGY,
+    resume: bool = False,
+    checkpoint_rows: int | None = None,
+    checkpoint_dir: Path | None = None,
+    return_vectors: bool = False,
+    guard_state_path: Path | None = None,
 ) -> pd.DataFrame:
-    """Embed lore corpus rows and write them to a parquet file."""
-
+    """Embed lore corpus rows and write them to a parquet file.
+
+    Vectors are looked up in a content-addressed cache keyed by provider,
+    model and the sha256 of each embedding input, so only new or changed
+    inputs reach the encoder. The cache defaults to a file next to
+    ``output_path`` and is read but not written during dry runs.
+
+    Every run diffs the corpus against the previous ``output_path`` by
+    ``canonical_id`` and weighted-text hash and writes the added, changed
+    and removed canonicals to ``changes_path`` (default
+    ``<output stem>_changes.json``) for downstream index builders. With
+    ``incremental`` the vectors of unchanged canonicals are taken from the
+    previous output instead of being re-encoded; an incompatible previous
+    output (other provider, model or strategy) falls back to a full build.
+    Only the key columns of the previous output are loaded for the diff;
+    reused vectors are read from it one chunk at a time.
+
+    Encoder calls hold at most ``batch_size`` inputs and, when
+    ``max_batch_tokens`` (default ``EMBED_MAX_BATCH_TOKENS``; 0 disables
+    it) is positive, at most that many estimated tokens, so long lore
+    entries do not overflow per-request limits. With the local provider, ``local_workers`` (default
+    ``EMBED_LOCAL_WORKERS``; 0 = one per CPU core) above one encodes on a
+    process pool. Identical inputs are encoded once per run and their
+    vector is copied to every row that uses them.
+
+    ``strategy`` selects how a canonical's text blocks become one vector.
+    ``weighted_text_types_v1`` encodes a single input in which blocks are
+    repeated or truncated according to their weight. ``weighted_block_mean_v1``
+    encodes every (canonical_id, text_type) block once and takes the
+    weighted mean of the block vectors; block vectors are cached on their
+    own, so a weight change only re-pools them.
+
+    Rows are encoded ``checkpoint_rows`` at a time and each finished chunk
+    is written as a part file under ``checkpoint_dir`` (default
+    ``<output stem>.checkpoint/``); the parts are merged into
+    ``output_path`` at the end, so only one chunk of vectors is held in
+    memory while encoding. After a crash, ``resume`` skips rows whose
+    canonical_id and input hash are already checkpointed. Dry runs keep
+    everything in memory and write nothing.
+
+    The returned frame holds the row metadata; its ``embedding`` column is
+    only filled (by reading ``output_path`` back) with ``return_vectors``.
+    Dry runs always include it, since their vectors are already in memory.
+    Non-dry runs record the RAG rebuild guard in ``guard_state_path``
+    (default ``rag_guard.DEFAULT_STATE_PATH``).
+    """
+
+    if strategy not in EMBEDDING_STRATEGIES:
+        msg = f"Unknown embedding strategy: {strategy}"
+        raise LoreEmbeddingError(msg)
     frame = _load_lore_frame(lore_path)
     frame = _sanitize_lore_frame(frame)
     weights = text_type_weights or _load_text_type_weights(weights_path)
-    frame = _apply_weighted_concatenation(frame, weights)
+    frame = _apply_weighted_concatenation(frame, weights, strategy=strategy)
     if EMBEDDING_INPUT_COLUMN not in frame.columns:
         msg = "Weighted lore frame is missing the embedding text column"
         raise LoreEmbeddingError(msg)
@@ -136,41 +286,238 @@ def build_lore_embeddings(
         )
 
     embedding_inputs = frame[EMBEDDING_INPUT_COLUMN].astype(str).tolist()
-    frame = frame.drop(columns=[EMBEDDING_INPUT_COLUMN])
+    blocks: list[list[tuple[str, float]]] = frame[
+        EMBEDDING_BLOCKS_COLUMN
+    ].tolist()
+    frame = frame.drop(
+        columns=[EMBEDDING_INPUT_COLUMN, EMBEDDING_BLOCKS_COLUMN]
+    )
 
     resolved_provider = _resolve_provider(provider)
     resolved_model = model_name or settings.embed_model
     resolved_batch = batch_size or settings.embed_batch_size
-    resolved_encoder = encoder or _build_encoder(
-        provider=resolved_provider,
-        model_name=resolved_model,
-        batch_size=resolved_batch,
+    resolved_max_tokens = (
+        settings.embed_max_batch_tokens
+        if max_batch_tokens is None
+        else max_batch_tokens
+    )
+    resolved_encoder = encoder or _LazyEncoder(
+        lambda: _build_encoder(
+            provider=resolved_provider,
+            model_name=resolved_model,
+            batch_size=resolved_batch,
+            max_concurrency=max_concurrency,
+            max_batch_tokens=resolved_max_tokens,
+            local_workers=local_workers,
+        )
     )
 
     texts = embedding_inputs
-    vectors = _encode_texts(texts, resolved_encoder, resolved_batch)
-
-    if len(vectors) != len(frame):
-        raise LoreEmbeddingError(
-            "Encoder returned mismatched vector count; "
-            f"expected {len(frame)} got {len(vectors)}",
+    if strategy == BLOCK_POOLING_STRATEGY:
+        input_hashes = [
+            pooling_input_hash(block_list) for block_list in blocks
+        ]
+    else:
+        input_hashes = [embedding_input_hash(text) for text in texts]
+    canonical_ids = frame["canonical_id"].astype(str).tolist()
+    previous, reason = _load_previous_embeddings(
+        output_path, resolved_provider, resolved_model, strategy
+    )
+    changes = _diff_canonicals(canonical_ids, input_hashes, previous)
+    changes.strategy = strategy
+    reused: set[str] = set()
+    previous_vectors: _PreviousVectors | None = None
+    if incremental and previous is not None:
+        changes.mode = "incremental"
+        reused = set(canonical_ids) - set(changes.added + changes.changed)
+        previous_vectors = _PreviousVectors(
+            output_path, previous[_PREVIOUS_ROW_COLUMN].to_dict()
         )
+    elif incremental:
+        changes.reason = reason
+        LOGGER.info("Incremental rebuild unavailable (%s); full build", reason)
+    pending = [
+        index
+        for index, canonical_id in enumerate(canonical_ids)
+        if canonical_id not in reused
+    ]
+    changes.reembedded = len(pending)
+    LOGGER.info(
+        "Canonical diff: %s added, %s changed, %s removed, %s unchanged; "
+        "embedding %s of %s rows",
+        len(changes.added),
+        len(changes.changed),
+        len(changes.removed),
+        changes.unchanged,
+        len(pending),
+        len(canonical_ids),
+    )
 
-    enriched = frame.copy()
-    enriched["embedding"] = vectors
-    enriched["embedding_provider"] = resolved_provider
-    enriched["embedding_model"] = resolved_model
-    enriched["embedding_strategy"] = EMBEDDING_STRATEGY
+    metadata = frame.copy()
+    metadata[INPUT_HASH_COLUMN] = input_hashes
+    if strategy == BLOCK_POOLING_STRATEGY:
+        metadata[BLOCK_HASHES_COLUMN] = [
+            [embedding_input_hash(text) for text, _ in block_list]
+            for block_list in blocks
+        ]
+        metadata[BLOCK_WEIGHTS_COLUMN] = [
+            [weight for _, weight in block_list] for block_list in blocks
+        ]
+    metadata["embedding_provider"] = resolved_provider
+    metadata["embedding_model"] = resolved_model
+    metadata["embedding_strategy"] = strategy
     weight_source = (
         INLINE_WEIGHT_SENTINEL
         if text_type_weights is not None
         else str(weights_path or DEFAULT_WEIGHT_CONFIG)
     )
-    enriched["weight_config_path"] = weight_source
+    metadata["weight_config_path"] = weight_source
+    # Fix the Arrow schema once so every checkpoint part matches
+    schema = pa.Schema.from_pandas(metadata, preserve_index=False)
+    embedding_position = len(frame.columns)
+
+    checkpoint: EmbeddingCheckpoint | None = None
+    done: dict[str, str] = {}
+    if not dry_run:
+        checkpoint = EmbeddingCheckpoint(
+            checkpoint_dir or checkpoint_dir_for(output_path),
+            manifest={
+                "embedding_provider": resolved_provider,
+                "embedding_model": resolved_model,
+                "embedding_strategy": strategy,
+            },
+        )
+        if resume:
+            done = checkpoint.resume()
+        else:
+            checkpoint.reset()
+    todo = [
+        index
+        for index, canonical_id in enumerate(canonical_ids)
+        if done.get(canonical_id) != input_hashes[index]
+    ]
+    if done:
+        LOGGER.info(
+            "Skipping %s rows already in the checkpoint",
+            len(canonical_ids) - len(todo),
+        )
+    resolved_chunk = checkpoint_rows or DEFAULT_CHECKPOINT_ROWS
+    pending_rows = set(pending)
+    encode_rows = [index for index in todo if index in pending_rows]
+    duplicates = DuplicateInputs.from_texts(
+        (text for index in encode_rows for text, _ in blocks[index])
+        if strategy == BLOCK_POOLING_STRATEGY
+        else (texts[index] for index in encode_rows)
+    )
+    in_memory: list[EmbeddingMatrix] = []
+
+    cache: EmbeddingCache | None = None
+    if use_cache:
+        cache = EmbeddingCache(
+            cache_path or output_path.parent / DEFAULT_CACHE_PATH.name,
+            provider=resolved_provider,
+            model=resolved_model,
+            readonly=dry_run,
+        )
+    changes.reembedded = 0
+    try:
+        for start in range(0, len(todo), resolved_chunk):
+            rows = todo[start : start + resolved_chunk]
+            to_encode = [index for index in rows if index in pending_rows]
+            if strategy == BLOCK_POOLING_STRATEGY:
+                encoded = _pool_block_embeddings(
+                    [blocks[index] for index in to_encode],
+                    resolved_encoder,
+                    resolved_batch,
+                    cache=cache,
+                    max_batch_tokens=resolved_max_tokens,
+                    duplicates=duplicates,
+                )
+            else:
+                encoded = _encode_texts(
+                    [texts[index] for index in to_encode],
+                    resolved_encoder,
+                    resolved_batch,
+                    cache=cache,
+                    max_batch_tokens=resolved_max_tokens,
+                    duplicates=duplicates,
+                )
+            if len(encoded) != len(to_encode):
+                raise LoreEmbeddingError(
+                    "Encoder returned mismatched vector count; "
+                    f"expected {len(to_encode)} got {len(encoded)}",
+                )
+            changes.reembedded += len(to_encode)
+            if len(to_encode) == len(rows):
+                vectors = encoded
+            else:
+                position = {index: row for row, index in enumerate(to_encode)}
+                kept = [index for index in rows if index not in position]
+                assert previous_vectors is not None
+                previous_rows = dict(
+                    zip(
+                        kept,
+                        previous_vectors.take(
+                            [canonical_ids[index] for index in kept]
+                        ),
+                        strict=True,
+                    )
+                )
+                vectors = np.stack(
+                    [
+                        encoded[position[index]]
+                        if index in position
+                        else previous_rows[index]
+                        for index in rows
+                    ]
+                )
+            if checkpoint is None:
+                in_memory.append(vectors)
+                continue
+            checkpoint.write_part(
+                _embedding_table(
+                    metadata.iloc[rows],
+                    vectors,
+                    embedding_position,
+                    schema,
+                )
+            )
+            LOGGER.info(
+                "Checkpointed %s/%s embedding rows",
+                start + len(rows),
+                len(todo),
+            )
+    finally:
+        if cache is not None:
+            cache.close()
+        if isinstance(resolved_encoder, _LazyEncoder):
+            resolved_encoder.close()
+        if previous_vectors is not None:
+            previous_vectors.close()
+
+    if duplicates.collapsed:
+        LOGGER.info(
+            "Collapsed %s duplicate embedding inputs; saved %s encoder inputs",
+            len(duplicates.repeated),
+            duplicates.collapsed,
+        )
+
+    enriched = metadata
+    if checkpoint is None:
+        enriched = _with_vectors(
+            metadata, np.concatenate(in_memory), embedding_position
+        )
+    else:
+        checkpoint.finalize(
+            output_path,
+            list(zip(canonical_ids, input_hashes, strict=True)),
+            chunk_rows=resolved_chunk,
+        )
+        if return_vectors:
+            written, matrix = read_lore_embeddings(output_path)
+            enriched = _with_vectors(written, matrix, embedding_position)
 
     if not dry_run:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        enriched.to_parquet(output_path, index=False)
         LOGGER.info(
             "Wrote %s embeddings (provider=%s, model=%s) to %s",
             len(enriched),
@@ -178,6 +525,12 @@ def build_lore_embeddings(
             resolved_model,
             output_path,
         )
+        resolved_changes = changes_path or changes_path_for(output_path)
+        resolved_changes.write_text(
+            json.dumps(changes.to_payload(), indent=2) + "\n",
+            encoding="utf-8",
+        )
+        LOGGER.info("Wrote embedding change list to %s", resolved_changes)
         guard_payload = rag_guard.build_guard_state(
             lore_path=lore_path,
             weight_path=weights_path or DEFAULT_WEIGHT_CONFIG,
@@ -185,14 +538,240 @@ def build_lore_embeddings(
             embed_provider=resolved_provider,
             embed_model=resolved_model,
         )
-        rag_guard.write_guard_state(guard_payload)
-        LOGGER.info(
-            "Updated RAG rebuild guard at %s",
-            rag_guard.DEFAULT_STATE_PATH,
-        )
+        resolved_guard = guard_state_path or rag_guard.DEFAULT_STATE_PATH
+        rag_guard.write_guard_state(guard_payload, state_path=resolved_guard)
+        LOGGER.info("Updated RAG rebuild guard at %s", resolved_guard)
+    return enriched
+
+
+def _with_vectors(
+    frame: pd.DataFrame, matrix: EmbeddingMatrix, position: int
+) -> pd.DataFrame:
+    enriched = frame.copy()
+    # Rows are views into the matrix, not per-float Python objects
+    enriched.insert(position, "embedding", list(matrix))
     return enriched
 
 
+def write_lore_embeddings(
+    frame: pd.DataFrame,
+    matrix: EmbeddingMatrix,
+    output_path: Path,
+) -> None:
+    """Write lore rows with a ``fixed_size_list<float32>`` embedding column.
+
+    The ``embedding`` column of ``frame`` is replaced by ``matrix`` so the
+    vectors reach parquet without going through Python lists.
+    """
+
+    position = list(frame.columns).index("embedding")
+    metadata = frame.drop(columns=["embedding"])
+    schema = pa.Schema.from_pandas(metadata, preserve_index=False)
+    pq.write_table(
+        _embedding_table(metadata, matrix, position, schema), output_path
+    )
+
+
+def _embedding_table(
+    metadata: pd.DataFrame,
+    matrix: EmbeddingMatrix,
+    position: int,
+    schema: pa.Schema,
+) -> pa.Table:
+    table = pa.Table.from_pandas(metadata, schema=schema, preserve_index=False)
+    return table.add_column(
+        position, "embedding", fixed_size_embedding_array(matrix)
+    )
+
+
+def read_lore_embeddings(
+    path: Path,
+) -> tuple[pd.DataFrame, EmbeddingMatrix]:
+    """Read a lore embeddings parquet as (metadata frame, float32 matrix).
+
+    Fixed-size float32 columns are viewed zero-copy (the matrix is then
+    read-only); parquet files from older runs with variable-size lists are
+    converted once.
+    """
+
+    table = pq.read_table(path, memory_map=True)
+    if "embedding" not in table.column_names:
+        msg = f"{path} is missing the 'embedding' column"
+        raise LoreEmbeddingError(msg)
+    try:
+        matrix = arrow_embedding_matrix(table.column("embedding"))
+    except ValueError as exc:
+        raise LoreEmbeddingError(f"{path}: {exc}") from exc
+    metadata = table.drop(["embedding"]).to_pandas()
+    return metadata, matrix
+
+
+def changes_path_for(output_path: Path) -> Path:
+    """Default change-list location for an embeddings parquet."""
+
+    return output_path.with_name(f"{output_path.stem}_changes.json")
+
+
+class _LazyEncoder:
+    """Defer building the encoder until there is something to encode."""
+
+    def __init__(self, factory: Callable[[], EncoderProtocol]) -> None:
+        self._factory = factory
+        self._encoder: EncoderProtocol | None = None
+
+    def encode(self, texts: Sequence[str]) -> EmbeddingMatrix:
+        if self._encoder is None:
+            self._encoder = self._factory()
+        return self._encoder.encode(texts)
+
+    def count_tokens(self, text: str) -> int:
+        if self._encoder is None:
+            self._encoder = self._factory()
+        return _token_counter(self._encoder)(text)
+
+    def close(self) -> None:
+        """Release worker pools held by the underlying encoder."""
+
+        close = getattr(self._encoder, "close", None)
+        if callable(close):
+            close()
+
+
+def _load_previous_embeddings(
+    output_path: Path,
+    provider: str,
+    model: str,
+    strategy: str = EMBEDDING_STRATEGY,
+) -> tuple[pd.DataFrame | None, str | None]:
+    """Return the previous output's key columns, if reusable.
+
+    The frame is indexed by canonical_id and holds the input hash and the
+    row position of each canonical; vectors are not loaded.
+    """
+
+    if not output_path.exists():
+        return None, "no previous output"
+    try:
+        schema = pq.read_schema(output_path)
+    except (OSError, pa.ArrowInvalid) as exc:
+        return None, f"previous output is unreadable ({exc})"
+    if "embedding" not in schema.names:
+        return None, (
+            f"previous output is unreadable ({output_path} is missing the "
+            "'embedding' column)"
+        )
+    required = (
+        "canonical_id",
+        INPUT_HASH_COLUMN,
+        "embedding_provider",
+        "embedding_model",
+        "embedding_strategy",
+    )
+    missing = [column for column in required if column not in schema.names]
+    if missing:
+        return None, f"previous output lacks {', '.join(missing)}"
+    previous = pd.read_parquet(output_path, columns=list(required))
+    expected = {
+        "embedding_provider": provider,
+        "embedding_model": model,
+        "embedding_strategy": strategy,
+    }
+    for column, value in expected.items():
+        if set(previous[column].astype(str)) - {value}:
+            return None, f"previous output used a different {column}"
+    if previous["canonical_id"].duplicated().any():
+        return None, "previous output has duplicate canonical_id rows"
+
+    indexed = previous.set_index(previous["canonical_id"].astype(str))
+    indexed[_PREVIOUS_ROW_COLUMN] = np.arange(len(indexed))
+    return indexed[[INPUT_HASH_COLUMN, _PREVIOUS_ROW_COLUMN]], None
+
+
+class _PreviousVectors:
+    """Read vectors from the previous output on demand, by canonical_id.
+
+    Only the row groups a request touches are decoded, and only those of
+    the latest request are kept, so memory follows the chunk size (and the
+    previous file's row-group size) rather than the corpus.
+    """
+
+    def __init__(self, path: Path, rows: Mapping[str, int]) -> None:
+        self._path = path
+        self._file = pq.ParquetFile(path, memory_map=True)
+        metadata = self._file.metadata
+        self._starts = np.cumsum(
+            [0]
+            + [
+                metadata.row_group(group).num_rows
+                for group in range(metadata.num_row_groups)
+            ]
+        )
+        self._rows = rows
+        self._loaded: dict[int, EmbeddingMatrix] = {}
+
+    def take(self, canonical_ids: Sequence[str]) -> EmbeddingMatrix:
+        rows = np.array(
+            [self._rows[canonical_id] for canonical_id in canonical_ids],
+            dtype=np.int64,
+        )
+        groups = np.searchsorted(self._starts, rows, side="right") - 1
+        self._loaded = {
+            group: self._loaded[group]
+            if group in self._loaded
+            else self._read_group(group)
+            for group in np.unique(groups).tolist()
+        }
+        return np.stack(
+            [
+                self._loaded[group][row - self._starts[group]]
+                for group, row in zip(
+                    groups.tolist(), rows.tolist(), strict=True
+                )
+            ]
+        )
+
+    def close(self) -> None:
+        self._loaded = {}
+        self._file.close()
+
+    def _read_group(self, group: int) -> EmbeddingMatrix:
+        column = self._file.read_row_group(group, columns=["embedding"])
+        try:
+            return arrow_embedding_matrix(column.column("embedding"))
+        except ValueError as exc:
+            raise LoreEmbeddingError(f"{self._path}: {exc}") from exc
+
+
+def _diff_canonicals(
+    canonical_ids: Sequence[str],
+    input_hashes: Sequence[str],
+    previous: pd.DataFrame | None,
+) -> EmbeddingChangeSet:
+    changes = EmbeddingChangeSet(mode="full")
+    previous_hashes: dict[str, str] = (
+        previous[INPUT_HASH_COLUMN].astype(str).to_dict()
+        if previous is not None
+        else {}
+    )
+    for canonical_id, input_hash in zip(
+        canonical_ids, input_hashes, strict=True
+    ):
+        stored = previous_hashes.get(canonical_id)
+        if stored is None:
+            changes.added.append(canonical_id)
+        elif stored != input_hash:
+            changes.changed.append(canonical_id)
+        else:
+            changes.unchanged += 1
+    current = set(canonical_ids)
+    changes.removed = [
+        canonical_id
+        for canonical_id in previous_hashes
+        if canonical_id not in current
+    ]
+    return changes
+
+
 def _load_lore_frame(path: Path) -> pd.DataFrame:
     if not path.exists():
         raise FileNotFoundError(f"Lore corpus parquet not found: {path}")
@@ -261,98 +840,261 @@ def _coerce_weight_input(value: object) -> SupportsFloat | str:
 def _apply_weighted_concatenation(
     frame: pd.DataFrame,
     weights: Mapping[str, float],
+    *,
+    strategy: str = EMBEDDING_STRATEGY,
 ) -> pd.DataFrame:
-    stats = WeightingStats()
-    records: list[dict[str, object]] = []
-    for _, group in frame.groupby("canonical_id", sort=False):
-        record = _compose_weighted_record(group, weights, stats)
-        if record is not None:
-            records.append(record)
+    """Collapse lore rows into one weighted record per canonical_id.
 
+    Grouping, block ordering and string assembly run as polars expressions.
+    Python only touches each distinct text_type (weight and label lookups)
+    and each (canonical_id, text_type) block (weight scaling).
+    """
+
+    stats = WeightingStats()
+    rows = _weighting_rows(frame)
+    blocks = _weighted_blocks(rows, weights, stats)
+    records = (
+        blocks.group_by("canonical_id", maintain_order=True)
+        .agg(
+            pl.col("resolved_type")
+            .filter(pl.col("primary_weight") == pl.col("primary_weight").max())
+            .first()
+            .alias("text_type"),
+            pl.col("display_section").str.concat("\n\n").alias(TEXT_COLUMN),
+            pl.col("resolved_type")
+            .str.concat("|")
+            .alias("text_type_components"),
+            pl.col("resolved_type").count().alias("component_count"),
+            pl.col("embedding_section")
+            .drop_nulls()
+            .str.concat("\n\n")
+            .alias(EMBEDDING_INPUT_COLUMN),
+            pl.col("display_section")
+            .filter(pl.col("weight") > 0.0)
+            .alias("block_sections"),
+            pl.col("weight")
+            .filter(pl.col("weight") > 0.0)
+            .alias("block_weights"),
+        )
+        .filter(pl.col(EMBEDDING_INPUT_COLUMN) != "")
+    )
+    canonical_count = rows.get_column("canonical_id").n_unique()
+    stats.canonical_skipped = canonical_count - records.height
     _log_weighting_summary(stats)
-    if not records:
+    if records.is_empty():
         return frame.head(0)
-    return pd.DataFrame(records)
+
+    records = records.join(
+        _canonical_attributes(rows), on="canonical_id", how="left"
+    )
+    result = pd.DataFrame(
+        {
+            "lore_id": (
+                records.get_column("canonical_id") + f"::{strategy}"
+            ).to_list(),
+            "canonical_id": records.get_column("canonical_id").to_list(),
+            "category": records.get_column("category").to_list(),
+            "text_type": records.get_column("text_type").to_list(),
+            "source": records.get_column("source").to_list(),
+            TEXT_COLUMN: records.get_column(TEXT_COLUMN).to_list(),
+            "text_type_components": records.get_column(
+                "text_type_components"
+            ).to_list(),
+            "component_count": records.get_column("component_count")
+            .cast(pl.Int64)
+            .to_list(),
+            EMBEDDING_INPUT_COLUMN: records.get_column(
+                EMBEDDING_INPUT_COLUMN
+            ).to_list(),
+            EMBEDDING_BLOCKS_COLUMN: [
+                list(zip(sections, block_weights, strict=True))
+                for sections, block_weights in zip(
+                    records.get_column("block_sections").to_list(),
+                    records.get_column("block_weights").to_list(),
+                    strict=True,
+                )
+            ],
+        }
+    )
+    for column in _OPTIONAL_ATTRIBUTE_COLUMNS:
+        if column in records.columns and records[column].null_count() < len(
+            records
+        ):
+            result[column] = records.get_column(column).to_list()
+    return result
+
+
+def _weighting_rows(frame: pd.DataFrame) -> pl.DataFrame:
+    """Lore rows as a polars frame with attribute columns pre-cleaned.
+
+    Rows without a canonical_id are dropped, as pandas groupby would.
+    Attribute columns keep ``str(value)`` where the stripped value is
+    non-empty and null elsewhere; ``<column>_clean`` holds the stripped form.
+    """
+
+    keyed = frame[frame["canonical_id"].notna()]
+    columns: dict[str, pl.Series] = {
+        "canonical_id": pl.Series(
+            keyed["canonical_id"].astype(str).tolist(), dtype=pl.Utf8
+        ),
+        "text_type": pl.Series(
+            keyed["text_type"]
+            .astype(str)
+            .where(keyed["text_type"].notna(), None)
+            .tolist(),
+            dtype=pl.Utf8,
+        ),
+        TEXT_COLUMN: pl.Series(
+            keyed[TEXT_COLUMN].astype(str).str.strip().tolist(), dtype=pl.Utf8
+        ),
+    }
+    for column in ("category", "source", *_OPTIONAL_ATTRIBUTE_COLUMNS):
+        if column not in keyed.columns:
+            continue
+        values = keyed[column]
+        text = values.astype(str)
+        clean = text.str.strip()
+        # Only None counts as missing here; NaN stringifies to "nan"
+        present = (values.to_numpy(dtype=object) != None) & (  # noqa: E711
+            clean != ""
+        ).to_numpy()
+        columns[column] = pl.Series(
+            text.where(present, None).tolist(), dtype=pl.Utf8
+        )
+        columns[f"{column}_clean"] = pl.Series(
+            clean.where(present, None).tolist(), dtype=pl.Utf8
+        )
+    return pl.DataFrame(columns).with_row_count("row")
 
 
-def _compose_weighted_record(
-    group: pd.DataFrame,
+def _weighted_blocks(
+    rows: pl.DataFrame,
     weights: Mapping[str, float],
     stats: WeightingStats,
-) -> dict[str, object] | None:
-    canonical_id = str(group["canonical_id"].iloc[0])
-    block_pairs: list[tuple[WeightingResult, str]] = []
-    for text_type, subset in group.groupby("text_type", sort=False):
-        combined_text = _merge_text_block(subset)
-        if not combined_text:
-            continue
-        result = apply_text_type_weighting(
-            {"text_type": text_type, TEXT_COLUMN: combined_text},
-            weights,
+) -> pl.DataFrame:
+    """Merge rows into (canonical_id, text_type) blocks in output order."""
+
+    blocks = (
+        rows.with_columns(
+            pl.col("row").min().over("canonical_id").alias("canonical_row")
         )
-        _update_weighting_stats(stats, result)
-        block_pairs.append((result, combined_text))
-
-    if not block_pairs:
-        stats.canonical_skipped += 1
-        return None
-
-    ordered = sorted(
-        block_pairs,
-        key=lambda item: (item[0].weight, item[0].weighted_length),
-        reverse=True,
-    )
-    components = [result.text_type for result, _ in ordered]
-    display_sections = [
-        _format_section(result.text_type, original)
-        for result, original in ordered
-    ]
-    embedding_sections = [
-        _format_section(result.text_type, result.text) for result, _ in ordered
-    ]
+        .group_by(["canonical_id", "text_type"], maintain_order=True)
+        .agg(
+            pl.col("canonical_row").first(),
+            pl.col(TEXT_COLUMN)
+            .filter(pl.col(TEXT_COLUMN) != "")
+            .str.concat("\n\n"),
+        )
+        .with_row_count("block")
+        .filter(
+            pl.col("text_type").is_not_null()
+            & (pl.col(TEXT_COLUMN).fill_null("") != "")
+        )
+    )
 
-    display_text = "\n\n".join(
-        section for section in display_sections if section
-    )
-    embedding_text = "\n\n".join(
-        section for section in embedding_sections if section
-    )
-    if not display_text or not embedding_text:
-        stats.canonical_skipped += 1
-        return None
-
-    record: dict[str, object] = {
-        "lore_id": f"{canonical_id}::{EMBEDDING_STRATEGY}",
-        "canonical_id": canonical_id,
-        "category": _first_value(group, "category") or "unknown",
-        "text_type": _select_primary_text_type(components, weights),
-        "source": _joined_unique(group, "source"),
-        TEXT_COLUMN: display_text,
-        "text_type_components": "|".join(components),
-        "component_count": len(components),
-        EMBEDDING_INPUT_COLUMN: embedding_text,
-    }
-    language = _first_value(group, "language")
-    if language:
-        record["language"] = language
-    provenance = _joined_unique(group, "provenance")
-    if provenance:
-        record["provenance"] = provenance
-    return record
+    text_types = blocks.get_column("text_type").unique(maintain_order=True)
+    resolved = [
+        apply_text_type_weighting({"text_type": text_type}, weights)
+        for text_type in text_types.to_list()
+    ]
+    type_table = pl.DataFrame(
+        {
+            "text_type": text_types,
+            "resolved_type": [result.text_type for result in resolved],
+            "weight": [result.weight for result in resolved],
+            "label": [_section_label(result.text_type) for result in resolved],
+            "primary_weight": [
+                float(
+                    weights.get(
+                        result.text_type.lower(),
+                        weights.get(result.text_type, 1.0),
+                    )
+                )
+                for result in resolved
+            ],
+        },
+        schema={
+            "text_type": pl.Utf8,
+            "resolved_type": pl.Utf8,
+            "weight": pl.Float64,
+            "label": pl.Utf8,
+            "primary_weight": pl.Float64,
+        },
+    )
+    blocks = blocks.join(type_table, on="text_type", how="left")
+    blocks = blocks.with_columns(
+        pl.Series(
+            "weighted_text",
+            [
+                _scale_text_block(text, weight)
+                for text, weight in zip(
+                    blocks.get_column(TEXT_COLUMN).to_list(),
+                    blocks.get_column("weight").to_list(),
+                    strict=True,
+                )
+            ],
+            dtype=pl.Utf8,
+        )
+    ).with_columns(
+        pl.col(TEXT_COLUMN).str.len_chars().alias("original_length"),
+        pl.col("weighted_text").str.len_chars().alias("weighted_length"),
+    )
+    _record_weighting_stats(stats, blocks)
+
+    return blocks.sort(
+        ["canonical_row", "weight", "weighted_length", "block"],
+        descending=[False, True, True, False],
+    ).with_columns(
+        (pl.col("label") + ":\n" + pl.col(TEXT_COLUMN)).alias(
+            "display_section"
+        ),
+        pl.when(pl.col("weighted_text") != "")
+        .then(pl.col("label") + ":\n" + pl.col("weighted_text"))
+        .otherwise(None)
+        .alias("embedding_section"),
+    )
 
 
-def _merge_text_block(subset: pd.DataFrame) -> str:
-    texts = subset[TEXT_COLUMN].astype(str).map(str.strip).tolist()
-    filtered = [value for value in texts if value]
-    return "\n\n".join(filtered).strip()
+def _canonical_attributes(rows: pl.DataFrame) -> pl.DataFrame:
+    """First category/language and "|"-joined sources per canonical_id."""
+
+    aggregations = [
+        pl.col("category").drop_nulls().first().fill_null("unknown")
+        if "category" in rows.columns
+        else pl.lit("unknown").alias("category"),
+        pl.col("source_clean")
+        .drop_nulls()
+        .unique(maintain_order=True)
+        .str.concat("|")
+        .alias("source")
+        if "source" in rows.columns
+        else pl.lit("").alias("source"),
+    ]
+    if "language" in rows.columns:
+        aggregations.append(pl.col("language").drop_nulls().first())
+    if "provenance" in rows.columns:
+        aggregations.append(
+            pl.col("provenance_clean")
+            .drop_nulls()
+            .unique(maintain_order=True)
+            .str.concat("|")
+            .alias("provenance")
+        )
+    attributes = rows.group_by("canonical_id", maintain_order=True).agg(
+        aggregations
+    )
+    if "provenance" in attributes.columns:
+        attributes = attributes.with_columns(
+            pl.when(pl.col("provenance") != "")
+            .then(pl.col("provenance"))
+            .otherwise(None)
+            .alias("provenance")
+        )
+    return attributes
 
 
-def _format_section(text_type: str, content: str) -> str:
-    clean = content.strip()
-    if not clean:
-        return ""
-    label = text_type.replace("_", " ").title() or "Text"
-    return f"{label}:\n{clean}"
+def _section_label(text_type: str) -> str:
+    return text_type.replace("_", " ").title() or "Text"
 
 
 def apply_text_type_weighting(
@@ -396,67 +1138,18 @@ def _scale_text_block(text: str, weight: float) -> str:
     return "\n\n".join(segment for segment in segments if segment).strip()
 
 
-def _select_primary_text_type(
-    components: Sequence[str],
-    weights: Mapping[str, float],
-) -> str:
-    if not components:
-        return "text"
-
-    best_type = components[0]
-    best_weight = weights.get(best_type.lower(), weights.get(best_type, 1.0))
-    for candidate in components[1:]:
-        candidate_weight = weights.get(
-            candidate.lower(),
-            weights.get(candidate, 1.0),
-        )
-        if candidate_weight > best_weight:
-            best_type = candidate
-            best_weight = candidate_weight
-    return best_type
-
-
-def _first_value(frame: pd.DataFrame, column: str) -> str | None:
-    if column not in frame.columns:
-        return None
-    values = [
-        str(value)
-        for value in frame[column].tolist()
-        if value is not None and str(value).strip()
-    ]
-    return values[0] if values else None
-
-
-def _joined_unique(frame: pd.DataFrame, column: str) -> str:
-    if column not in frame.columns:
-        return ""
-    values = [
-        str(value).strip()
-        for value in frame[column].tolist()
-        if value is not None and str(value).strip()
-    ]
-    if not values:
-        return ""
-    deduped: list[str] = []
-    for value in values:
-        if value not in deduped:
-            deduped.append(value)
-    return "|".join(deduped)
-
-
-def _update_weighting_stats(
+def _record_weighting_stats(
     stats: WeightingStats,
-    result: WeightingResult,
+    blocks: pl.DataFrame,
 ) -> None:
-    stats.total_blocks += 1
-    stats.before_lengths.append(result.original_length)
-    stats.after_lengths.append(result.weighted_length)
-    if result.weighted_length == 0:
-        stats.empty_blocks += 1
-    elif result.weighted_length < result.original_length:
-        stats.truncated_blocks += 1
-    elif result.weighted_length > result.original_length:
-        stats.expanded_blocks += 1
+    before = blocks.get_column("original_length")
+    after = blocks.get_column("weighted_length")
+    stats.total_blocks += blocks.height
+    stats.before_lengths.extend(before.to_list())
+    stats.after_lengths.extend(after.to_list())
+    stats.empty_blocks += int((after == 0).sum())
+    stats.truncated_blocks += int(((after > 0) & (after < before)).sum())
+    stats.expanded_blocks += int((after > before).sum())
 
 
 def _log_weighting_summary(stats: WeightingStats) -> None:
@@ -497,12 +1190,29 @@ def _build_encoder(
     provider: ProviderName,
     model_name: str,
     batch_size: int,
+    max_concurrency: int | None = None,
+    max_batch_tokens: int | None = None,
+    local_workers: int | None = None,
 ) -> EncoderProtocol:
     config = EncoderConfig(
         provider=provider,
         model_name=model_name,
         batch_size=batch_size,
         openai_api_key=settings.openai_api_key,
+        openai_base_url=settings.openai_base_url,
+        max_concurrency=max_concurrency or settings.openai_max_concurrency,
+        requests_per_minute=settings.openai_requests_per_minute,
+        tokens_per_minute=settings.openai_tokens_per_minute,
+        max_retries=settings.openai_max_retries,
+        max_batch_tokens=max_batch_tokens,
+        local_workers=(
+            settings.embed_local_workers
+            if local_workers is None
+            else local_workers
+        ),
+        local_device=settings.embed_local_device,
+        local_precision=settings.embed_local_precision,
+        local_exact_tokens=settings.embed_local_exact_tokens,
     )
     return create_encoder(config)
 
@@ -511,20 +1221,189 @@ def _encode_texts(
     texts: Sequence[str],
     encoder: EncoderProtocol,
     batch_size: int,
-) -> list[list[float]]:
-    vectors: list[list[float]] = []
-    for start in range(0, len(texts), batch_size):
-        batch = list(texts[start : start + batch_size])
-        if not batch:
-            continue
-        encoded = encoder.encode(batch)
+    cache: EmbeddingCache | None = None,
+    max_batch_tokens: int | None = None,
+    duplicates: DuplicateInputs | None = None,
+) -> EmbeddingMatrix:
+    """Encode ``texts``, sending each distinct input to the encoder once.
+
+    Vectors are fanned back out so the result still has one row per input.
+    ``duplicates`` carries vectors of repeated inputs across calls.
+    """
+
+    keys = [embedding_input_hash(text) for text in texts]
+    known = duplicates.vectors if duplicates is not None else {}
+    slots: dict[str, int] = {}
+    unique: list[int] = []
+    for index, key in enumerate(keys):
+        if key not in slots and key not in known:
+            slots[key] = len(unique)
+            unique.append(index)
+    collapsed = len(keys) - len(unique)
+    if collapsed:
+        LOGGER.info(
+            "Encoding %s unique inputs for %s rows (%s duplicates collapsed)",
+            len(unique),
+            len(keys),
+            collapsed,
+        )
+
+    encoded = _encode_unique(
+        [texts[index] for index in unique],
+        [keys[index] for index in unique],
+        encoder,
+        batch_size,
+        cache,
+        max_batch_tokens,
+    )
+    if duplicates is not None:
+        duplicates.collapsed += collapsed
+        for key, row in slots.items():
+            if key in duplicates.repeated:
+                # Copy so the chunk matrix is not kept alive by a row view
+                known[key] = encoded[row].copy()
+    if not collapsed:
+        return encoded
+    return np.stack(
+        [encoded[slots[key]] if key in slots else known[key] for key in keys]
+    )
+
+
+def _encode_unique(
+    texts: Sequence[str],
+    keys: Sequence[str],
+    encoder: EncoderProtocol,
+    batch_size: int,
+    cache: EmbeddingCache | None,
+    max_batch_tokens: int | None,
+) -> EmbeddingMatrix:
+    if cache is None:
+        return _encode_batches(texts, encoder, batch_size, max_batch_tokens)
+
+    cached = cache.get_many(keys)
+    misses = [index for index, key in enumerate(keys) if key not in cached]
+    LOGGER.info(
+        "Embedding cache hits: %s/%s (%.1f%%); encoding %s texts",
+        len(keys) - len(misses),
+        len(keys),
+        100.0 * (len(keys) - len(misses)) / len(keys) if keys else 0.0,
+        len(misses),
+    )
+    encoded = _encode_batches(
+        [texts[index] for index in misses],
+        encoder,
+        batch_size,
+        max_batch_tokens,
+    )
+    stored = cache.put_many(
+        {
+            keys[index]: vector
+            for index, vector in zip(misses, encoded, strict=True)
+        }
+    )
+    if not keys:
+        return encoded
+    return np.stack(
+        [cached[key] if key in cached else stored[key] for key in keys]
+    )
+
+
+def _encode_batches(
+    texts: Sequence[str],
+    encoder: EncoderProtocol,
+    batch_size: int,
+    max_batch_tokens: int | None = None,
+) -> EmbeddingMatrix:
+    vectors: list[EmbeddingMatrix] = []
+    for indices in batch_by_token_budget(
+        texts,
+        max_tokens=max_batch_tokens,
+        max_items=batch_size,
+        count_tokens=(
+            _token_counter(encoder) if max_batch_tokens else estimate_tokens
+        ),
+    ):
+        batch = [texts[index] for index in indices]
+        encoded = as_embedding_matrix(encoder.encode(batch))
         if len(encoded) != len(batch):
             raise LoreEmbeddingError(
                 "Embedding backend returned mismatched vector count within a "
                 "batch",
             )
-        vectors.extend(encoded)
-    return vectors
+        vectors.append(encoded)
+    if not vectors:
+        return as_embedding_matrix([])
+    try:
+        return np.concatenate(vectors)
+    except ValueError as exc:
+        msg = "Embedding backend returned vectors of different sizes"
+        raise LoreEmbeddingError(msg) from exc
+
+
+def pooling_input_hash(blocks: Sequence[tuple[str, float]]) -> str:
+    """Hash the block inputs and weights that define a pooled vector."""
+
+    payload = [[embedding_input_hash(text), weight] for text, weight in blocks]
+    return embedding_input_hash(json.dumps(payload, separators=(",", ":")))
+
+
+def _pool_block_embeddings(
+    blocks: Sequence[Sequence[tuple[str, float]]],
+    encoder: EncoderProtocol,
+    batch_size: int,
+    cache: EmbeddingCache | None = None,
+    max_batch_tokens: int | None = None,
+    duplicates: DuplicateInputs | None = None,
+) -> EmbeddingMatrix:
+    """Encode each distinct block once and weighted-mean pool per canonical.
+
+    A weighted mean of unit vectors is shorter than one, so when the encoder
+    returns L2-normalized block vectors the pooled rows are renormalized to
+    keep them comparable with single-input embeddings.
+    """
+
+    flat = [text for group in blocks for text, _ in group]
+    if not flat:
+        return as_embedding_matrix([])
+    LOGGER.info(
+        "Pooling %s canonicals from %s text blocks",
+        len(blocks),
+        len(flat),
+    )
+    block_matrix = _encode_texts(
+        flat,
+        encoder,
+        batch_size,
+        cache=cache,
+        max_batch_tokens=max_batch_tokens,
+        duplicates=duplicates,
+    )
+    if len(block_matrix) != len(flat):
+        raise LoreEmbeddingError(
+            "Encoder returned mismatched vector count; "
+            f"expected {len(flat)} got {len(block_matrix)}",
+        )
+    pooled = np.empty((len(blocks), block_matrix.shape[1]), dtype=np.float32)
+    offset = 0
+    for row, group in enumerate(blocks):
+        weights = np.asarray([weight for _, weight in group], dtype=np.float32)
+        block_rows = block_matrix[offset : offset + len(group)]
+        pooled[row] = weights @ block_rows / weights.sum()
+        offset += len(group)
+    if _is_unit_normalized(block_matrix):
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        np.divide(pooled, norms, out=pooled, where=norms > 0)
+    return pooled
+
+
+def _is_unit_normalized(matrix: EmbeddingMatrix) -> bool:
+    norms = np.linalg.norm(matrix, axis=1)
+    return bool(np.allclose(norms, 1.0, atol=1e-3))
+
+
+def _token_counter(encoder: EncoderProtocol) -> TokenCounter:
+    counter = getattr(encoder, "count_tokens", None)
+    return counter if callable(counter) else estimate_tokens
 
 
 def parse_args() -> argparse.Namespace:
@@ -555,6 +1434,31 @@ def parse_args() -> argparse.Namespace:
         type=int,
         help="Batch size for embedding requests",
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        help=(
+            "Concurrent OpenAI embedding requests (overrides "
+            "OPENAI_MAX_CONCURRENCY; rate limits come from "
+            "OPENAI_REQUESTS_PER_MINUTE / OPENAI_TOKENS_PER_MINUTE)"
+        ),
+    )
+    parser.add_argument(
+        "--local-workers",
+        type=int,
+        help=(
+            "Processes for local sentence-transformers encoding; 0 uses one "
+            "per CPU core (overrides EMBED_LOCAL_WORKERS)"
+        ),
+    )
+    parser.add_argument(
+        "--max-batch-tokens",
+        type=int,
+        help=(
+            "Per-request token budget for embedding batches; 0 disables it "
+            "(overrides EMBED_MAX_BATCH_TOKENS)"
+        ),
+    )
     parser.add_argument(
         "--limit",
         type=int,
@@ -574,6 +1478,66 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Run embeddings without writing parquet output",
     )
+    parser.add_argument(
+        "--strategy",
+        choices=EMBEDDING_STRATEGIES,
+        default=EMBEDDING_STRATEGY,
+        help=(
+            "How text blocks become one vector: weighted concatenation "
+            "(default) or a weighted mean of per-block embeddings"
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Continue an interrupted run from its checkpoint, skipping rows "
+            "that were already embedded"
+        ),
+    )
+    parser.add_argument(
+        "--checkpoint-rows",
+        type=int,
+        help=(
+            "Rows per checkpoint part "
+            f"(default {DEFAULT_CHECKPOINT_ROWS}; bounds memory use)"
+        ),
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=Path,
+        help="Checkpoint directory (defaults to <output stem>.checkpoint)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Encode every input instead of reusing cached vectors",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Reuse vectors from the previous --output for canonicals whose "
+            "weighted text is unchanged"
+        ),
+    )
+    parser.add_argument(
+        "--changes-path",
+        type=Path,
+        help=(
+            "Where to write the canonical change list "
+            "(defaults to <output stem>_changes.json)"
+        ),
+    )
+    parser.add_argument(
+        "--cache-path",
+        type=Path,
+        help=(
+            "Embedding cache database "
+            "(defaults to embedding_cache.sqlite next to --output)"
+        ),
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -601,6 +1565,17 @@ def main() -> None:
             limit=args.limit,
             dry_run=args.dry_run,
             weights_path=args.text_type_weights,
+            use_cache=args.use_cache,
+            cache_path=args.cache_path,
+            incremental=args.incremental,
+            changes_path=args.changes_path,
+            max_concurrency=args.max_concurrency,
+            max_batch_tokens=args.max_batch_tokens,
+            local_workers=args.local_workers,
+            strategy=args.strategy,
+            resume=args.resume,
+            checkpoint_rows=args.checkpoint_rows,
+            checkpoint_dir=args.checkpoint_dir,
         )
     except Exception as exc:  # noqa: BLE001
         LOGGER.error("Lore embedding pipeline failed: %s", exc)
@@ -28,12 +28,23 @@ except ImportError as err:  # pragma: no cover - optional dependency
 import pandas as pd
 from corpus.config import settings
 
+from pipelines.build_lore_embeddings import (
+    LoreEmbeddingError,
+    read_lore_embeddings,
+)
 from pipelines.embedding_backends import (
     EmbeddingEncoder,
     EncoderConfig,
     ProviderLiteral,
     create_encoder,
 )
+from pipelines.embedding_projection import (
+    PROJECTION_METHODS,
+    EmbeddingProjection,
+    ProjectionMethod,
+    fit_projection,
+    projection_recall,
+)
 
 FAISSIndex = Any
 VectorMatrix = Any
@@ -54,6 +65,8 @@ DEFAULT_INDEX = Path("data/embeddings/faiss_index.bin")
 LEGACY_INDEX = Path("data/embeddings/lore_index.faiss")
 DEFAULT_METADATA = Path("data/embeddings/rag_metadata.parquet")
 DEFAULT_INFO = Path("data/embeddings/rag_index_meta.json")
+DEFAULT_PROJECTION = Path("data/embeddings/rag_projection.npz")
+RECALL_K = 10
 
 META_COLUMNS = (
     "lore_id",
@@ -77,22 +90,56 @@ def build_rag_index(
     info_path: Path = DEFAULT_INFO,
     normalize: bool = True,
     dry_run: bool = False,
+    reduce_dimension: int | None = None,
+    projection_method: ProjectionMethod = "pca",
+    projection_path: Path | None = None,
 ) -> pd.DataFrame:
-    """Construct a FAISS index from the lore embeddings parquet."""
+    """Construct a FAISS index from the lore embeddings parquet.
+
+    With ``reduce_dimension`` the vectors are projected before indexing,
+    either by Matryoshka truncation (for models trained for it) or by a PCA
+    fitted on the corpus. The projection is saved to ``projection_path``
+    (default ``rag_projection.npz`` next to the index) and recorded in the
+    index metadata together with its recall@10 against full-dimension
+    search; query helpers apply it to query vectors automatically.
+    """
 
-    frame = _load_embedding_frame(embeddings_path)
-    if frame.empty:
+    metadata, matrix = _load_embeddings(embeddings_path)
+    if metadata.empty:
         raise RAGIndexError("Embedding parquet is empty")
 
-    matrix = _vectors_to_matrix(frame)
     if normalize:
+        # The parquet-backed matrix is a read-only view; normalize a copy
+        if not matrix.flags.writeable:
+            matrix = matrix.copy()
         faiss.normalize_L2(matrix)
 
+    projection: EmbeddingProjection | None = None
+    recall: float | None = None
+    if reduce_dimension is not None:
+        try:
+            projection = fit_projection(
+                matrix, reduce_dimension, projection_method
+            )
+        except ValueError as exc:
+            raise RAGIndexError(str(exc)) from exc
+        recall = projection_recall(matrix, projection, k=RECALL_K)
+        LOGGER.info(
+            "%s projection %s -> %s: recall@%s %.3f vs full dimension",
+            projection.method,
+            projection.input_dimension,
+            projection.output_dimension,
+            RECALL_K,
+            recall,
+        )
+        matrix = projection.apply(matrix)
+        if normalize:
+            faiss.normalize_L2(matrix)
+
     dimension = matrix.shape[1]
     index = faiss.IndexFlatIP(dimension)
     index.add(matrix)
 
-    metadata = frame.drop(columns=["embedding"]).reset_index(drop=True)
     _log_index_summary(metadata, dimension)
 
     if dry_run:
@@ -105,7 +152,18 @@ def build_rag_index(
 
     faiss.write_index(index, str(index_path))
     metadata.to_parquet(metadata_path, index=False)
-    _write_info(info_path, metadata, dimension, normalize)
+    projection_info: dict[str, object] | None = None
+    if projection is not None:
+        resolved_projection = projection_path or index_path.with_name(
+            DEFAULT_PROJECTION.name
+        )
+        projection.save(resolved_projection)
+        projection_info = projection.describe() | {
+            "path": os.path.relpath(resolved_projection, info_path.parent),
+            f"recall_at_{RECALL_K}": recall,
+        }
+        LOGGER.info("Wrote embedding projection to %s", resolved_projection)
+    _write_info(info_path, metadata, dimension, normalize, projection_info)
 
     LOGGER.info(
         "Wrote FAISS index (%s vectors, dim=%s) to %s",
@@ -167,10 +225,24 @@ def load_query_helper(
         metadata=metadata.reset_index(drop=True),
         encoder=resolved_encoder,
         normalize=normalize,
+        projection=_load_projection(info, info_path),
     )
     return helper
 
 
+def _load_projection(
+    info: Mapping[str, object], info_path: Path
+) -> EmbeddingProjection | None:
+    payload = info.get("projection")
+    if not isinstance(payload, Mapping):
+        return None
+    path = info_path.parent / str(payload.get("path", DEFAULT_PROJECTION.name))
+    if not path.exists():
+        msg = f"Index was built with a projection but {path} is missing"
+        raise RAGIndexError(msg)
+    return EmbeddingProjection.load(path)
+
+
 def _resolve_index_path(target: Path) -> Path:
     if target.exists():
         return target
@@ -213,25 +285,15 @@ def query_index(
     return helper.query(query_text, top_k=top_k, filter_by=filter_by)
 
 
-def _load_embedding_frame(path: Path) -> pd.DataFrame:
+def _load_embeddings(path: Path) -> tuple[pd.DataFrame, VectorMatrix]:
     if not path.exists():
         raise FileNotFoundError(f"Embedding parquet not found at {path}")
 
-    frame = pd.read_parquet(path)
-    if "embedding" not in frame.columns:
-        raise RAGIndexError("Embedding parquet is missing 'embedding' column")
-    return frame
-
-
-def _vectors_to_matrix(frame: pd.DataFrame) -> VectorMatrix:
-    vectors = frame["embedding"].tolist()
-    if not vectors:
-        raise RAGIndexError("No embeddings found in parquet")
-
-    matrix = np.asarray(vectors, dtype=np.float32)
-    if matrix.ndim != 2:
-        raise RAGIndexError("Embedding matrix must be 2-dimensional")
-    return matrix
+    try:
+        metadata, matrix = read_lore_embeddings(path)
+    except LoreEmbeddingError as exc:
+        raise RAGIndexError(str(exc)) from exc
+    return metadata.reset_index(drop=True), matrix
 
 
 def _write_info(
@@ -239,6 +301,7 @@ def _write_info(
     metadata: pd.DataFrame,
     dimension: int,
     normalize: bool,
+    projection: Mapping[str, object] | None = None,
 ) -> None:
     provider = _get_constant_value(metadata, "embedding_provider")
     model_name = _get_constant_value(metadata, "embedding_model")
@@ -252,6 +315,8 @@ def _write_info(
     }
     if strategy is not None:
         payload["embedding_strategy"] = strategy
+    if projection is not None:
+        payload["projection"] = dict(projection)
     payload["reranker"] = {
         "default_name": settings.reranker_name,
         "default_model": settings.reranker_model,
@@ -291,11 +356,13 @@ class RAGQueryHelper:
         metadata: pd.DataFrame,
         encoder: EmbeddingEncoder,
         normalize: bool,
+        projection: EmbeddingProjection | None = None,
     ) -> None:
         self._index = index
         self._metadata = metadata.reset_index(drop=True)
         self._encoder = encoder
         self._normalize = normalize
+        self._projection = projection
 
     def query(
         self,
@@ -306,7 +373,7 @@ class RAGQueryHelper:
         include_vectors: bool = False,
     ) -> pd.DataFrame:
         vectors = self._encoder.encode([query_text])
-        if not vectors:
+        if len(vectors) == 0:
             msg = "Embedding backend returned no vector for query"
             raise RAGIndexError(msg)
 
@@ -315,6 +382,11 @@ class RAGQueryHelper:
             query_vec = query_vec.reshape(1, -1)
         if self._normalize:
             faiss.normalize_L2(query_vec)
+        if self._projection is not None:
+            # Same order as the index: normalize, project, normalize
+            query_vec = self._projection.apply(query_vec)
+            if self._normalize:
+                faiss.normalize_L2(query_vec)
 
         return _search_index(
             index=self._index,
@@ -416,6 +488,8 @@ def _build_encoder(
         model_name=model_name,
         batch_size=batch_size,
         openai_api_key=api_key,
+        local_device=settings.embed_local_device,
+        local_precision=settings.embed_local_precision,
     )
     return create_encoder(config)
 
@@ -453,6 +527,27 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Disable L2 normalization before indexing",
     )
+    parser.add_argument(
+        "--reduce-dim",
+        type=int,
+        default=None,
+        help="Project vectors down to this dimension before indexing",
+    )
+    parser.add_argument(
+        "--projection",
+        choices=PROJECTION_METHODS,
+        default="pca",
+        help=(
+            "How to reduce dimensions: fitted PCA, or Matryoshka truncation "
+            "for models trained for it (default: pca)"
+        ),
+    )
+    parser.add_argument(
+        "--projection-path",
+        type=Path,
+        default=None,
+        help="Where to save the projection (default: next to the index)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -483,6 +578,9 @@ def main() -> None:
             info_path=args.info,
             normalize=not args.no_normalize,
             dry_run=args.dry_run,
+            reduce_dimension=args.reduce_dim,
+            projection_method=args.projection,
+            projection_path=args.projection_path,
         )
     except Exception as exc:  # noqa: BLE001
         LOGGER.error("RAG index pipeline failed: %s", exc)
@@ -26,7 +26,11 @@ from pipelines.io.carian_fmg_loader import load_carian_weapon_fmg
 from pipelines.io.github_api_loader import load_github_api_weapons
 from pipelines.io.kaggle_base_loader import load_kaggle_base_weapons
 from pipelines.io.kaggle_dlc_loader import load_kaggle_dlc_weapons
-from pipelines.schema_loader import get_dataset_schema
+from pipelines.schema_loader import (
+    get_dataset_schema,
+    validate_with_mode,
+    validation_modes,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -84,6 +88,7 @@ def build_weapons_canonical(
     output_path: Path = DEFAULT_OUTPUT,
     csv_output: Path | None = None,
     dry_run: bool = False,
+    validation_mode: str = "full",
 ) -> pd.DataFrame:
     """Execute the canonical weapons ingestion flow."""
 
@@ -116,7 +121,7 @@ def build_weapons_canonical(
     schema = cast(Any, schema_version.schema)
 
     try:
-        validated = schema.validate(finalized, lazy=True)
+        validated = validate_with_mode(schema, finalized, validation_mode)
     except pa.errors.SchemaErrors as exc:
         log_schema_validation_failure(
             df=finalized,
@@ -298,6 +303,12 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Run pipeline without writing artifacts",
     )
+    parser.add_argument(
+        "--validate",
+        choices=validation_modes(),
+        default="full",
+        help="Schema validation mode (fast/sample trade rigour for speed)",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -321,6 +332,7 @@ def main() -> None:
             output_path=args.output,
             csv_output=args.csv_output,
             dry_run=args.dry_run,
+            validation_mode=args.validate,
         )
     except Exception as exc:  # noqa: BLE001
         LOGGER.error("Canonical weapons pipeline failed: %s", exc)
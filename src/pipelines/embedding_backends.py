@@ -8,23 +8,70 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import logging
+import multiprocessing
+import os
+import random
+import threading
+import time
+import weakref
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from importlib import import_module
+from importlib.util import find_spec
 from typing import Any, Literal, Protocol, cast
 
+import numpy as np
+import numpy.typing as npt
+import requests
+
+from corpus.model_registry import get_sentence_transformer
+
 ProviderLiteral = Literal["local", "openai"]
+EmbeddingMatrix = npt.NDArray[np.float32]
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_OPENAI_BASE_URL = "https://api.openai.com/v1"
+# Rough characters-per-token ratio for English text with BPE tokenizers
+CHARS_PER_TOKEN = 4
+
+TokenCounter = Callable[[str], int]
+# Rate limits, overload and transient gateway failures are worth retrying
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
 
 
 class EmbeddingEncoder(Protocol):
     """Minimal protocol for embedding providers."""
 
-    def encode(self, texts: Sequence[str]) -> list[list[float]]:
-        """Encode a list of texts into dense vectors."""
+    def encode(self, texts: Sequence[str]) -> EmbeddingMatrix:
+        """Encode texts into a contiguous ``(len(texts), dim)`` float32 array."""
 
         raise NotImplementedError
 
 
+def as_embedding_matrix(vectors: Any) -> EmbeddingMatrix:
+    """Coerce encoder output into a 2-D C-contiguous float32 array.
+
+    Arrays that already match are returned without copying, so the built-in
+    encoders pay nothing; list-of-lists output from third-party encoders is
+    converted once.
+    """
+
+    matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+    if matrix.ndim == 2:
+        return matrix
+    if matrix.size == 0:
+        return matrix.reshape(0, 0)
+    msg = "Encoder output must be a 2-D batch of vectors"
+    raise ValueError(msg)
+
+
+def _empty_matrix() -> EmbeddingMatrix:
+    return np.empty((0, 0), dtype=np.float32)
+
+
 @dataclass(slots=True)
 class EncoderConfig:
     """Configuration parameters for building an encoder."""
@@ -33,25 +80,221 @@ class EncoderConfig:
     model_name: str
     batch_size: int
     openai_api_key: str | None = None
+    openai_base_url: str | None = None
+    max_concurrency: int = 1
+    requests_per_minute: int | None = None
+    tokens_per_minute: int | None = None
+    max_retries: int = 6
+    max_batch_tokens: int | None = None
+    count_tokens: TokenCounter | None = None
+    local_workers: int = 1
+    local_device: str | None = None
+    local_precision: str = "float32"
+    local_exact_tokens: bool = False
+
+
+def resolve_local_workers(workers: int) -> int:
+    """Map a worker setting to a process count (``0`` = one per CPU core)."""
+
+    if workers < 0:
+        msg = "local_workers must be zero (all cores) or positive"
+        raise ValueError(msg)
+    return workers or os.cpu_count() or 1
+
+
+def estimate_tokens(text: str) -> int:
+    """Character-based token estimate used when no tokenizer is available."""
+
+    return max(1, -(-len(text) // CHARS_PER_TOKEN))
+
+
+def resolve_token_counter(model_name: str) -> TokenCounter:
+    """Return a tiktoken-based counter for OpenAI models when installed.
+
+    Falls back to :func:`estimate_tokens` if ``tiktoken`` is missing or does
+    not know the model.
+    """
+
+    try:
+        tiktoken = import_module("tiktoken")
+    except ImportError:
+        return estimate_tokens
+    try:
+        encoding = tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        return estimate_tokens
+
+    def count(text: str) -> int:
+        return max(1, len(encoding.encode(text, disallowed_special=())))
+
+    return count
+
+
+def batch_by_token_budget(
+    texts: Sequence[str],
+    *,
+    max_tokens: int | None,
+    max_items: int | None = None,
+    count_tokens: TokenCounter = estimate_tokens,
+) -> list[range]:
+    """Group consecutive inputs into batches under a token budget.
+
+    Batches are contiguous index ranges, so concatenating their results
+    keeps the input order. A batch closes when adding the next text would
+    exceed ``max_tokens`` or ``max_items``; a single text over the budget
+    is sent on its own.
+
+    Args:
+        texts: Inputs to batch
+        max_tokens: Per-request token budget (None or <= 0 disables the
+            budget)
+        max_items: Per-request item limit (None disables the limit)
+        count_tokens: Token counter for a single input
+
+    Returns:
+        Index ranges into ``texts``
+    """
+
+    if max_tokens is not None and max_tokens <= 0:
+        max_tokens = None
+    if max_items is not None and max_items < 1:
+        msg = "max_items must be positive"
+        raise ValueError(msg)
+
+    batches: list[range] = []
+    start = 0
+    used = 0
+    for index, text in enumerate(texts):
+        tokens = count_tokens(text) if max_tokens is not None else 0
+        full = (max_items is not None and index - start >= max_items) or (
+            max_tokens is not None and used + tokens > max_tokens
+        )
+        if full and index > start:
+            batches.append(range(start, index))
+            start = index
+            used = 0
+        used += tokens
+    if start < len(texts):
+        batches.append(range(start, len(texts)))
+    return batches
+
+
+class EmbeddingRequestError(RuntimeError):
+    """Raised when the embeddings endpoint fails or rejects a request."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously per minute.
+
+    The bucket starts full and holds at most ``capacity`` tokens (one
+    minute's worth by default). Requests larger than the capacity are
+    clamped so they can still be admitted once the bucket is full.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        capacity: float | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate_per_minute <= 0:
+            msg = "Token bucket rate must be positive"
+            raise ValueError(msg)
+        self._rate = rate_per_minute / 60.0
+        self._capacity = float(capacity or rate_per_minute)
+        self._tokens = self._capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """Block until ``amount`` tokens are available; return seconds waited."""
+
+        amount = min(float(amount), self._capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                elapsed = max(0.0, now - self._updated)
+                self._tokens = min(
+                    self._capacity, self._tokens + elapsed * self._rate
+                )
+                self._updated = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                delay = (amount - self._tokens) / self._rate
+            self._sleep(delay)
+            waited += delay
+
+
+def backoff_delay(
+    attempt: int,
+    base_delay: float,
+    max_delay: float,
+    rng: random.Random | None = None,
+) -> float:
+    """Exponential backoff with full jitter for the given retry attempt."""
+
+    ceiling = min(max_delay, base_delay * (2**attempt))
+    return (rng or random).uniform(0.0, ceiling)
 
 
 def create_encoder(config: EncoderConfig) -> EmbeddingEncoder:
     """Instantiate an embedding encoder for the requested provider."""
 
     if config.provider == "local":
+        workers = resolve_local_workers(config.local_workers)
+        if workers > 1:
+            return _MultiProcessSentenceTransformerEncoder(
+                model_name=config.model_name,
+                batch_size=config.batch_size,
+                workers=workers,
+                device=config.local_device or "cpu",
+                precision=config.local_precision,
+                max_batch_tokens=config.max_batch_tokens,
+                count_tokens=config.count_tokens,
+            )
         return _LocalSentenceTransformerEncoder(
             model_name=config.model_name,
             batch_size=config.batch_size,
+            device=config.local_device,
+            precision=config.local_precision,
+            max_batch_tokens=config.max_batch_tokens,
+            count_tokens=config.count_tokens,
+            exact_tokens=config.local_exact_tokens,
         )
 
     if config.provider == "openai":
         if not config.openai_api_key:
             msg = "OPENAI_API_KEY is required when provider=openai"
             raise ValueError(msg)
+        if (
+            config.max_concurrency > 1
+            or config.requests_per_minute
+            or config.tokens_per_minute
+        ):
+            return _ConcurrentOpenAIEncoder(
+                model_name=config.model_name,
+                batch_size=config.batch_size,
+                api_key=config.openai_api_key,
+                base_url=config.openai_base_url,
+                max_concurrency=config.max_concurrency,
+                requests_per_minute=config.requests_per_minute,
+                tokens_per_minute=config.tokens_per_minute,
+                max_retries=config.max_retries,
+                max_batch_tokens=config.max_batch_tokens,
+                count_tokens=config.count_tokens,
+            )
         return _OpenAIEncoder(
             model_name=config.model_name,
             batch_size=config.batch_size,
             api_key=config.openai_api_key,
+            max_batch_tokens=config.max_batch_tokens,
+            count_tokens=config.count_tokens,
         )
 
     msg = f"Unsupported embedding provider: {config.provider}"
@@ -59,37 +302,216 @@ def create_encoder(config: EncoderConfig) -> EmbeddingEncoder:
 
 
 class _LocalSentenceTransformerEncoder:
-    """SentenceTransformer-backed encoder."""
+    """SentenceTransformer-backed encoder sharing the process model registry."""
 
-    def __init__(self, model_name: str, batch_size: int) -> None:
-        try:
-            sentence_transformers = import_module("sentence_transformers")
-        except ImportError as err:  # pragma: no cover - import guard
+    def __init__(
+        self,
+        model_name: str,
+        batch_size: int,
+        device: str | None = None,
+        precision: str = "float32",
+        max_batch_tokens: int | None = None,
+        count_tokens: TokenCounter | None = None,
+        exact_tokens: bool = False,
+    ) -> None:
+        self._model = get_sentence_transformer(
+            model_name, device=device, precision=precision
+        )
+        self._batch_size = batch_size
+        self._max_batch_tokens = max_batch_tokens
+        # model.encode tokenizes again, so the exact count is opt-in
+        self._count_tokens = count_tokens or (
+            self._model_token_counter() if exact_tokens else estimate_tokens
+        )
+
+    def count_tokens(self, text: str) -> int:
+        return self._count_tokens(text)
+
+    def encode(self, texts: Sequence[str]) -> EmbeddingMatrix:
+        if not texts:
+            return _empty_matrix()
+
+        vectors: list[EmbeddingMatrix] = []
+        for batch in batch_by_token_budget(
+            texts,
+            max_tokens=self._max_batch_tokens,
+            max_items=self._batch_size,
+            count_tokens=self._count_tokens,
+        ):
+            encoded: Any = self._model.encode(
+                [texts[index] for index in batch],
+                batch_size=len(batch),
+                show_progress_bar=False,
+                convert_to_numpy=True,
+            )
+            vectors.append(as_embedding_matrix(encoded))
+        return np.concatenate(vectors)
+
+    def _model_token_counter(self) -> TokenCounter:
+        tokenizer = getattr(self._model, "tokenizer", None)
+        if tokenizer is None:
+            return estimate_tokens
+        # Inputs are truncated to max_seq_length before encoding
+        limit = getattr(self._model, "max_seq_length", None) or None
+
+        def count(text: str) -> int:
+            tokens = len(tokenizer.encode(text, add_special_tokens=True))
+            return max(1, min(tokens, limit) if limit else tokens)
+
+        return count
+
+
+# Per-process model for _MultiProcessSentenceTransformerEncoder workers
+_WORKER_MODEL: Any = None
+
+
+def _load_sentence_transformer(
+    model_name: str, device: str, precision: str
+) -> Any:
+    return get_sentence_transformer(
+        model_name, device=device, precision=precision
+    )
+
+
+def _init_local_worker(
+    loader: Callable[[str, str, str], Any],
+    model_name: str,
+    device: str,
+    precision: str,
+    threads: int,
+) -> None:
+    global _WORKER_MODEL
+    # Split the cores between workers instead of letting each torch
+    # runtime spin up a thread per core
+    try:
+        torch = import_module("torch")
+    except ImportError:
+        pass
+    else:
+        torch.set_num_threads(threads)
+    _WORKER_MODEL = loader(model_name, device, precision)
+
+
+def _encode_local_chunk(texts: list[str]) -> EmbeddingMatrix:
+    encoded = _WORKER_MODEL.encode(
+        texts,
+        batch_size=len(texts),
+        show_progress_bar=False,
+        convert_to_numpy=True,
+    )
+    return as_embedding_matrix(encoded)
+
+
+class _MultiProcessSentenceTransformerEncoder:
+    """SentenceTransformer encoder fanned out over a pool of processes.
+
+    Each worker loads the model once in its initializer. Inputs are sorted
+    by length before chunking so every chunk pads to similar lengths, and
+    the vectors are scattered back into input order.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        batch_size: int,
+        workers: int,
+        device: str = "cpu",
+        precision: str = "float32",
+        max_batch_tokens: int | None = None,
+        count_tokens: TokenCounter | None = None,
+        loader: Callable[[str, str, str], Any] = _load_sentence_transformer,
+    ) -> None:
+        if loader is _load_sentence_transformer and (
+            find_spec("sentence_transformers") is None
+        ):  # pragma: no cover - import guard
             raise ImportError(
                 "sentence-transformers is not installed. "
                 "Install with 'poetry add sentence-transformers'"
-            ) from err
+            )
 
-        self._model = sentence_transformers.SentenceTransformer(model_name)
+        self._model_name = model_name
         self._batch_size = batch_size
+        self._workers = workers
+        self._device = device
+        self._precision = precision
+        self._max_batch_tokens = max_batch_tokens
+        self._count_tokens = count_tokens or estimate_tokens
+        self._loader = loader
+        self._pool: ProcessPoolExecutor | None = None
+        self.texts_per_second = 0.0
+
+    def count_tokens(self, text: str) -> int:
+        return self._count_tokens(text)
 
-    def encode(self, texts: Sequence[str]) -> list[list[float]]:
+    def encode(self, texts: Sequence[str]) -> EmbeddingMatrix:
         if not texts:
-            return []
+            return _empty_matrix()
+
+        started = time.perf_counter()
+        order = sorted(range(len(texts)), key=lambda index: len(texts[index]))
+        ordered = [texts[index] for index in order]
+        chunks = [
+            [ordered[index] for index in batch]
+            for batch in batch_by_token_budget(
+                ordered,
+                max_tokens=self._max_batch_tokens,
+                max_items=self._batch_size,
+                count_tokens=self._count_tokens,
+            )
+        ]
+        sorted_vectors = np.concatenate(
+            list(self._ensure_pool().map(_encode_local_chunk, chunks))
+        )
+        vectors = np.empty_like(sorted_vectors)
+        vectors[order] = sorted_vectors
 
-        vectors: Any = self._model.encode(
-            list(texts),
-            batch_size=self._batch_size,
-            show_progress_bar=False,
-            convert_to_numpy=True,
+        elapsed = max(time.perf_counter() - started, 1e-9)
+        self.texts_per_second = len(texts) / elapsed
+        LOGGER.info(
+            "Encoded %s texts with %s local workers in %.2fs (%.1f texts/sec)",
+            len(texts),
+            self._workers,
+            elapsed,
+            self.texts_per_second,
         )
-        return cast(list[list[float]], vectors.tolist())
+        return vectors
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            threads = max(1, (os.cpu_count() or 1) // self._workers)
+            # spawn avoids forking a parent that may hold torch/BLAS threads
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_local_worker,
+                initargs=(
+                    self._loader,
+                    self._model_name,
+                    self._device,
+                    self._precision,
+                    threads,
+                ),
+            )
+            weakref.finalize(self, self._pool.shutdown)
+        return self._pool
 
 
 class _OpenAIEncoder:
     """OpenAI Embeddings API backed encoder."""
 
-    def __init__(self, model_name: str, batch_size: int, api_key: str) -> None:
+    def __init__(
+        self,
+        model_name: str,
+        batch_size: int,
+        api_key: str,
+        max_batch_tokens: int | None = None,
+        count_tokens: TokenCounter | None = None,
+    ) -> None:
         try:
             openai_module = import_module("openai")
         except ImportError as err:  # pragma: no cover - import guard
@@ -101,24 +523,190 @@ class _OpenAIEncoder:
         OpenAI = cast(Any, openai_module.OpenAI)
         self._model_name = model_name
         self._batch_size = batch_size
+        self._max_batch_tokens = max_batch_tokens
+        self._count_tokens = count_tokens or resolve_token_counter(model_name)
         self._client = OpenAI(api_key=api_key)
 
-    def encode(self, texts: Sequence[str]) -> list[list[float]]:
+    def count_tokens(self, text: str) -> int:
+        return self._count_tokens(text)
+
+    def encode(self, texts: Sequence[str]) -> EmbeddingMatrix:
         if not texts:
-            return []
+            return _empty_matrix()
 
-        batches: list[list[float]] = []
-        for start in range(0, len(texts), self._batch_size):
-            batch_end = start + self._batch_size
-            batch = list(texts[start:batch_end])
+        batches: list[EmbeddingMatrix] = []
+        for indices in batch_by_token_budget(
+            texts,
+            max_tokens=self._max_batch_tokens,
+            max_items=self._batch_size,
+            count_tokens=self._count_tokens,
+        ):
+            batch = [texts[index] for index in indices]
             response = self._client.embeddings.create(
                 input=batch,
                 model=self._model_name,
             )
-            batch_vectors = [
-                [float(value) for value in item.embedding]
-                for item in response.data
-            ]
-            batches.extend(batch_vectors)
+            batches.append(
+                as_embedding_matrix([item.embedding for item in response.data])
+            )
 
-        return batches
+        return np.concatenate(batches)
+
+
+class _ConcurrentOpenAIEncoder:
+    """Embeddings endpoint client with bounded concurrency and rate limits.
+
+    Batches are sent from a small thread pool. Each request first takes one
+    token from the requests/min bucket and its estimated token count from
+    the tokens/min bucket. 429/5xx responses and connection errors are
+    retried with jittered exponential backoff, honouring ``Retry-After``.
+    Results are returned in input order.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        batch_size: int,
+        api_key: str,
+        *,
+        base_url: str | None = None,
+        max_concurrency: int = 4,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        max_retries: int = 6,
+        retry_base_delay: float = 0.5,
+        retry_max_delay: float = 30.0,
+        timeout: float = 60.0,
+        max_batch_tokens: int | None = None,
+        count_tokens: TokenCounter | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            msg = "max_concurrency must be at least 1"
+            raise ValueError(msg)
+        self._model_name = model_name
+        self._batch_size = batch_size
+        self._api_key = api_key
+        self._url = (
+            f"{(base_url or DEFAULT_OPENAI_BASE_URL).rstrip('/')}/embeddings"
+        )
+        self._max_concurrency = max_concurrency
+        self._request_bucket = (
+            TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self._token_bucket = (
+            TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        )
+        self._max_retries = max_retries
+        self._retry_base_delay = retry_base_delay
+        self._retry_max_delay = retry_max_delay
+        self._timeout = timeout
+        self._max_batch_tokens = max_batch_tokens
+        self._count_tokens = count_tokens or resolve_token_counter(model_name)
+        self._local = threading.local()
+
+    def count_tokens(self, text: str) -> int:
+        return self._count_tokens(text)
+
+    def encode(self, texts: Sequence[str]) -> EmbeddingMatrix:
+        if not texts:
+            return _empty_matrix()
+
+        batches = [
+            [texts[index] for index in indices]
+            for indices in batch_by_token_budget(
+                texts,
+                max_tokens=self._max_batch_tokens,
+                max_items=self._batch_size,
+                count_tokens=self._count_tokens,
+            )
+        ]
+        workers = min(self._max_concurrency, len(batches))
+        if workers == 1:
+            results = [self._embed_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # map() yields in submission order regardless of completion
+                results = list(pool.map(self._embed_batch, batches))
+        return np.concatenate(results)
+
+    def _embed_batch(self, batch: list[str]) -> EmbeddingMatrix:
+        estimated_tokens = sum(self._count_tokens(text) for text in batch)
+        for attempt in range(self._max_retries + 1):
+            if self._request_bucket is not None:
+                self._request_bucket.acquire(1)
+            if self._token_bucket is not None:
+                self._token_bucket.acquire(estimated_tokens)
+
+            retry_after: float | None = None
+            try:
+                response = self._session().post(
+                    self._url,
+                    json={"input": batch, "model": self._model_name},
+                    headers={"Authorization": f"Bearer {self._api_key}"},
+                    timeout=self._timeout,
+                )
+            except requests.RequestException as exc:
+                error: Exception = exc
+            else:
+                if response.status_code == 200:
+                    return _parse_embeddings_response(
+                        response.json(), len(batch)
+                    )
+                detail = response.text[:200]
+                error = EmbeddingRequestError(
+                    f"Embeddings request failed with HTTP "
+                    f"{response.status_code}: {detail}"
+                )
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    raise error
+                retry_after = _retry_after_seconds(response)
+
+            if attempt == self._max_retries:
+                msg = (
+                    "Embeddings request failed after "
+                    f"{self._max_retries + 1} attempts"
+                )
+                raise EmbeddingRequestError(msg) from error
+            delay = backoff_delay(
+                attempt, self._retry_base_delay, self._retry_max_delay
+            )
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            LOGGER.warning(
+                "Embeddings request failed (%s); retrying in %.2fs",
+                error,
+                delay,
+            )
+            time.sleep(delay)
+
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _session(self) -> requests.Session:
+        # requests.Session is not thread-safe; keep one per worker thread
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
+
+
+def _retry_after_seconds(response: requests.Response) -> float | None:
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _parse_embeddings_response(payload: Any, expected: int) -> EmbeddingMatrix:
+    data = cast(list[dict[str, Any]], payload.get("data") or [])
+    if len(data) != expected:
+        msg = (
+            "Embeddings response returned "
+            f"{len(data)} vectors for {expected} inputs"
+        )
+        raise EmbeddingRequestError(msg)
+    ordered = sorted(data, key=lambda item: int(item.get("index", 0)))
+    return as_embedding_matrix([item["embedding"] for item in ordered])
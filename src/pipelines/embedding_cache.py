@@ -0,0 +1,331 @@
+# pyright: reportMissingImports=false
+# pyright: reportUnknownArgumentType=false
+# pyright: reportUnknownMemberType=false
+# pyright: reportUnknownVariableType=false
+
+"""Content-addressed cache for lore embedding vectors."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import logging
+import sqlite3
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+import pyarrow.parquet as pq
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path("data/embeddings/embedding_cache.sqlite")
+DEFAULT_EMBEDDINGS_PATH = Path("data/embeddings/lore_embeddings.parquet")
+INPUT_HASH_COLUMN = "embedding_input_sha256"
+# Per-block input hashes written by the block pooling strategy
+BLOCK_HASHES_COLUMN = "embedding_block_sha256"
+VECTOR_DTYPE = np.dtype("<f4")
+CachedVector = npt.NDArray[np.float32]
+# Stay well below SQLite's bound-parameter limit on older builds
+_LOOKUP_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    input_sha256 BLOB NOT NULL,
+    dimension INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (provider, model, input_sha256)
+) WITHOUT ROWID
+"""
+
+__all__ = [
+    "BLOCK_HASHES_COLUMN",
+    "CacheStats",
+    "DEFAULT_CACHE_PATH",
+    "EmbeddingCache",
+    "INPUT_HASH_COLUMN",
+    "collect_garbage",
+    "embedding_input_hash",
+    "main",
+    "referenced_keys",
+]
+
+
+def embedding_input_hash(text: str) -> str:
+    """Return the sha256 hex digest of an exact embedding input."""
+
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Hit/miss counters for a single pipeline run."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class EmbeddingCache:
+    """Persistent (provider, model, sha256(input)) -> float32 vector store.
+
+    Vectors are stored as little-endian float32 blobs in a single SQLite file,
+    which keeps the cache compact and lets incremental runs add entries
+    without rewriting it. Cached vectors are returned as read-only float32
+    arrays viewing the stored blobs; callers should pass fresh vectors
+    through :meth:`put_many` so hits and misses share the same precision.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_CACHE_PATH,
+        *,
+        provider: str,
+        model: str,
+        readonly: bool = False,
+    ) -> None:
+        self.path = path
+        self.provider = provider
+        self.model = model
+        self.readonly = readonly
+        self.stats = CacheStats()
+        self._conn: sqlite3.Connection | None = None
+        if readonly:
+            if path.exists():
+                self._conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        else:
+            self._conn = _connect(path)
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, CachedVector]:
+        """Look up cached vectors for input hashes, recording hit stats."""
+
+        found: dict[str, CachedVector] = {}
+        unique = list(dict.fromkeys(keys))
+        if self._conn is not None:
+            for start in range(0, len(unique), _LOOKUP_CHUNK):
+                chunk = unique[start : start + _LOOKUP_CHUNK]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = self._conn.execute(
+                    "SELECT input_sha256, vector FROM embeddings "
+                    "WHERE provider = ? AND model = ? "
+                    f"AND input_sha256 IN ({placeholders})",
+                    [self.provider, self.model]
+                    + [bytes.fromhex(key) for key in chunk],
+                )
+                for digest, blob in rows:
+                    found[bytes(digest).hex()] = _from_blob(blob)
+        hits = sum(1 for key in keys if key in found)
+        self.stats.hits += hits
+        self.stats.misses += len(keys) - hits
+        return found
+
+    def put_many(
+        self, items: Mapping[str, npt.ArrayLike]
+    ) -> dict[str, CachedVector]:
+        """Store vectors and return them at cache (float32) precision."""
+
+        stored: dict[str, CachedVector] = {}
+        rows: list[tuple[str, str, bytes, int, bytes]] = []
+        for key, vector in items.items():
+            blob = _to_blob(vector)
+            stored[key] = _from_blob(blob)
+            rows.append(
+                (
+                    self.provider,
+                    self.model,
+                    bytes.fromhex(key),
+                    len(stored[key]),
+                    blob,
+                )
+            )
+        if rows and self._conn is not None and not self.readonly:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings "
+                    "(provider, model, input_sha256, dimension, vector) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+        return stored
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> EmbeddingCache:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def referenced_keys(
+    embeddings_paths: Iterable[Path],
+) -> dict[tuple[str, str], set[str]]:
+    """Collect (provider, model) -> input hashes used by embedding artifacts."""
+
+    referenced: dict[tuple[str, str], set[str]] = {}
+    columns = ["embedding_provider", "embedding_model", INPUT_HASH_COLUMN]
+    for path in embeddings_paths:
+        available = set(pq.read_schema(path).names)
+        missing = [column for column in columns if column not in available]
+        if missing:
+            missing_str = ", ".join(missing)
+            msg = (
+                f"{path} has no {missing_str} column(s); rebuild it before "
+                "collecting cache garbage"
+            )
+            raise ValueError(msg)
+        # Only the key columns; the vectors are never needed here
+        if BLOCK_HASHES_COLUMN in available:
+            columns_to_read = [*columns, BLOCK_HASHES_COLUMN]
+        else:
+            columns_to_read = columns
+        frame = pd.read_parquet(path, columns=columns_to_read)
+        for (provider, model), group in frame.groupby(
+            ["embedding_provider", "embedding_model"], sort=False
+        ):
+            keys = referenced.setdefault((str(provider), str(model)), set())
+            keys.update(group[INPUT_HASH_COLUMN].astype(str))
+            if BLOCK_HASHES_COLUMN in group.columns:
+                for block_hashes in group[BLOCK_HASHES_COLUMN].dropna():
+                    keys.update(str(value) for value in block_hashes)
+    return referenced
+
+
+def collect_garbage(
+    cache_path: Path,
+    referenced: Mapping[tuple[str, str], Iterable[str]],
+    *,
+    dry_run: bool = False,
+) -> int:
+    """Delete cache entries not referenced by any embedding artifact.
+
+    Returns the number of entries removed (or that would be removed).
+    """
+
+    if not cache_path.exists():
+        return 0
+    conn = _connect(cache_path)
+    try:
+        conn.execute(
+            "CREATE TEMP TABLE keep ("
+            "provider TEXT, model TEXT, input_sha256 BLOB, "
+            "PRIMARY KEY (provider, model, input_sha256))"
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO keep VALUES (?, ?, ?)",
+            (
+                (provider, model, bytes.fromhex(key))
+                for (provider, model), keys in referenced.items()
+                for key in keys
+            ),
+        )
+        predicate = (
+            "NOT EXISTS (SELECT 1 FROM keep k "
+            "WHERE k.provider = embeddings.provider "
+            "AND k.model = embeddings.model "
+            "AND k.input_sha256 = embeddings.input_sha256)"
+        )
+        if dry_run:
+            row = conn.execute(
+                f"SELECT COUNT(*) FROM embeddings WHERE {predicate}"
+            ).fetchone()
+            return int(row[0]) if row else 0
+        with conn:
+            removed = conn.execute(
+                f"DELETE FROM embeddings WHERE {predicate}"
+            ).rowcount
+        if removed:
+            conn.execute("VACUUM")
+        return removed
+    finally:
+        conn.close()
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute(_SCHEMA)
+    return conn
+
+
+def _to_blob(vector: npt.ArrayLike) -> bytes:
+    return np.asarray(vector, dtype=VECTOR_DTYPE).tobytes()
+
+
+def _from_blob(blob: bytes) -> CachedVector:
+    return np.frombuffer(blob, dtype=VECTOR_DTYPE)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Garbage-collect the embedding cache, keeping only entries "
+            "referenced by the given embedding parquet files"
+        )
+    )
+    parser.add_argument(
+        "--cache-path",
+        type=Path,
+        default=DEFAULT_CACHE_PATH,
+        help="Path to the embedding cache database",
+    )
+    parser.add_argument(
+        "--embeddings",
+        type=Path,
+        nargs="+",
+        default=[DEFAULT_EMBEDDINGS_PATH],
+        help="Embedding parquet files whose vectors must be kept",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report how many entries would be removed without deleting",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    try:
+        referenced = referenced_keys(args.embeddings)
+        removed = collect_garbage(
+            args.cache_path, referenced, dry_run=args.dry_run
+        )
+    except Exception as exc:  # noqa: BLE001
+        LOGGER.error("Embedding cache garbage collection failed: %s", exc)
+        raise SystemExit(1) from exc
+
+    verb = "Would remove" if args.dry_run else "Removed"
+    LOGGER.info(
+        "%s %s unreferenced cache entries from %s",
+        verb,
+        removed,
+        args.cache_path,
+    )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
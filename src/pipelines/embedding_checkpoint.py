@@ -0,0 +1,211 @@
+# pyright: reportMissingImports=false
+# pyright: reportUnknownArgumentType=false
+# pyright: reportUnknownMemberType=false
+# pyright: reportUnknownVariableType=false
+
+"""Resumable checkpoint directory for streaming lore embedding writes."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from pipelines.embedding_cache import INPUT_HASH_COLUMN
+
+LOGGER = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+PART_GLOB = "part-*.parquet"
+
+__all__ = [
+    "EmbeddingCheckpoint",
+    "checkpoint_dir_for",
+]
+
+
+def checkpoint_dir_for(output_path: Path) -> Path:
+    """Default checkpoint directory for an embeddings parquet."""
+
+    return output_path.with_name(f"{output_path.stem}.checkpoint")
+
+
+class EmbeddingCheckpoint:
+    """Directory of finished embedding batches, one parquet file per batch.
+
+    Each part is written to a temporary name and renamed into place, so a
+    crash never leaves a half-written part behind. ``manifest.json`` records
+    the provider, model and strategy the parts were built with; resuming
+    against a different manifest starts over.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        manifest: Mapping[str, object],
+    ) -> None:
+        self.directory = directory
+        self.manifest = dict(manifest)
+        self._next_part = 0
+
+    def reset(self) -> None:
+        """Drop any existing parts and start an empty checkpoint."""
+
+        if self.directory.exists():
+            shutil.rmtree(self.directory)
+        self.directory.mkdir(parents=True)
+        (self.directory / MANIFEST_NAME).write_text(
+            json.dumps(self.manifest, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+        self._next_part = 0
+
+    def resume(self) -> dict[str, str]:
+        """Return canonical_id -> input hash for rows already checkpointed.
+
+        Falls back to :meth:`reset` when there is nothing to resume or the
+        checkpoint was written with a different manifest.
+        """
+
+        manifest_path = self.directory / MANIFEST_NAME
+        if not manifest_path.exists():
+            LOGGER.info("No checkpoint at %s; starting fresh", self.directory)
+            self.reset()
+            return {}
+        stored = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if stored != self.manifest:
+            LOGGER.warning(
+                "Checkpoint at %s was built with %s; starting fresh",
+                self.directory,
+                stored,
+            )
+            self.reset()
+            return {}
+
+        done: dict[str, str] = {}
+        parts = self.parts()
+        for part in parts:
+            table = pq.read_table(
+                part, columns=["canonical_id", INPUT_HASH_COLUMN]
+            )
+            done.update(
+                zip(
+                    table.column("canonical_id").to_pylist(),
+                    table.column(INPUT_HASH_COLUMN).to_pylist(),
+                    strict=True,
+                )
+            )
+        self._next_part = len(parts)
+        LOGGER.info(
+            "Resuming from %s checkpointed rows in %s",
+            len(done),
+            self.directory,
+        )
+        return done
+
+    def parts(self) -> list[Path]:
+        return sorted(self.directory.glob(PART_GLOB))
+
+    def write_part(self, table: pa.Table) -> Path:
+        """Atomically add a finished batch to the checkpoint."""
+
+        path = self.directory / f"part-{self._next_part:06d}.parquet"
+        staging = path.with_suffix(".tmp")
+        pq.write_table(table, staging)
+        os.replace(staging, path)
+        self._next_part += 1
+        return path
+
+    def finalize(
+        self,
+        output_path: Path,
+        rows: Sequence[tuple[str, str]],
+        *,
+        chunk_rows: int,
+    ) -> None:
+        """Merge checkpointed rows into ``output_path`` and drop the parts.
+
+        ``rows`` lists the (canonical_id, input hash) pairs of the output in
+        order. Rows are copied ``chunk_rows`` at a time, so memory stays
+        bounded by the batch size rather than the corpus; stale checkpoint
+        rows (removed canonicals or outdated hashes) are left out.
+        """
+
+        parts = self.parts()
+        location: dict[tuple[str, str], tuple[int, int]] = {}
+        for part_index, part in enumerate(parts):
+            keys = pq.read_table(
+                part, columns=["canonical_id", INPUT_HASH_COLUMN]
+            )
+            for row, key in enumerate(
+                zip(
+                    keys.column("canonical_id").to_pylist(),
+                    keys.column(INPUT_HASH_COLUMN).to_pylist(),
+                    strict=True,
+                )
+            ):
+                location[key] = (part_index, row)
+        missing = [key for key in rows if key not in location]
+        if missing:
+            msg = (
+                f"Checkpoint {self.directory} is missing {len(missing)} rows "
+                f"(first: {missing[0][0]})"
+            )
+            raise RuntimeError(msg)
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        staging = output_path.with_name(f"{output_path.name}.tmp")
+        loaded: dict[int, pa.Table] = {}
+        writer: pq.ParquetWriter | None = None
+        try:
+            for start in range(0, len(rows), chunk_rows):
+                targets = [
+                    location[key] for key in rows[start : start + chunk_rows]
+                ]
+                by_part: dict[int, list[tuple[int, int]]] = {}
+                for position, (part_index, row) in enumerate(targets):
+                    by_part.setdefault(part_index, []).append((position, row))
+                # Parts are written in output order, so a chunk normally
+                # touches one or two of them
+                loaded = {
+                    part_index: loaded.get(part_index)
+                    or pq.read_table(parts[part_index])
+                    for part_index in by_part
+                }
+                positions = [
+                    position
+                    for entries in by_part.values()
+                    for position, _ in entries
+                ]
+                chunk = pa.concat_tables(
+                    [
+                        loaded[part_index].take(
+                            pa.array([row for _, row in entries])
+                        )
+                        for part_index, entries in by_part.items()
+                    ]
+                )
+                if positions != sorted(positions):
+                    order = sorted(
+                        range(len(positions)), key=positions.__getitem__
+                    )
+                    chunk = chunk.take(pa.array(order))
+                chunk = chunk.combine_chunks()
+                if writer is None:
+                    writer = pq.ParquetWriter(staging, chunk.schema)
+                writer.write_table(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+        if writer is None:
+            msg = "No embedding rows to write"
+            raise RuntimeError(msg)
+        os.replace(staging, output_path)
+        shutil.rmtree(self.directory)
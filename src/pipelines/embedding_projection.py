@@ -0,0 +1,225 @@
+# pyright: reportMissingImports=false
+# pyright: reportUnknownArgumentType=false
+# pyright: reportUnknownMemberType=false
+# pyright: reportUnknownVariableType=false
+
+"""Dimension-reducing projections for lore embedding indexes."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal, cast
+
+import numpy as np
+import numpy.typing as npt
+
+from pipelines.embedding_backends import EmbeddingMatrix, as_embedding_matrix
+
+LOGGER = logging.getLogger(__name__)
+
+ProjectionMethod = Literal["matryoshka", "pca"]
+PROJECTION_METHODS: tuple[ProjectionMethod, ...] = ("matryoshka", "pca")
+# Enough queries for a stable recall estimate without an O(n^2) search
+RECALL_QUERIES = 512
+
+__all__ = [
+    "PROJECTION_METHODS",
+    "EmbeddingProjection",
+    "ProjectionMethod",
+    "fit_projection",
+    "projection_recall",
+]
+
+
+@dataclass(slots=True)
+class EmbeddingProjection:
+    """Map full-size embeddings to ``output_dimension`` columns.
+
+    ``matryoshka`` keeps the leading columns and renormalises, which only
+    preserves similarity for models trained with nested (Matryoshka)
+    representations such as OpenAI ``text-embedding-3-*``. ``pca`` projects
+    onto the principal axes fitted on the indexed vectors and works for any
+    model. The axes are fitted without centring: search ranks by inner
+    product, which a mean shift would distort.
+    """
+
+    method: ProjectionMethod
+    input_dimension: int
+    output_dimension: int
+    components: npt.NDArray[np.float32] | None = None
+
+    def apply(self, vectors: npt.ArrayLike) -> EmbeddingMatrix:
+        """Project a (rows, input_dimension) matrix."""
+
+        matrix = as_embedding_matrix(vectors)
+        if matrix.shape[1] != self.input_dimension:
+            msg = (
+                f"Projection expects {self.input_dimension}-dim vectors, "
+                f"got {matrix.shape[1]}"
+            )
+            raise ValueError(msg)
+        if self.method == "matryoshka":
+            truncated = matrix[:, : self.output_dimension]
+            norms = np.linalg.norm(truncated, axis=1, keepdims=True)
+            return as_embedding_matrix(truncated / np.maximum(norms, 1e-12))
+        assert self.components is not None
+        return as_embedding_matrix(matrix @ self.components.T)
+
+    def describe(self) -> dict[str, object]:
+        """JSON-friendly summary for index metadata."""
+
+        return {
+            "method": self.method,
+            "input_dimension": self.input_dimension,
+            "output_dimension": self.output_dimension,
+        }
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays: dict[str, npt.NDArray[np.float32]] = {}
+        if self.components is not None:
+            arrays["components"] = self.components
+        with path.open("wb") as handle:
+            np.savez(
+                handle,
+                method=np.asarray(self.method),
+                dimensions=np.asarray(
+                    [self.input_dimension, self.output_dimension]
+                ),
+                **arrays,
+            )
+
+    @classmethod
+    def load(cls, path: Path) -> EmbeddingProjection:
+        with np.load(path) as payload:
+            method = str(payload["method"])
+            if method not in PROJECTION_METHODS:
+                msg = f"Unknown projection method in {path}: {method}"
+                raise ValueError(msg)
+            input_dimension, output_dimension = payload["dimensions"].tolist()
+            return cls(
+                method=cast(ProjectionMethod, method),
+                input_dimension=int(input_dimension),
+                output_dimension=int(output_dimension),
+                components=(
+                    payload["components"] if "components" in payload else None
+                ),
+            )
+
+
+def fit_projection(
+    matrix: npt.ArrayLike,
+    dimension: int,
+    method: ProjectionMethod = "pca",
+) -> EmbeddingProjection:
+    """
+    Build a projection from ``matrix`` down to ``dimension`` columns.
+
+    Args:
+        matrix: (rows, input_dimension) embeddings the index will hold
+        dimension: Target dimension
+        method: "pca" (fitted) or "matryoshka" (truncate and renormalise)
+
+    Returns:
+        Projection ready to apply to index and query vectors
+    """
+    vectors = as_embedding_matrix(matrix)
+    input_dimension = vectors.shape[1]
+    if not 0 < dimension < input_dimension:
+        msg = (
+            f"Reduced dimension must be between 1 and {input_dimension - 1}, "
+            f"got {dimension}"
+        )
+        raise ValueError(msg)
+    if method == "matryoshka":
+        return EmbeddingProjection(method, input_dimension, dimension)
+    if method != "pca":
+        msg = f"Unknown projection method: {method}"
+        raise ValueError(msg)
+    if len(vectors) < 2:
+        raise ValueError("PCA projection needs at least two vectors")
+
+    # Right singular vectors are the principal axes, largest first
+    _, singular_values, axes = np.linalg.svd(
+        vectors.astype(np.float64), full_matrices=False
+    )
+    if len(axes) < dimension:
+        msg = (
+            f"PCA needs at least {dimension} vectors for a "
+            f"{dimension}-dim projection, got {len(vectors)}"
+        )
+        raise ValueError(msg)
+    variance = singular_values**2
+    retained = float(variance[:dimension].sum() / max(variance.sum(), 1e-12))
+    LOGGER.info(
+        "PCA projection %s -> %s keeps %.1f%% of the squared norm",
+        input_dimension,
+        dimension,
+        100.0 * retained,
+    )
+    return EmbeddingProjection(
+        method="pca",
+        input_dimension=input_dimension,
+        output_dimension=dimension,
+        components=np.ascontiguousarray(axes[:dimension], dtype=np.float32),
+    )
+
+
+def projection_recall(
+    matrix: npt.ArrayLike,
+    projection: EmbeddingProjection,
+    *,
+    k: int = 10,
+    queries: int = RECALL_QUERIES,
+    seed: int = 0,
+) -> float:
+    """
+    Estimate recall@k of cosine search after projecting ``matrix``.
+
+    A sample of the indexed vectors is used as queries; the exact top-k
+    neighbours at full dimension are the ground truth. Each query is left
+    out of its own rankings, so a trivial self-match never counts as a hit.
+
+    Args:
+        matrix: Full-dimension vectors the index is built from
+        projection: Projection under test
+        k: Neighbours compared per query
+        queries: Maximum number of sampled queries
+        seed: Sampling seed
+
+    Returns:
+        Mean fraction of full-dimension neighbours also found after projection
+    """
+    full = _unit_rows(as_embedding_matrix(matrix))
+    reduced = _unit_rows(projection.apply(full))
+    k = min(k, len(full) - 1)
+    if k <= 0:
+        return 1.0
+    rng = np.random.default_rng(seed)
+    sample = rng.choice(len(full), size=min(queries, len(full)), replace=False)
+    expected = _top_k(_without_self(full[sample] @ full.T, sample), k)
+    found = _top_k(_without_self(reduced[sample] @ reduced.T, sample), k)
+    hits = sum(
+        len(set(truth).intersection(candidate))
+        for truth, candidate in zip(expected, found, strict=True)
+    )
+    return hits / (len(sample) * k)
+
+
+def _unit_rows(matrix: EmbeddingMatrix) -> EmbeddingMatrix:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return as_embedding_matrix(matrix / np.maximum(norms, 1e-12))
+
+
+def _without_self(
+    scores: npt.NDArray[np.float32], sample: npt.NDArray[np.int64]
+) -> npt.NDArray[np.float32]:
+    scores[np.arange(len(sample)), sample] = -np.inf
+    return scores
+
+
+def _top_k(scores: npt.NDArray[np.float32], k: int) -> list[list[int]]:
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    return top.tolist()
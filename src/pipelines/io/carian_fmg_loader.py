@@ -133,36 +133,33 @@ def load_carian_spell_fmg(raw_root: Path) -> list[dict[str, Any]]:
     return _load_name_caption_records(archive_root, spec)
 
 
+def carian_dialogue_paths(raw_root: Path) -> list[Path]:
+    """Return the TalkMsg/NpcName FMGs dialogue lines would be read from."""
+
+    archive_root = _resolve_archive_root(raw_root, context="dialogue FMGs")
+    if archive_root is None:
+        return []
+    talk_path, npc_path = _resolve_dialogue_fmgs(archive_root)
+    return [path for path in (talk_path, npc_path) if path is not None]
+
+
 def load_carian_dialogue_lines(raw_root: Path) -> list[dict[str, Any]]:
     """Parse TalkMsg/NpcName FMGs into dialogue lines."""
 
     archive_root = _resolve_archive_root(raw_root, context="dialogue FMGs")
     if archive_root is None:
         return []
-    talk_path = _resolve_candidate_path(
-        archive_root,
-        CARIAN_FMG_CANDIDATES["talk"],
-        description="Carian dialogue",
-        required=False,
-    )
+    talk_path, npc_path = _resolve_dialogue_fmgs(archive_root)
     if talk_path is None:
         LOGGER.warning("Skipping Carian dialogue ingestion; TalkMsg missing")
         return []
 
     talk_entries = _parse_fmg_file(talk_path)
 
-    npc_resolved = _resolve_candidate_path(
-        archive_root,
-        CARIAN_FMG_CANDIDATES["npc_name"],
-        description="Carian NPC names",
-        required=False,
-    )
-    if npc_resolved is None:
+    if npc_path is None:
         LOGGER.warning("NpcName FMG missing; continuing without speaker names")
-        npc_path = None
         npc_names: dict[int, str] = {}
     else:
-        npc_path = npc_resolved
         npc_names = _parse_fmg_file(npc_path)
 
     lines: list[dict[str, Any]] = []
@@ -192,6 +189,26 @@ def load_carian_dialogue_lines(raw_root: Path) -> list[dict[str, Any]]:
     return lines
 
 
+def _resolve_dialogue_fmgs(
+    archive_root: Path,
+) -> tuple[Path | None, Path | None]:
+    talk_path = _resolve_candidate_path(
+        archive_root,
+        CARIAN_FMG_CANDIDATES["talk"],
+        description="Carian dialogue",
+        required=False,
+    )
+    if talk_path is None:
+        return None, None
+    npc_path = _resolve_candidate_path(
+        archive_root,
+        CARIAN_FMG_CANDIDATES["npc_name"],
+        description="Carian NPC names",
+        required=False,
+    )
+    return talk_path, npc_path
+
+
 def _require_archive_root(raw_root: Path) -> Path:
     archive_root = raw_root / "carian_archive"
     if not archive_root.exists():
@@ -0,0 +1,182 @@
+# pyright: reportMissingImports=false
+# pyright: reportUnknownArgumentType=false
+# pyright: reportUnknownMemberType=false
+# pyright: reportUnknownVariableType=false
+
+"""Per-domain cache of extracted lore rows for incremental corpus builds."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from corpus.utils import compute_file_hash
+
+LOGGER = logging.getLogger(__name__)
+
+KEY_METADATA = b"lore_domain_key"
+ROW_SCHEMA = pa.schema(
+    [
+        pa.field(name, pa.string())
+        for name in (
+            "lore_id",
+            "canonical_id",
+            "category",
+            "source",
+            "text_type",
+            "language",
+            "text",
+            "provenance",
+        )
+    ]
+)
+
+__all__ = [
+    "CachedDomain",
+    "LoreDomainCache",
+    "ROW_SCHEMA",
+    "code_fingerprint",
+    "domain_cache_key",
+    "lore_cache_dir_for",
+    "rows_to_table",
+    "tables_to_frame",
+]
+
+
+def lore_cache_dir_for(output_path: Path) -> Path:
+    """Default domain cache directory for a lore corpus parquet."""
+
+    return output_path.with_name(f"{output_path.stem}.domains")
+
+
+def code_fingerprint(source_files: Iterable[Path]) -> str:
+    """Hash the extraction source so code changes invalidate cached rows."""
+
+    digest = hashlib.sha256()
+    for path in source_files:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def domain_cache_key(
+    domain: str,
+    inputs: Sequence[Path],
+    *,
+    code_version: str,
+) -> str:
+    """
+    Key a domain's rows by its input artifacts and the extraction code.
+
+    Args:
+        domain: Domain name (a lore category, ``carian_dialogue``, ...)
+        inputs: Files the domain is extracted from; missing files are keyed
+            as absent so creating them invalidates the entry
+        code_version: Fingerprint of the extraction code
+
+    Returns:
+        sha256 hex digest
+    """
+    payload = {
+        "domain": domain,
+        "code_version": code_version,
+        "inputs": [
+            [str(path), compute_file_hash(path) if path.is_file() else None]
+            for path in inputs
+        ],
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def rows_to_table(rows: Sequence[Mapping[str, Any]]) -> pa.Table:
+    """Build a ``ROW_SCHEMA`` table from extracted lore row dicts."""
+
+    return pa.Table.from_pylist(list(rows), schema=ROW_SCHEMA)
+
+
+def tables_to_frame(tables: Sequence[pa.Table]) -> pd.DataFrame:
+    """Concatenate domain tables, in order, into one lore frame."""
+
+    return pa.concat_tables(
+        [table.replace_schema_metadata(None) for table in tables]
+    ).to_pandas()
+
+
+@dataclass(slots=True)
+class CachedDomain:
+    """Lore rows of one domain plus any small scalar side results."""
+
+    table: pa.Table
+    metadata: dict[str, str] = field(default_factory=dict)
+
+
+class LoreDomainCache:
+    """Directory holding one parquet of extracted lore rows per domain.
+
+    The key a domain was built with is stored in the parquet schema
+    metadata; a lookup with any other key is a miss and the next store
+    replaces the file.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def path_for(self, domain: str) -> Path:
+        return self.directory / f"{domain}.parquet"
+
+    def load(self, domain: str, key: str) -> CachedDomain | None:
+        """Return the rows cached for ``domain`` under ``key``, if any."""
+
+        path = self.path_for(domain)
+        if not path.exists():
+            return None
+        try:
+            table = pq.read_table(path)
+        except (OSError, pa.ArrowInvalid) as err:
+            LOGGER.warning("Ignoring unreadable lore cache %s: %s", path, err)
+            return None
+        metadata = table.schema.metadata or {}
+        if metadata.get(KEY_METADATA) != key.encode():
+            return None
+        extras = {
+            name.decode(): value.decode()
+            for name, value in metadata.items()
+            if name != KEY_METADATA
+        }
+        return CachedDomain(
+            table=table.replace_schema_metadata(None), metadata=extras
+        )
+
+    def store(
+        self,
+        domain: str,
+        key: str,
+        table: pa.Table,
+        metadata: Mapping[str, str] | None = None,
+    ) -> None:
+        """Atomically replace the cached rows for ``domain``."""
+
+        table = table.replace_schema_metadata(
+            {
+                KEY_METADATA: key.encode(),
+                **{
+                    name.encode(): value.encode()
+                    for name, value in (metadata or {}).items()
+                },
+            }
+        )
+        path = self.path_for(domain)
+        staging = path.with_suffix(".tmp")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table, staging)
+        os.replace(staging, path)
@@ -54,6 +54,7 @@ class MotifClusteringConfig:
     embedding_provider: ProviderLiteral = "local"
     embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
     embedding_batch_size: int = 64
+    embedding_workers: int = 1
     random_seed: int = 42
     max_rows: int | None = None
     min_cluster_size: int = 10
@@ -173,9 +174,17 @@ class MotifClusteringPipeline:
             model_name=self.config.embedding_model,
             batch_size=self.config.embedding_batch_size,
             openai_api_key=settings.openai_api_key or None,
+            local_workers=self.config.embedding_workers,
+            local_device=settings.embed_local_device,
+            local_precision=settings.embed_local_precision,
         )
         encoder = create_encoder(encoder_config)
-        vectors = encoder.encode(texts)
+        try:
+            vectors = encoder.encode(texts)
+        finally:
+            close = getattr(encoder, "close", None)
+            if callable(close):
+                close()
         array = np.asarray(vectors, dtype=np.float32)
         return array
 
@@ -29,3 +29,15 @@ def list_schema_versions(dataset: str | None = None) -> Any:
     if dataset is None:
         return module.list_schema_versions()
     return module.list_schema_versions(dataset)
+
+
+def validation_modes() -> tuple[str, ...]:
+    """Runtime proxy to pipeline.schemas.VALIDATION_MODES."""
+
+    return tuple(_schemas_module().VALIDATION_MODES)
+
+
+def validate_with_mode(schema: Any, df: Any, mode: str = "full") -> Any:
+    """Runtime proxy to pipeline.schemas.validate_with_mode."""
+
+    return _schemas_module().validate_with_mode(schema, df, mode)
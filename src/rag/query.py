@@ -27,6 +27,7 @@ from pipelines.build_rag_index import (
     RAGIndexError,
     load_query_helper,
 )
+from pipelines.embedding_backends import EmbeddingMatrix
 from rag.reranker import (
     RerankerProtocol,
     load_reranker,
@@ -46,8 +47,8 @@ BalancedMode = Literal["balanced", "raw"]
 class EncoderProtocol(Protocol):
     """Minimal protocol for embedding encoders."""
 
-    def encode(self, texts: Sequence[str]) -> list[list[float]]:
-        """Encode input texts into vector representations."""
+    def encode(self, texts: Sequence[str]) -> EmbeddingMatrix:
+        """Encode input texts into a (len(texts), dim) float32 array."""
 
         pass
         raise NotImplementedError
@@ -9,6 +9,7 @@ from types import ModuleType
 from typing import TYPE_CHECKING, Any, Protocol, cast
 
 from corpus.config import settings
+from corpus.model_registry import get_cross_encoder
 
 SentenceCrossEncoder = Any
 
@@ -157,10 +158,11 @@ def _default_cross_encoder_factory(
             "transformers to your environment."
         )
         raise ImportError(msg)
-    kwargs = {"model_name": model_name}
-    if device:
-        kwargs["device"] = device
-    return CrossEncoder(**kwargs)
+    return get_cross_encoder(
+        model_name,
+        device=device,
+        precision=settings.reranker_precision,
+    )
 
 
 def load_reranker(
@@ -31,6 +31,20 @@ except ModuleNotFoundError:
     sys.modules["openai"] = openai_module
 
 
+@pytest.fixture(autouse=True)
+def _isolate_rag_guard_state(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Keep embedding runs from rewriting the repo's RAG guard state."""
+    from pipelines import rag_guard
+
+    monkeypatch.setattr(
+        rag_guard,
+        "DEFAULT_STATE_PATH",
+        tmp_path / "embeddings" / "rag_rebuild_state.json",
+    )
+
+
 @pytest.fixture
 def sample_entity_data() -> dict[str, Any]:
     """Sample entity data for testing."""
@@ -114,9 +128,10 @@ def pg_connection(postgres_dsn: str | None) -> Generator[Any, None, None]:
         extensions_sql = (sql_dir / "001_enable_extensions.sql").read_text()
         cur.execute(extensions_sql)
 
-        # Create schema
-        schema_sql = (sql_dir / "010_schema.sql").read_text()
-        cur.execute(schema_sql)
+        # Create schema (vector dimension placeholder rendered from settings)
+        from corpus.pgvector_loader import render_schema_sql
+
+        cur.execute(render_schema_sql())
 
         # Create indexes
         indexes_sql = (sql_dir / "020_indexes.sql").read_text()
@@ -6,6 +6,7 @@ from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from corpus.community_schema import MotifCategory, MotifEntry, MotifTaxonomy
 
@@ -26,7 +27,7 @@ class DeterministicEncoder:
 
     dim: int = 4
 
-    def encode(self, texts: Sequence[str]) -> list[list[float]]:
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
         """Return pseudo-random vectors derived from the text content."""
 
         if self.dim <= 0:
@@ -41,7 +42,27 @@ class DeterministicEncoder:
                 for index in range(self.dim)
             ]
             vectors.append(vector)
-        return vectors
+        return np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+
+
+class SentenceModelStub:
+    """Picklable stand-in for a SentenceTransformer inside worker processes."""
+
+    def __init__(
+        self, model_name: str, device: str, precision: str = "float32"
+    ) -> None:
+        self.model_name = model_name
+        self.device = device
+        self.precision = precision
+
+    def encode(self, texts: Sequence[str], **_: object) -> np.ndarray:
+        return np.asarray(
+            [
+                [float(len(text)), float(ord(text[0]) if text else 0)]
+                for text in texts
+            ],
+            dtype=np.float32,
+        )
 
 
 def write_sample_lore_corpus(base_dir: Path) -> Path:
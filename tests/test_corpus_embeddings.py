@@ -0,0 +1,132 @@
+"""Tests for embedding storage helpers."""
+
+import json
+
+import numpy as np
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from corpus.embeddings import (
+    EMBEDDING_DTYPE,
+    arrow_embedding_matrix,
+    embedding_matrix,
+    embeddings_to_series,
+    fixed_size_embedding_array,
+    normalize_embedding_column,
+    read_embeddings_parquet,
+)
+from corpus.pgvector_loader import prepare_chunk_rows
+
+
+def test_embeddings_to_series_stores_float32_lists() -> None:
+    """Vectors are stored as float32 lists, not JSON strings."""
+    vectors = np.arange(6, dtype=np.float64).reshape(3, 2)
+    series = embeddings_to_series(vectors)
+
+    assert series.dtype == EMBEDDING_DTYPE
+    matrix = embedding_matrix(series)
+    assert matrix.dtype == np.float32
+    assert matrix.shape == (3, 2)
+    np.testing.assert_array_equal(matrix, vectors)
+
+
+def test_read_embeddings_parquet_upgrades_legacy_json(tmp_path) -> None:
+    """Parquet files with JSON-string embeddings still load."""
+    path = tmp_path / "legacy.parquet"
+    pl.DataFrame(
+        {
+            "description": ["a", "b", "c"],
+            "embedding": [json.dumps([0.5, 1.0]), "", json.dumps([2, 3])],
+        }
+    ).write_parquet(path)
+
+    frame = read_embeddings_parquet(path)
+
+    assert frame.schema["embedding"] == EMBEDDING_DTYPE
+    assert frame.get_column("embedding").to_list() == [
+        [0.5, 1.0],
+        None,
+        [2.0, 3.0],
+    ]
+
+
+def test_binary_parquet_roundtrip_is_lossless(tmp_path) -> None:
+    """float32 vectors survive a parquet roundtrip bit for bit."""
+    vectors = np.random.default_rng(7).random((4, 8), dtype=np.float32)
+    path = tmp_path / "binary.parquet"
+    pl.DataFrame([embeddings_to_series(vectors)]).write_parquet(path)
+
+    frame = read_embeddings_parquet(path)
+
+    np.testing.assert_array_equal(
+        embedding_matrix(frame.get_column("embedding")), vectors
+    )
+
+
+def test_fixed_size_parquet_column_loads_zero_copy(tmp_path) -> None:
+    """Fixed-size float32 columns come back as a view of the Arrow buffer."""
+    vectors = np.random.default_rng(3).random((5, 4), dtype=np.float32)
+    path = tmp_path / "fixed.parquet"
+    table = pa.table({"embedding": fixed_size_embedding_array(vectors)})
+    pq.write_table(table, path)
+
+    column = pq.read_table(path).column("embedding")
+    matrix = arrow_embedding_matrix(column)
+
+    assert column.type == pa.list_(pa.float32(), 4)
+    assert matrix.dtype == np.float32
+    assert not matrix.flags.owndata
+    np.testing.assert_array_equal(matrix, vectors)
+
+
+def test_arrow_embedding_matrix_accepts_variable_size_lists() -> None:
+    """float64 list columns from older parquet files are converted."""
+    legacy = pa.array([[0.5, 1.0], [2.0, 3.0]], type=pa.list_(pa.float64()))
+
+    matrix = arrow_embedding_matrix(legacy)
+
+    assert matrix.dtype == np.float32
+    np.testing.assert_array_equal(matrix, [[0.5, 1.0], [2.0, 3.0]])
+    with pytest.raises(ValueError, match="different sizes"):
+        arrow_embedding_matrix(pa.array([[1.0, 2.0], [1.0]]))
+
+
+def test_embedding_matrix_rejects_ragged_or_missing_vectors() -> None:
+    """A matrix view needs one vector of the same size per row."""
+    ragged = pl.Series("embedding", [[1.0, 2.0], [1.0]], dtype=EMBEDDING_DTYPE)
+    missing = pl.Series("embedding", [[1.0], None], dtype=EMBEDDING_DTYPE)
+
+    with pytest.raises(ValueError, match="different sizes"):
+        embedding_matrix(ragged)
+    with pytest.raises(ValueError, match="missing"):
+        embedding_matrix(missing)
+
+
+def test_normalize_embedding_column_without_embeddings() -> None:
+    """Frames without an embedding column pass through untouched."""
+    frame = pl.DataFrame({"description": ["a"]})
+    assert normalize_embedding_column(frame) is frame
+
+
+def test_prepare_chunk_rows_accepts_both_storage_formats() -> None:
+    """Loader rows carry float32 arrays whichever format the parquet used."""
+    base = {
+        "entity_type": ["weapon"],
+        "slug": ["dagger"],
+        "is_dlc": [False],
+        "name": ["Dagger"],
+        "description": ["A dagger."],
+        "meta_json": ["{}"],
+        "sources": ['["kaggle_base"]'],
+    }
+    legacy = pl.DataFrame({**base, "embedding": ["[0.25, 0.5]"]})
+    binary = pl.DataFrame(base).with_columns(
+        embeddings_to_series([[0.25, 0.5]])
+    )
+
+    for frame in (legacy, binary):
+        (row,) = prepare_chunk_rows(frame)
+        assert isinstance(row.embedding, np.ndarray)
+        assert row.embedding.dtype == np.float32
+        np.testing.assert_array_equal(row.embedding, [0.25, 0.5])
@@ -0,0 +1,351 @@
+# pyright: reportMissingImports=false
+# pyright: reportUnknownArgumentType=false
+# pyright: reportUnknownMemberType=false
+# pyright: reportUnknownVariableType=false
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from importlib.util import find_spec
+from typing import Any
+
+import numpy as np
+import pytest
+
+from pipelines import embedding_backends
+from pipelines.embedding_backends import (
+    EmbeddingRequestError,
+    EncoderConfig,
+    TokenBucket,
+    backoff_delay,
+    batch_by_token_budget,
+    create_encoder,
+    estimate_tokens,
+    resolve_local_workers,
+)
+from tests.helpers import SentenceModelStub
+
+
+@dataclass
+class StubEmbeddingsAPI:
+    """Behaviour and bookkeeping for the stub embeddings endpoint."""
+
+    failures: list[int] = field(default_factory=list)
+    retry_after: str | None = "0"
+    latency: float = 0.0
+    requests: list[list[str]] = field(default_factory=list)
+    authorization: set[str] = field(default_factory=set)
+    in_flight: int = 0
+    max_in_flight: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def handle(self, payload: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        with self.lock:
+            self.requests.append(list(payload["input"]))
+            if self.failures:
+                return self.failures.pop(0), {"error": {"message": "busy"}}
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self.lock:
+            self.in_flight -= 1
+        data = [
+            {"object": "embedding", "index": index, "embedding": _vector(text)}
+            for index, text in enumerate(payload["input"])
+        ]
+        # The real endpoint does not promise ordering; make the client sort
+        data.reverse()
+        return 200, {"object": "list", "data": data, "model": payload["model"]}
+
+
+def _vector(text: str) -> list[float]:
+    return [float(len(text)), float(sum(map(ord, text)) % 97)]
+
+
+@pytest.fixture
+def stub_api() -> Iterator[tuple[str, StubEmbeddingsAPI]]:
+    api = StubEmbeddingsAPI()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802 - http.server API
+            length = int(self.headers.get("Content-Length", "0"))
+            payload = json.loads(self.rfile.read(length))
+            api.authorization.add(self.headers.get("Authorization", ""))
+            status, body = api.handle(payload)
+            encoded = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(encoded)))
+            if status == 429 and api.retry_after is not None:
+                self.send_header("Retry-After", api.retry_after)
+            self.end_headers()
+            self.wfile.write(encoded)
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/v1", api
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _encoder(base_url: str, **overrides: Any) -> Any:
+    options: dict[str, Any] = {
+        "base_url": base_url,
+        "max_concurrency": 4,
+        "retry_base_delay": 0.001,
+        "retry_max_delay": 0.01,
+    }
+    options.update(overrides)
+    return embedding_backends._ConcurrentOpenAIEncoder(
+        model_name="text-embedding-3-small",
+        batch_size=2,
+        api_key="sk-test",
+        **options,
+    )
+
+
+def test_concurrent_encoder_preserves_input_order(
+    stub_api: tuple[str, StubEmbeddingsAPI],
+) -> None:
+    base_url, api = stub_api
+    api.latency = 0.05
+    texts = [f"lore fragment {index}" * (index % 3 + 1) for index in range(16)]
+
+    vectors = _encoder(base_url).encode(texts)
+
+    np.testing.assert_array_equal(vectors, [_vector(text) for text in texts])
+    assert len(api.requests) == 8
+    assert 1 < api.max_in_flight <= 4
+    assert api.authorization == {"Bearer sk-test"}
+
+
+def test_concurrent_encoder_retries_rate_limits_and_server_errors(
+    stub_api: tuple[str, StubEmbeddingsAPI],
+) -> None:
+    base_url, api = stub_api
+    api.failures = [429, 500, 503]
+
+    vectors = _encoder(base_url, max_concurrency=1).encode(["a", "bb", "ccc"])
+
+    np.testing.assert_array_equal(
+        vectors, [_vector(text) for text in ["a", "bb", "ccc"]]
+    )
+    assert len(api.requests) == 5
+
+
+def test_concurrent_encoder_gives_up_after_max_retries(
+    stub_api: tuple[str, StubEmbeddingsAPI],
+) -> None:
+    base_url, api = stub_api
+    api.failures = [429] * 5
+
+    with pytest.raises(EmbeddingRequestError, match="after 3 attempts"):
+        _encoder(base_url, max_retries=2).encode(["a"])
+    assert len(api.requests) == 3
+
+
+def test_concurrent_encoder_does_not_retry_client_errors(
+    stub_api: tuple[str, StubEmbeddingsAPI],
+) -> None:
+    base_url, api = stub_api
+    api.failures = [400]
+
+    with pytest.raises(EmbeddingRequestError, match="HTTP 400"):
+        _encoder(base_url).encode(["a"])
+    assert len(api.requests) == 1
+
+
+def test_create_encoder_selects_concurrent_mode() -> None:
+    config = EncoderConfig(
+        provider="openai",
+        model_name="text-embedding-3-small",
+        batch_size=8,
+        openai_api_key="sk-test",
+        max_concurrency=4,
+    )
+    encoder = create_encoder(config)
+    assert isinstance(encoder, embedding_backends._ConcurrentOpenAIEncoder)
+
+
+def test_token_bucket_waits_for_refill() -> None:
+    now = [0.0]
+    sleeps: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(60, clock=lambda: now[0], sleep=sleep)
+
+    assert bucket.acquire(60) == 0.0
+    assert bucket.acquire(30) == pytest.approx(30.0)
+    assert sleeps == [pytest.approx(30.0)]
+    # Oversized requests are clamped to the bucket capacity
+    assert bucket.acquire(600) == pytest.approx(60.0)
+
+
+def test_backoff_delay_grows_exponentially_with_jitter() -> None:
+    class UpperBound:
+        def uniform(self, low: float, high: float) -> float:
+            return high
+
+    rng: Any = UpperBound()
+    delays = [backoff_delay(attempt, 0.5, 4.0, rng) for attempt in range(5)]
+    assert delays == [0.5, 1.0, 2.0, 4.0, 4.0]
+
+    for attempt in range(5):
+        assert 0.0 <= backoff_delay(attempt, 0.5, 4.0) <= 4.0
+
+
+def test_batch_by_token_budget_packs_contiguous_ranges() -> None:
+    texts = ["aaaa" * 3, "aaaa" * 3, "aaaa" * 5, "a", "aaaa" * 20, "aa"]
+
+    batches = batch_by_token_budget(texts, max_tokens=6)
+
+    # Oversized inputs travel alone; ranges cover every index in order
+    assert batches == [range(0, 2), range(2, 4), range(4, 5), range(5, 6)]
+    assert [index for batch in batches for index in batch] == list(
+        range(len(texts))
+    )
+
+
+def test_batch_by_token_budget_respects_item_limit_and_counter() -> None:
+    texts = ["one two", "three", "four five six", "seven"]
+
+    def count_words(text: str) -> int:
+        return len(text.split())
+
+    assert batch_by_token_budget(texts, max_tokens=None, max_items=3) == [
+        range(0, 3),
+        range(3, 4),
+    ]
+    assert batch_by_token_budget(
+        texts, max_tokens=3, count_tokens=count_words
+    ) == [range(0, 2), range(2, 3), range(3, 4)]
+    # A non-positive budget means no budget rather than an error
+    assert batch_by_token_budget(texts, max_tokens=0, max_items=3) == [
+        range(0, 3),
+        range(3, 4),
+    ]
+    assert batch_by_token_budget([], max_tokens=3) == []
+    with pytest.raises(ValueError, match="max_items"):
+        batch_by_token_budget(texts, max_tokens=3, max_items=0)
+
+
+def test_estimate_tokens_rounds_up() -> None:
+    assert estimate_tokens("") == 1
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
+
+
+def test_concurrent_encoder_splits_batches_by_token_budget(
+    stub_api: tuple[str, StubEmbeddingsAPI],
+) -> None:
+    base_url, api = stub_api
+    texts = ["x" * 40, "y" * 8, "z" * 8, "w" * 4, "v" * 4]
+
+    vectors = _encoder(
+        base_url,
+        max_concurrency=1,
+        max_batch_tokens=10,
+        count_tokens=estimate_tokens,
+    ).encode(texts)
+
+    np.testing.assert_array_equal(vectors, [_vector(text) for text in texts])
+    # batch_size=2 and 10 tokens per request
+    assert api.requests == [[texts[0]], texts[1:3], texts[3:5]]
+
+
+def test_multiprocess_local_encoder_restores_input_order() -> None:
+    texts = [
+        f"{chr(97 + index % 26)}{'x' * (index * 7 % 23)}"
+        for index in range(40)
+    ]
+    encoder = embedding_backends._MultiProcessSentenceTransformerEncoder(
+        model_name="stub-model",
+        batch_size=4,
+        workers=2,
+        loader=SentenceModelStub,
+    )
+    try:
+        vectors = encoder.encode(texts)
+    finally:
+        encoder.close()
+
+    assert vectors.dtype == np.float32
+    np.testing.assert_array_equal(
+        vectors, [[len(text), ord(text[0])] for text in texts]
+    )
+    assert encoder.texts_per_second > 0
+
+
+def test_create_encoder_selects_multiprocess_local_mode() -> None:
+    config = EncoderConfig(
+        provider="local",
+        model_name="all-MiniLM-L6-v2",
+        batch_size=8,
+        local_workers=2,
+    )
+    if find_spec("sentence_transformers") is None:
+        with pytest.raises(ImportError, match="sentence-transformers"):
+            create_encoder(config)
+        return
+    encoder = create_encoder(config)
+    assert isinstance(
+        encoder, embedding_backends._MultiProcessSentenceTransformerEncoder
+    )
+
+
+def test_local_encoder_uses_model_tokenizer_only_when_asked(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tokenized: list[str] = []
+
+    class Tokenizer:
+        def encode(self, text: str, **_: object) -> list[int]:
+            tokenized.append(text)
+            return [0] * len(text.split())
+
+    class Model(SentenceModelStub):
+        tokenizer = Tokenizer()
+        max_seq_length = 256
+
+    monkeypatch.setattr(
+        embedding_backends,
+        "get_sentence_transformer",
+        lambda name, **kwargs: Model(name, device="cpu"),
+    )
+    config = EncoderConfig(
+        provider="local",
+        model_name="all-MiniLM-L6-v2",
+        batch_size=8,
+        max_batch_tokens=1000,
+    )
+    texts = ["moon veil", "night and flame sword"]
+
+    create_encoder(config).encode(texts)
+    assert tokenized == []
+
+    config.local_exact_tokens = True
+    encoder = create_encoder(config)
+    encoder.encode(texts)
+    assert tokenized == texts
+    assert encoder.count_tokens("night and flame sword") == 4
+
+
+def test_resolve_local_workers_uses_all_cores_for_zero() -> None:
+    assert resolve_local_workers(3) == 3
+    assert resolve_local_workers(0) >= 1
+    with pytest.raises(ValueError, match="local_workers"):
+        resolve_local_workers(-1)
@@ -0,0 +1,77 @@
+# pyright: reportMissingImports=false
+# pyright: reportUnknownArgumentType=false
+# pyright: reportUnknownMemberType=false
+# pyright: reportUnknownVariableType=false
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pipelines.embedding_projection import (
+    EmbeddingProjection,
+    fit_projection,
+    projection_recall,
+)
+
+
+def _low_rank_vectors(rows: int = 400, rank: int = 6, dim: int = 48):
+    rng = np.random.default_rng(7)
+    basis = rng.normal(size=(rank, dim))
+    return (rng.normal(size=(rows, rank)) @ basis).astype(np.float32)
+
+
+def test_pca_projection_keeps_neighbours_of_low_rank_data() -> None:
+    vectors = _low_rank_vectors()
+
+    pca = fit_projection(vectors, 6, "pca")
+    truncated = fit_projection(vectors, 6, "matryoshka")
+
+    assert pca.apply(vectors).shape == (400, 6)
+    assert projection_recall(vectors, pca) == pytest.approx(1.0)
+    # Plain truncation is only meant for Matryoshka-trained models
+    assert projection_recall(vectors, truncated) < 0.9
+
+
+def test_projection_recall_ignores_query_self_matches() -> None:
+    noise = np.random.default_rng(3).normal(size=(400, 48))
+    truncated = fit_projection(noise, 2, "matryoshka")
+
+    # Counting each query as its own neighbour would floor this at 1/k
+    assert projection_recall(noise, truncated) < 0.1
+    assert projection_recall(noise[:1], truncated) == 1.0
+
+
+def test_matryoshka_projection_truncates_and_renormalises() -> None:
+    projection = fit_projection(np.eye(4, dtype=np.float32), 2, "matryoshka")
+
+    projected = projection.apply([[3.0, 4.0, 5.0, 6.0]])
+
+    np.testing.assert_allclose(projected, [[0.6, 0.8]], rtol=1e-6)
+    with pytest.raises(ValueError, match="4-dim"):
+        projection.apply([[1.0, 2.0]])
+
+
+def test_projection_round_trips_through_npz(tmp_path: Path) -> None:
+    vectors = _low_rank_vectors()
+    projection = fit_projection(vectors, 3, "pca")
+    path = tmp_path / "projection.npz"
+
+    projection.save(path)
+    loaded = EmbeddingProjection.load(path)
+
+    assert loaded.describe() == projection.describe()
+    np.testing.assert_array_equal(
+        loaded.apply(vectors), projection.apply(vectors)
+    )
+
+
+def test_fit_projection_rejects_invalid_dimensions() -> None:
+    vectors = _low_rank_vectors(rows=4, dim=8)
+
+    with pytest.raises(ValueError, match="between 1 and 7"):
+        fit_projection(vectors, 8)
+    with pytest.raises(ValueError, match="at least 6 vectors"):
+        fit_projection(vectors, 6)
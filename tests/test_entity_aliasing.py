@@ -313,3 +313,42 @@ def test_entity_aliases_distinguish_melina_and_marika() -> None:
         "npc:carian_speaker_20540100",
         "npc:carian_speaker_100130010",
     }
+
+
+def test_apply_entity_aliases_respects_specificity(tmp_path: Path) -> None:
+    alias_path = tmp_path / "entity_aliases.csv"
+    alias_path.write_text(
+        "raw_id,canonical_id\n"
+        "npc:speaker_1*,npc:broad\n"
+        "npc:speaker_12*,npc:narrow\n"
+        "npc:speaker_123,npc:exact\n"
+        "npc:speaker_9,npc:speaker_9\n"
+        "npc:speaker_?,npc:single\n",
+        encoding="utf-8",
+    )
+    aliases = _load_entity_aliases(alias_path)
+    frame = pd.DataFrame(
+        {
+            "canonical_id": [
+                "npc:speaker_123",
+                "npc:speaker_124",
+                "npc:speaker_15",
+                "npc:speaker_9",
+                "npc:speaker_9",
+                "npc:other",
+            ]
+        }
+    )
+
+    replacements = _apply_entity_aliases(frame, aliases)
+
+    assert frame["canonical_id"].tolist() == [
+        "npc:exact",
+        "npc:narrow",
+        "npc:broad",
+        "npc:single",
+        "npc:single",
+        "npc:other",
+    ]
+    # The identity alias for speaker_9 counts before the wildcard applies
+    assert replacements == 7
@@ -1,10 +1,25 @@
 """Tests for Impalers Archive DLC text dump ingestion."""
 
 import os
+from pathlib import Path
 
 import pytest
+from corpus import impalers_dump
+from corpus.config import settings
+from corpus.impalers_dump import cache_path_for, load_impalers_entries
+from corpus.ingest_impalers import ImpalersIngester
 from corpus.models import normalize_name_for_matching
 
+MASTER_HTML = """
+<h2>WeaponName_dlc01.fmg</h2>
+<h3>Milady [42]</h3>
+<p>A light sword &amp; <i>keepsake</i>.</p>
+<p>Second line</p>
+<h2>NpcName.fmg</h2>
+<p>[7] Leda</p>
+<p>Needle Knight</p>
+"""
+
 
 def test_normalize_name_for_matching() -> None:
     """Test name normalization for fuzzy matching."""
@@ -19,6 +34,87 @@ def test_normalize_name_for_matching() -> None:
     )
 
 
+def test_load_impalers_entries_parses_once_and_caches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    html_path = tmp_path / "Master.html"
+    html_path.write_text(MASTER_HTML, encoding="utf-8")
+
+    entries = load_impalers_entries(html_path)
+    # Milady is still open when the next <h2> starts and is dropped
+    assert entries == [
+        {
+            "section": "NpcName.fmg",
+            "name": "Leda",
+            "entry_id": "7",
+            "paragraphs": ["Needle Knight"],
+        },
+    ]
+    assert cache_path_for(html_path).exists()
+
+    def fail(_: Path) -> impalers_dump.ImpalersDump:
+        raise AssertionError("cached dump was parsed again")
+
+    monkeypatch.setattr(impalers_dump, "parse_impalers_html", fail)
+    assert load_impalers_entries(html_path) == entries
+
+    # A changed dump has a new sha256 and must be re-parsed
+    html_path.write_text(MASTER_HTML + "<p>Third line</p>", encoding="utf-8")
+    monkeypatch.undo()
+    assert load_impalers_entries(html_path)[-1]["paragraphs"] == [
+        "Needle Knight",
+        "Third line",
+    ]
+
+
+def test_parse_master_html_reads_tables_lists_and_minor_headings(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "raw_dir", tmp_path)
+    html_path = tmp_path / "Master.html"
+    html_path.write_text(
+        """
+        <h1>DLC Text</h1>
+        <table>
+          <tr><th>Name</th><th>Text</th></tr>
+          <tr><td>Scadutree</td><td>A tree of <b>shadow</b> and light.</td></tr>
+          <tr><td>Short</td><td>too short</td></tr>
+        </table>
+        <dl><dt>Messmer</dt><dd>Son of Queen Marika.</dd></dl>
+        <h4>Miquella</h4>
+        <p>The kindest of the Empyreans.</p>
+        <p>Abandoned his flesh.</p>
+        <h5>Leda</h5>
+        <h2>Closing Section</h2>
+        <p>Not a sibling of any h4-h6 heading's run.</p>
+        """,
+        encoding="utf-8",
+    )
+
+    records = ImpalersIngester().parse_master_html(html_path)
+
+    assert records == [
+        {
+            "name": "Scadutree",
+            "text": "A tree ofshadowand light.",
+            "section": "Closing Section",
+            "language": "en",
+        },
+        {
+            "name": "Messmer",
+            "text": "Son of Queen Marika.",
+            "section": "Closing Section",
+            "language": "en",
+        },
+        {
+            "name": "Miquella",
+            "text": "The kindest of the Empyreans.\n\nAbandoned his flesh.",
+            "section": "Closing Section",
+            "language": "en",
+        },
+    ]
+
+
 @pytest.mark.skipif(
     os.getenv("RUN_INTEGRATION") != "1",
     reason="Integration tests disabled (set RUN_INTEGRATION=1 to enable)",
@@ -14,7 +14,11 @@ import pandas as pd
 import pytest
 
 from pipelines.build_lore_corpus import (
+    SPEC_BY_CATEGORY,
     _compute_lore_id,
+    _compute_lore_ids,
+    _extract_canonical_lore,
+    _match_impalers_entries,
     _parse_impalers_dump,
     build_lore_corpus,
 )
@@ -39,10 +43,132 @@ def test_parse_impalers_dump_extracts_entries(tmp_path: Path) -> None:
     assert "First line" in "\n".join(entry["paragraphs"])
 
 
-def test_build_lore_corpus_pipeline(
+def test_parse_impalers_dump_keeps_only_lore_sections(
     tmp_path: Path,
+) -> None:
+    html = """
+    <h2>WeaponName_dlc01.fmg</h2>
+    <h3>Milady [42]</h3>
+    <p>A light sword.</p>
+    <h3>Leda's Sword [43]</h3>
+    <p>Needle knight blade.</p>
+    <h2>NpcName.fmg</h2>
+    <h3>Leda [7]</h3>
+    <p>Ignored: not a lore category.</p>
+    <h2>MagicName_dlc01.fmg</h2>
+    <p>[9] Rings of Spectral Light</p>
+    <p>Incantation of the Fingers.</p>
+    """
+    dump_path = tmp_path / "Master.html"
+    dump_path.write_text(html, encoding="utf-8")
+
+    entries = _parse_impalers_dump(dump_path)
+
+    # An entry still open when the next <h2> starts is dropped
+    assert [(entry["name"], entry["category"]) for entry in entries] == [
+        ("Milady", "weapon"),
+        ("Rings of Spectral Light", "spell"),
+    ]
+
+
+def test_extract_canonical_lore_orders_rows_by_record_then_field() -> None:
+    spec = SPEC_BY_CATEGORY["item"]
+    frame = pd.DataFrame(
+        {
+            "item_id": [7.0, 3.0],
+            "canonical_slug": ["moonveil", "rivers"],
+            "source": [" kaggle_base ", None],
+            "description": ["Katana  of\r\nthe moon", None],
+            "effect": ["Transient\n\n\nMoonlight", "  "],
+            "obtained_from": ["Gael Tunnel", "Castle Morne"],
+        }
+    )
+
+    table = _extract_canonical_lore(frame, spec)
+    rows = table.to_pylist()
+
+    assert [(row["canonical_id"], row["text_type"]) for row in rows] == [
+        ("item:7", "description"),
+        ("item:7", "effect"),
+        ("item:7", "obtained_from"),
+        ("item:3", "obtained_from"),
+    ]
+    assert rows[0]["text"] == "Katana of\nthe moon"
+    assert rows[1]["text"] == "Transient\nMoonlight"
+    assert rows[0]["source"] == "kaggle_base"
+    assert rows[3]["source"] == "github_api"
+    assert rows[0]["lore_id"] == _compute_lore_id(
+        "item:7", "description", "Katana of\nthe moon"
+    )
+    provenance = json.loads(rows[0]["provenance"])
+    assert provenance["text_column"] == "description"
+    assert provenance["source_id"] is None
+
+
+def test_compute_lore_ids_threaded_matches_single_row_ids(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
+    monkeypatch.setattr("pipelines.build_lore_corpus.LORE_ID_THREAD_ROWS", 1)
+    canonical_ids = [f"npc:{index % 7}" for index in range(50)]
+    text_types = ["dialogue"] * 50
+    texts = [f"Line {index}" for index in range(50)]
+
+    lore_ids = _compute_lore_ids(canonical_ids, text_types, texts, threads=4)
+
+    assert lore_ids == [
+        _compute_lore_id(*row)
+        for row in zip(canonical_ids, text_types, texts, strict=True)
+    ]
+
+
+def test_match_impalers_entries_scores_only_blocked_candidates(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    names = [
+        "Moonveil Katana",
+        "Moonveil",
+        "Dark Moon Greatsword",
+        "Sword of Night and Flame",
+        "Rivers of Blood",
+    ]
+    lookup = {
+        "weapon": [
+            {
+                "canonical_id": f"weapon:{index}",
+                "category": "weapon",
+                "name": name,
+                "match_slug": name.lower(),
+            }
+            for index, name in enumerate(names)
+        ]
+    }
+    entries = [
+        {"category": "weapon", "name": name, "paragraphs": [f"Lore {index}"]}
+        for index, name in enumerate(
+            ["Moonveil", "Moonvail Katana", "Bloodhound's Fang"]
+        )
+    ]
+
+    with caplog.at_level("INFO", logger="pipelines.build_lore_corpus"):
+        matched, unmatched = _match_impalers_entries(
+            entries=entries, canonical_lookup=lookup
+        )
+
+    assert [row["canonical_id"] for row in matched] == [
+        "weapon:1",
+        "weapon:0",
+    ]
+    scores = [json.loads(row["provenance"])["match_score"] for row in matched]
+    assert scores[0] == 1.0
+    assert 0.82 <= scores[1] < 1.0
+    assert [entry["name"] for entry in unmatched] == ["Bloodhound's Fang"]
+    assert "of 15 candidate pairs" in caplog.text
+
+
+def _write_lore_inputs(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> tuple[Path, Path]:
     curated_root = tmp_path / "curated"
     raw_root = tmp_path / "raw"
     impalers_dir = raw_root / "impalers"
@@ -154,6 +280,14 @@ def test_build_lore_corpus_pipeline(
         "pipelines.build_lore_corpus.load_carian_dialogue_lines",
         lambda raw_root: dialogue_rows,
     )
+    return curated_root, raw_root
+
+
+def test_build_lore_corpus_pipeline(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    curated_root, raw_root = _write_lore_inputs(tmp_path, monkeypatch)
 
     output = curated_root / "lore_corpus.parquet"
     df = build_lore_corpus(
@@ -196,3 +330,74 @@ def test_build_lore_corpus_pipeline(
     assert dialogue_row["source"] == "carian_dialogue_fmg"
     assert dialogue_row["canonical_id"] == "npc:700"
     assert dialogue_row["raw_canonical_id"] == "npc:700"
+
+
+def test_build_lore_corpus_reuses_cached_domains(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    curated_root, raw_root = _write_lore_inputs(tmp_path, monkeypatch)
+    output = curated_root / "lore_corpus.parquet"
+
+    first = build_lore_corpus(
+        curated_root=curated_root, raw_root=raw_root, output_path=output
+    )
+    assert (curated_root / "lore_corpus.domains" / "impalers.parquet").exists()
+
+    spells = pd.read_parquet(curated_root / "spells_canonical.parquet")
+    spells["description"] = "Revised spell lore"
+    spells.to_parquet(curated_root / "spells_canonical.parquet", index=False)
+
+    with caplog.at_level("INFO", logger="pipelines.build_lore_corpus"):
+        second = build_lore_corpus(
+            curated_root=curated_root, raw_root=raw_root, output_path=output
+        )
+
+    assert (
+        "Lore domains from cache: item, weapon, armor, boss, carian_dialogue; "
+        "re-extracted: spell, impalers"
+    ) in caplog.text
+    unchanged = first[first["category"] != "spell"].reset_index(drop=True)
+    pd.testing.assert_frame_equal(
+        second[second["category"] != "spell"].reset_index(drop=True),
+        unchanged,
+    )
+    assert second.loc[second["category"] == "spell", "text"].tolist() == [
+        "Revised spell lore"
+    ]
+
+    uncached = build_lore_corpus(
+        curated_root=curated_root,
+        raw_root=raw_root,
+        output_path=output,
+        use_cache=False,
+    )
+    pd.testing.assert_frame_equal(uncached, second)
+
+
+def test_build_lore_corpus_parallel_matches_serial(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    curated_root, raw_root = _write_lore_inputs(tmp_path, monkeypatch)
+    # Spawned workers would not see the patched Carian loader
+    monkeypatch.undo()
+    output = curated_root / "lore_corpus.parquet"
+
+    serial = build_lore_corpus(
+        curated_root=curated_root,
+        raw_root=raw_root,
+        output_path=output,
+        use_cache=False,
+    )
+    parallel = build_lore_corpus(
+        curated_root=curated_root,
+        raw_root=raw_root,
+        output_path=output,
+        use_cache=False,
+        workers=3,
+    )
+
+    pd.testing.assert_frame_equal(parallel, serial)
+    assert set(parallel["source"]) >= {"impalers", "kaggle_base"}
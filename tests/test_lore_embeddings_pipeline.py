@@ -5,18 +5,55 @@
 
 from __future__ import annotations
 
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
 import pandas as pd  # type: ignore[import]
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 from pipelines.build_lore_embeddings import (
+    BLOCK_POOLING_STRATEGY,
     EmbeddingGenerationError,
+    _apply_weighted_concatenation,
     build_lore_embeddings,
+    read_lore_embeddings,
+)
+from pipelines.embedding_cache import (
+    INPUT_HASH_COLUMN,
+    EmbeddingCache,
+    collect_garbage,
+    referenced_keys,
 )
 from tests.helpers import DeterministicEncoder, write_sample_lore_corpus
 
 
+@dataclass
+class CountingEncoder(DeterministicEncoder):
+    """Deterministic encoder that records every text it is asked to encode."""
+
+    seen: list[str] = field(default_factory=list)
+    batch_sizes: list[int] = field(default_factory=list)
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        self.seen.extend(texts)
+        self.batch_sizes.append(len(texts))
+        return DeterministicEncoder.encode(self, texts)
+
+
+@dataclass
+class UnitEncoder(DeterministicEncoder):
+    """Deterministic encoder returning L2-normalized vectors."""
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = DeterministicEncoder.encode(self, texts)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
 def test_build_lore_embeddings_writes_artifact(tmp_path: Path) -> None:
     lore_path = write_sample_lore_corpus(tmp_path)
     output_path = tmp_path / "data" / "embeddings" / "lore_embeddings.parquet"
@@ -37,9 +74,29 @@ def test_build_lore_embeddings_writes_artifact(tmp_path: Path) -> None:
     assert set(df["embedding_provider"]) == {"local"}
     assert set(df["embedding_strategy"]) == {"weighted_text_types_v1"}
     assert any("effect" in comps for comps in df["text_type_components"])
+    # Vectors stay on disk unless the caller asks for them
+    assert "embedding" not in df.columns
+
+    _, matrix = read_lore_embeddings(output_path)
+    assert matrix.shape == (3, 3)
+
+
+def test_embeddings_parquet_uses_fixed_size_float32_column(
+    tmp_path: Path,
+) -> None:
+    lore_path = write_sample_lore_corpus(tmp_path)
+    output_path = tmp_path / "embeddings" / "lore_embeddings.parquet"
+
+    df = _embed(lore_path, output_path, DeterministicEncoder(dim=3))
 
-    dimensions = {len(vec) for vec in df["embedding"]}
-    assert dimensions == {3}
+    schema = pq.read_schema(output_path)
+    assert schema.field("embedding").type == pa.list_(pa.float32(), 3)
+    metadata, matrix = read_lore_embeddings(output_path)
+    assert "embedding" not in metadata.columns
+    assert metadata["canonical_id"].tolist() == df["canonical_id"].tolist()
+    assert matrix.shape == (3, 3)
+    assert not matrix.flags.writeable
+    np.testing.assert_array_equal(matrix, np.stack(df["embedding"]))
 
 
 def test_build_lore_embeddings_drops_empty_rows(tmp_path: Path) -> None:
@@ -127,6 +184,58 @@ def test_weighting_prefers_narrative_sections(tmp_path: Path) -> None:
     assert row["weight_config_path"] == "<inline-text-type-weights>"
 
 
+def test_weighted_concatenation_groups_and_orders_blocks() -> None:
+    def row(
+        canonical_id: str, text_type: str | None, text: str, **extra: str
+    ) -> dict[str, object]:
+        return {
+            "canonical_id": canonical_id,
+            "category": extra.get("category"),
+            "text_type": text_type,
+            "source": extra.get("source", "unit"),
+            "text": text,
+        }
+
+    frame = pd.DataFrame(
+        [
+            row("b", "effect", "one two three four", category=" "),
+            row("a", "dialogue", "Hello there"),
+            row("b", "description", "First part.", category="weapon"),
+            row("a", "muted", "Never embedded"),
+            row("b", "description", "Second part.", source="dlc"),
+            row("b", None, "Untyped rows are dropped"),
+            row("c", "muted", "Only a zero-weight block"),
+        ]
+    )
+    weights = {"description": 1.5, "effect": 0.5, "muted": 0.0}
+
+    result = _apply_weighted_concatenation(frame, weights)
+
+    assert result["canonical_id"].tolist() == ["b", "a"]
+    b, a = result.to_dict("records")
+    assert b["lore_id"] == "b::weighted_text_types_v1"
+    assert b["category"] == "weapon"
+    assert b["source"] == "unit|dlc"
+    assert b["text_type"] == "description"
+    assert b["text_type_components"] == "description|effect"
+    assert b["component_count"] == 2
+    assert b["text"] == (
+        "Description:\nFirst part.\n\nSecond part.\n\n"
+        "Effect:\none two three four"
+    )
+    assert b["embedding_text"] == (
+        "Description:\nFirst part.\n\nSecond part.\n\nFirst part.\n\n"
+        "Effect:\none two"
+    )
+    # Equal weights keep first-seen order; zero-weight blocks stay visible
+    # in the display text but are left out of the embedding input
+    assert a["category"] == "unknown"
+    assert a["text_type_components"] == "dialogue|muted"
+    assert a["text"] == "Dialogue:\nHello there\n\nMuted:\nNever embedded"
+    assert a["embedding_text"] == "Dialogue:\nHello there"
+    assert a["embedding_blocks"] == [("Dialogue:\nHello there", 1.0)]
+
+
 def test_build_lore_embeddings_requires_text(tmp_path: Path) -> None:
     path = tmp_path / "missing.parquet"
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -151,3 +260,474 @@ def test_build_lore_embeddings_requires_text(tmp_path: Path) -> None:
             batch_size=1,
             encoder=encoder,
         )
+
+
+def _embed(
+    lore_path: Path, output_path: Path, encoder: DeterministicEncoder, **kwargs
+) -> pd.DataFrame:
+    return build_lore_embeddings(
+        lore_path=lore_path,
+        output_path=output_path,
+        provider="local",
+        model_name="test-model",
+        batch_size=2,
+        encoder=encoder,
+        return_vectors=True,
+        **kwargs,
+    )
+
+
+def test_embedding_cache_only_encodes_misses(tmp_path: Path) -> None:
+    lore_path = write_sample_lore_corpus(tmp_path)
+    output_path = tmp_path / "embeddings" / "lore_embeddings.parquet"
+
+    first = CountingEncoder(dim=3)
+    baseline = _embed(lore_path, output_path, first)
+    assert len(first.seen) == 3
+    assert (tmp_path / "embeddings" / "embedding_cache.sqlite").exists()
+
+    second = CountingEncoder(dim=3)
+    cached = _embed(lore_path, output_path, second)
+    assert second.seen == []
+    np.testing.assert_array_equal(
+        np.stack(cached["embedding"]), np.stack(baseline["embedding"])
+    )
+    assert (
+        cached[INPUT_HASH_COLUMN].tolist()
+        == baseline[INPUT_HASH_COLUMN].tolist()
+    )
+
+    frame = pd.read_parquet(lore_path)
+    frame.loc[frame["lore_id"] == "lore-boss", "text"] = "Messmer burns."
+    frame.to_parquet(lore_path, index=False)
+
+    third = CountingEncoder(dim=3)
+    _embed(lore_path, output_path, third)
+    assert len(third.seen) == 1
+    assert "Messmer burns." in third.seen[0]
+
+
+def test_duplicate_inputs_are_encoded_once(tmp_path: Path) -> None:
+    lore_path = tmp_path / "lore_corpus.parquet"
+    caption = "Armour worn by the knights of the Haligtree."
+    pd.DataFrame(
+        [
+            {
+                "lore_id": f"lore-{canonical_id}",
+                "canonical_id": canonical_id,
+                "category": "armor",
+                "text_type": "description",
+                "source": "unit",
+                "text": text,
+            }
+            for canonical_id, text in [
+                ("helm", caption),
+                ("gauntlets", "Unique gauntlet text."),
+                ("greaves", caption),
+                ("armor", caption),
+            ]
+        ]
+    ).to_parquet(lore_path, index=False)
+
+    encoder = CountingEncoder(dim=3)
+    # One row per checkpoint chunk, so copies land in different chunks
+    df = _embed(
+        lore_path,
+        tmp_path / "embeddings.parquet",
+        encoder,
+        use_cache=False,
+        checkpoint_rows=1,
+    )
+
+    assert len(encoder.seen) == 2
+    vectors = df.set_index("canonical_id")["embedding"]
+    for canonical_id in ("greaves", "armor"):
+        np.testing.assert_array_equal(vectors[canonical_id], vectors["helm"])
+    assert not np.array_equal(vectors["gauntlets"], vectors["helm"])
+
+
+def test_token_budget_splits_batches_without_reordering(
+    tmp_path: Path,
+) -> None:
+    lore_path = write_sample_lore_corpus(tmp_path)
+
+    unbounded = CountingEncoder(dim=3)
+    baseline = _embed(
+        lore_path,
+        tmp_path / "a" / "lore_embeddings.parquet",
+        unbounded,
+        max_batch_tokens=1_000_000,
+    )
+    assert unbounded.batch_sizes == [2, 1]
+
+    budgeted = CountingEncoder(dim=3)
+    split = _embed(
+        lore_path,
+        tmp_path / "b" / "lore_embeddings.parquet",
+        budgeted,
+        max_batch_tokens=1,
+    )
+    assert budgeted.batch_sizes == [1, 1, 1]
+    assert budgeted.seen == unbounded.seen
+    np.testing.assert_array_equal(
+        np.stack(split["embedding"]), np.stack(baseline["embedding"])
+    )
+
+
+def test_zero_token_budget_disables_the_default(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from pipelines import build_lore_embeddings as module
+
+    lore_path = write_sample_lore_corpus(tmp_path)
+    monkeypatch.setattr(module.settings, "embed_max_batch_tokens", 1)
+
+    defaulted = CountingEncoder(dim=3)
+    _embed(lore_path, tmp_path / "a" / "lore_embeddings.parquet", defaulted)
+    assert defaulted.batch_sizes == [1, 1, 1]
+
+    disabled = CountingEncoder(dim=3)
+    _embed(
+        lore_path,
+        tmp_path / "b" / "lore_embeddings.parquet",
+        disabled,
+        max_batch_tokens=0,
+    )
+    assert disabled.batch_sizes == [2, 1]
+
+
+def test_embedding_cache_is_scoped_to_model(tmp_path: Path) -> None:
+    lore_path = write_sample_lore_corpus(tmp_path)
+    output_path = tmp_path / "lore_embeddings.parquet"
+    _embed(lore_path, output_path, CountingEncoder(dim=3))
+
+    other_model = CountingEncoder(dim=3)
+    build_lore_embeddings(
+        lore_path=lore_path,
+        output_path=output_path,
+        provider="local",
+        model_name="other-model",
+        batch_size=2,
+        encoder=other_model,
+    )
+    assert len(other_model.seen) == 3
+
+
+def test_no_cache_and_dry_run_leave_cache_untouched(tmp_path: Path) -> None:
+    lore_path = write_sample_lore_corpus(tmp_path)
+    output_path = tmp_path / "lore_embeddings.parquet"
+    cache_path = tmp_path / "embedding_cache.sqlite"
+
+    encoder = CountingEncoder(dim=2)
+    _embed(lore_path, output_path, encoder, use_cache=False)
+    _embed(lore_path, output_path, encoder, dry_run=True)
+    assert len(encoder.seen) == 6
+    assert not cache_path.exists()
+
+
+def test_embedding_cache_garbage_collection(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    lore_path = write_sample_lore_corpus(tmp_path)
+    output_path = tmp_path / "lore_embeddings.parquet"
+    cache_path = tmp_path / "embedding_cache.sqlite"
+    _embed(lore_path, output_path, DeterministicEncoder(dim=2))
+
+    with EmbeddingCache(
+        cache_path, provider="local", model="retired-model"
+    ) as cache:
+        cache.put_many({"ab" * 32: [0.5, 0.25]})
+
+    read_columns: list[list[str] | None] = []
+    read_parquet = pd.read_parquet
+
+    def recording_read_parquet(path: Path, **kwargs: object) -> pd.DataFrame:
+        read_columns.append(kwargs.get("columns"))  # type: ignore[arg-type]
+        return read_parquet(path, **kwargs)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(pd, "read_parquet", recording_read_parquet)
+        referenced = referenced_keys([output_path])
+    assert read_columns
+    assert all(
+        columns is not None and "embedding" not in columns
+        for columns in read_columns
+    )
+    assert collect_garbage(cache_path, referenced, dry_run=True) == 1
+    assert collect_garbage(cache_path, referenced) == 1
+    assert collect_garbage(cache_path, referenced) == 0
+
+    encoder = CountingEncoder(dim=2)
+    _embed(lore_path, output_path, encoder)
+    assert encoder.seen == []
+
+
+def test_block_pooling_renormalizes_unit_block_vectors(
+    tmp_path: Path,
+) -> None:
+    lore_path = write_sample_lore_corpus(tmp_path)
+    weights = {"description": 2.0, "effect": 0.5, "bio": 1.0}
+
+    df = _embed(
+        lore_path,
+        tmp_path / "lore_embeddings.parquet",
+        UnitEncoder(dim=3),
+        strategy=BLOCK_POOLING_STRATEGY,
+        text_type_weights=weights,
+    )
+
+    vectors = np.stack(df["embedding"])
+    np.testing.assert_allclose(np.linalg.norm(vectors, axis=1), 1.0, rtol=1e-5)
+    weapon = df.set_index("canonical_id").loc["weapon-001"]
+    description, effect = UnitEncoder(dim=3).encode(
+        [
+            "Description:\nMoonblade cleaves with frostlit arcs.",
+            "Effect:\nFires arcs of moonlit frost dealing magic damage.",
+        ]
+    )
+    mean = 2.0 * description + 0.5 * effect
+    np.testing.assert_allclose(
+        weapon["embedding"], mean / np.linalg.norm(mean), rtol=1e-5
+    )
+
+
+def test_incremental_rebuild_reembeds_only_changed_canonicals(
+    tmp_path: Path,
+) -> None:
+    lore_path = write_sample_lore_corpus(tmp_path)
+    output_path = tmp_path / "lore_embeddings.parquet"
+    _embed(
+        lore_path, output_path, DeterministicEncoder(dim=3), use_cache=False
+    )
+
+    frame = pd.read_parquet(lore_path)
+    frame.loc[frame["lore_id"] == "lore-boss", "text"] = "Messmer burns."
+    frame = frame[frame["canonical_id"] != "item-001"]
+    added = frame.iloc[[0]].assign(
+        lore_id="lore-npc", canonical_id="npc-001", text="A new voice."
+    )
+    pd.concat([frame, added]).to_parquet(lore_path, index=False)
+
+    encoder = CountingEncoder(dim=3)
+    merged = _embed(
+        lore_path, output_path, encoder, use_cache=False, incremental=True
+    )
+
+    assert len(encoder.seen) == 2
+    assert sorted(merged["canonical_id"]) == [
+        "boss-001",
+        "npc-001",
+        "weapon-001",
+    ]
+    changes = json.loads(
+        (tmp_path / "lore_embeddings_changes.json").read_text(encoding="utf-8")
+    )
+    assert changes["mode"] == "incremental"
+    assert changes["added"] == ["npc-001"]
+    assert changes["changed"] == ["boss-001"]
+    assert changes["removed"] == ["item-001"]
+    assert changes["unchanged"] == 1
+    assert changes["reembedded"] == 2
+
+    full = _embed(
+        lore_path,
+        tmp_path / "full.parquet",
+        DeterministicEncoder(dim=3),
+        use_cache=False,
+    )
+    np.testing.assert_array_equal(
+        np.stack(merged["embedding"]), np.stack(full["embedding"])
+    )
+    assert merged["canonical_id"].tolist() == full["canonical_id"].tolist()
+
+
+def test_incremental_rebuild_falls_back_when_model_changes(
+    tmp_path: Path,
+) -> None:
+    lore_path = write_sample_lore_corpus(tmp_path)
+    output_path = tmp_path / "lore_embeddings.parquet"
+    _embed(
+        lore_path, output_path, DeterministicEncoder(dim=3), use_cache=False
+    )
+
+    encoder = CountingEncoder(dim=3)
+    build_lore_embeddings(
+        lore_path=lore_path,
+        output_path=output_path,
+        provider="local",
+        model_name="other-model",
+        batch_size=2,
+        encoder=encoder,
+        use_cache=False,
+        incremental=True,
+    )
+
+    assert len(encoder.seen) == 3
+    changes = json.loads(
+        (tmp_path / "lore_embeddings_changes.json").read_text(encoding="utf-8")
+    )
+    assert changes["mode"] == "full"
+    assert "embedding_model" in changes["reason"]
+    assert changes["added"] == ["item-001", "weapon-001", "boss-001"]
+
+
+def test_block_pooling_strategy_weights_block_vectors(tmp_path: Path) -> None:
+    lore_path = write_sample_lore_corpus(tmp_path)
+    output_path = tmp_path / "lore_embeddings.parquet"
+    weights = {"description": 2.0, "effect": 0.5, "bio": 1.0}
+
+    encoder = CountingEncoder(dim=3)
+    df = _embed(
+        lore_path,
+        output_path,
+        encoder,
+        strategy=BLOCK_POOLING_STRATEGY,
+        text_type_weights=weights,
+    )
+
+    # One encoder input per (canonical_id, text_type) block, unscaled
+    assert len(encoder.seen) == 4
+    assert set(df["embedding_strategy"]) == {BLOCK_POOLING_STRATEGY}
+    weapon = df.set_index("canonical_id").loc["weapon-001"]
+    assert list(weapon["embedding_block_weights"]) == [2.0, 0.5]
+    description, effect = DeterministicEncoder(dim=3).encode(
+        [
+            "Description:\nMoonblade cleaves with frostlit arcs.",
+            "Effect:\nFires arcs of moonlit frost dealing magic damage.",
+        ]
+    )
+    np.testing.assert_allclose(
+        weapon["embedding"], (2.0 * description + 0.5 * effect) / 2.5
+    )
+
+    # Changing weights re-pools cached block vectors without encoding
+    repooled = CountingEncoder(dim=3)
+    reweighted = _embed(
+        lore_path,
+        output_path,
+        repooled,
+        strategy=BLOCK_POOLING_STRATEGY,
+        text_type_weights={**weights, "effect": 1.5},
+        incremental=True,
+    )
+    assert repooled.seen == []
+    changes = json.loads(
+        (tmp_path / "lore_embeddings_changes.json").read_text(encoding="utf-8")
+    )
+    assert changes["changed"] == ["weapon-001"]
+    weapon = reweighted.set_index("canonical_id").loc["weapon-001"]
+    np.testing.assert_allclose(
+        weapon["embedding"], (2.0 * description + 1.5 * effect) / 3.5
+    )
+
+    referenced = referenced_keys([output_path])
+    assert (
+        collect_garbage(tmp_path / "embedding_cache.sqlite", referenced) == 0
+    )
+
+
+@dataclass
+class FlakyEncoder(CountingEncoder):
+    """Counting encoder that fails once it has encoded ``fail_after`` texts."""
+
+    fail_after: int | None = None
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        if self.fail_after is not None and len(self.seen) >= self.fail_after:
+            raise RuntimeError("provider outage")
+        return CountingEncoder.encode(self, texts)
+
+
+def test_resume_skips_checkpointed_rows(tmp_path: Path) -> None:
+    lore_path = write_sample_lore_corpus(tmp_path)
+    output_path = tmp_path / "lore_embeddings.parquet"
+    checkpoint_dir = tmp_path / "lore_embeddings.checkpoint"
+    reference = _embed(
+        lore_path, tmp_path / "full" / "out.parquet", DeterministicEncoder(3)
+    )
+
+    crashed = FlakyEncoder(dim=3, fail_after=2)
+    with pytest.raises(RuntimeError, match="provider outage"):
+        _embed(
+            lore_path,
+            output_path,
+            crashed,
+            use_cache=False,
+            checkpoint_rows=1,
+        )
+    assert not output_path.exists()
+    assert len(list(checkpoint_dir.glob("part-*.parquet"))) == 2
+
+    resumed = CountingEncoder(dim=3)
+    df = _embed(
+        lore_path,
+        output_path,
+        resumed,
+        use_cache=False,
+        checkpoint_rows=1,
+        resume=True,
+    )
+
+    assert len(resumed.seen) == 1
+    assert resumed.seen[0] not in crashed.seen
+    assert not checkpoint_dir.exists()
+    assert df["canonical_id"].tolist() == reference["canonical_id"].tolist()
+    np.testing.assert_array_equal(
+        np.stack(df["embedding"]), np.stack(reference["embedding"])
+    )
+    _, matrix = read_lore_embeddings(output_path)
+    np.testing.assert_array_equal(matrix, np.stack(reference["embedding"]))
+
+
+def test_incremental_rebuild_reads_previous_vectors_by_chunk(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    lore_path = write_sample_lore_corpus(tmp_path)
+    output_path = tmp_path / "lore_embeddings.parquet"
+    _embed(
+        lore_path,
+        output_path,
+        DeterministicEncoder(dim=3),
+        use_cache=False,
+        checkpoint_rows=1,
+    )
+    assert pq.ParquetFile(output_path).metadata.num_row_groups == 3
+
+    frame = pd.read_parquet(lore_path)
+    frame.loc[frame["lore_id"] == "lore-boss", "text"] = "Messmer burns."
+    frame.to_parquet(lore_path, index=False)
+
+    read_columns: list[object] = []
+    read_parquet = pd.read_parquet
+
+    def recording_read_parquet(path: object, **kwargs: object) -> object:
+        if path == output_path:
+            read_columns.append(kwargs.get("columns"))
+        return read_parquet(path, **kwargs)
+
+    monkeypatch.setattr(pd, "read_parquet", recording_read_parquet)
+    encoder = CountingEncoder(dim=3)
+    merged = _embed(
+        lore_path,
+        output_path,
+        encoder,
+        use_cache=False,
+        incremental=True,
+        checkpoint_rows=2,
+    )
+
+    assert len(encoder.seen) == 1
+    assert read_columns
+    assert all(
+        columns is not None and "embedding" not in columns
+        for columns in read_columns
+    )
+    full = _embed(
+        lore_path,
+        tmp_path / "full.parquet",
+        DeterministicEncoder(dim=3),
+        use_cache=False,
+    )
+    np.testing.assert_array_equal(
+        np.stack(merged["embedding"]), np.stack(full["embedding"])
+    )
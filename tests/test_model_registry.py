@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import numpy as np
+import polars as pl
+import pytest
+
+from corpus import embeddings
+from corpus.model_registry import (
+    SENTENCE_TRANSFORMER,
+    ModelKey,
+    ModelRegistry,
+)
+
+
+class FakeModule:
+    def __init__(self, key: ModelKey) -> None:
+        self.key = key
+        self.casts: list[str] = []
+
+    def half(self) -> FakeModule:
+        self.casts.append("float16")
+        return self
+
+
+class CountingLoader:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.calls: list[ModelKey] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, key: ModelKey) -> Any:
+        with self._lock:
+            self.calls.append(key)
+        time.sleep(self.delay)
+        return FakeModule(key)
+
+
+def _key(**overrides: Any) -> ModelKey:
+    options: dict[str, Any] = {"device": "cpu"}
+    options.update(overrides)
+    return ModelKey(SENTENCE_TRANSFORMER, "all-MiniLM-L6-v2", **options)
+
+
+def test_registry_loads_each_key_once() -> None:
+    registry = ModelRegistry()
+    loader = CountingLoader()
+
+    first = registry.get(_key(), loader)
+    second = registry.get(_key(), loader)
+
+    assert first is second
+    assert loader.calls == [_key()]
+    (loaded,) = registry.loaded()
+    assert loaded.uses == 2
+    assert loaded.load_seconds >= 0
+    # The fake model exposes no parameters to size
+    assert loaded.memory_bytes is None
+
+
+def test_registry_separates_devices_and_precisions() -> None:
+    registry = ModelRegistry()
+    loader = CountingLoader()
+
+    cpu = registry.get(_key(), loader)
+    cuda = registry.get(_key(device="cuda"), loader)
+    half = registry.get(_key(precision="float16"), loader)
+
+    assert len({id(cpu), id(cuda), id(half)}) == 3
+    assert half.casts == ["float16"]
+    assert cpu.casts == []
+    assert len(registry.loaded()) == 3
+
+    registry.clear()
+    assert registry.loaded() == []
+
+
+def test_registry_rejects_unknown_precision() -> None:
+    registry = ModelRegistry()
+    loader = CountingLoader()
+
+    with pytest.raises(ValueError, match="precision"):
+        registry.get(_key(precision="int4"), loader)
+    assert loader.calls == []
+
+
+def test_registry_loads_once_under_concurrency() -> None:
+    registry = ModelRegistry()
+    loader = CountingLoader(delay=0.05)
+    models: list[Any] = []
+
+    def fetch() -> None:
+        models.append(registry.get(_key(), loader))
+
+    threads = [threading.Thread(target=fetch) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loader.calls) == 1
+    assert all(model is models[0] for model in models)
+    assert registry.loaded()[0].uses == 8
+
+
+def test_local_embeddings_load_with_configured_device_and_precision(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    requested: list[tuple[str, str | None, str | None]] = []
+
+    class Encoder:
+        def encode(self, texts: list[str], **_: Any) -> np.ndarray:
+            return np.ones((len(texts), 2), dtype=np.float32)
+
+    def fake_get(
+        model_name: str,
+        *,
+        device: str | None = None,
+        precision: str | None = None,
+    ) -> Encoder:
+        requested.append((model_name, device, precision))
+        return Encoder()
+
+    monkeypatch.setattr(embeddings, "get_sentence_transformer", fake_get)
+    monkeypatch.setattr(embeddings.settings, "embed_local_device", "cpu")
+    monkeypatch.setattr(
+        embeddings.settings, "embed_local_precision", "bfloat16"
+    )
+
+    frame = embeddings._generate_local_embeddings(
+        pl.DataFrame({"description": ["a", "b"]}), "mini", batch_size=2
+    )
+
+    assert requested == [("mini", "cpu", "bfloat16")]
+    assert frame["embedding"].len() == 2
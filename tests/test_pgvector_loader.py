@@ -2,8 +2,25 @@
 
 import os
 
+import polars as pl
 import pytest
+from click.testing import CliRunner
+from corpus import cli
 from corpus.models import CorpusChunk, CorpusDocument
+from corpus.pgvector_loader import (
+    ExistingChunk,
+    HNSWIndexConfig,
+    SyncReport,
+    build_hybrid_search_sql,
+    partition_table_name,
+    plan_chunk_sync,
+    prepare_chunk_rows,
+    read_chunk_slice,
+    render_schema_sql,
+    render_vector_index_sql,
+    stable_chunk_id,
+    vector_index_matches,
+)
 
 
 @pytest.mark.integration
@@ -159,3 +176,385 @@ def test_corpus_chunk_with_embedding() -> None:
 
     assert chunk.embedding is not None
     assert len(chunk.embedding) == 1536
+
+
+def test_render_schema_uses_configured_dimension() -> None:
+    """Schema SQL picks up the vector dimension instead of a literal."""
+    sql = render_schema_sql(embed_dimension=384)
+
+    assert "vector(384)" in sql
+    assert "vector(1536)" not in sql
+    assert "${" not in sql
+
+
+def test_render_schema_partitioned_layout() -> None:
+    """Partitioned schema keys chunks on (id, entity_type) without the FK."""
+    plain = render_schema_sql(embed_dimension=8)
+    partitioned = render_schema_sql(embed_dimension=8, partitioned=True)
+
+    assert "PRIMARY KEY (id)" in plain
+    assert "REFERENCES elden.corpus_chunk(id)" in plain
+    assert "PARTITION BY LIST" not in plain
+
+    assert "PRIMARY KEY (id, entity_type)" in partitioned
+    assert ") PARTITION BY LIST (entity_type);" in partitioned
+    assert "REFERENCES elden.corpus_chunk(id)" not in partitioned
+    assert "${" not in partitioned
+
+
+def test_partition_table_names_are_safe_and_distinct() -> None:
+    """Partition names are valid identifiers that never collide."""
+    assert partition_table_name("weapon") == "corpus_chunk_weapon"
+
+    names = {
+        partition_table_name(value)
+        for value in ("boss", "Boss", "boss fight", "boss_fight", "x" * 80)
+    }
+    assert len(names) == 5
+    for name in names:
+        assert name.replace("_", "").isalnum()
+        assert name == name.lower()
+        assert len(f"{name}_embedding_hnsw_idx") <= 63
+
+
+def test_render_vector_index_sql_per_partition() -> None:
+    """Index DDL targets the given partition with its own index name."""
+    sql = render_vector_index_sql(HNSWIndexConfig(), "corpus_chunk_weapon")
+
+    assert "ON elden.corpus_chunk_weapon" in sql
+    assert (
+        "DROP INDEX IF EXISTS elden.corpus_chunk_weapon_embedding_hnsw_idx"
+        in sql
+    )
+    assert "CREATE INDEX corpus_chunk_weapon_embedding_hnsw_idx" in sql
+
+
+def test_indexes_sql_defers_hnsw_build() -> None:
+    """020_indexes.sql no longer creates the HNSW index up front."""
+    from corpus.pgvector_loader import SQL_DIR
+
+    sql = (SQL_DIR / "020_indexes.sql").read_text(encoding="utf-8")
+    assert "USING hnsw" not in sql
+
+
+def test_init_sql_is_rendered() -> None:
+    """Files docker init runs from sql/ carry no template placeholders."""
+    from corpus.pgvector_loader import SQL_DIR
+
+    for path in SQL_DIR.glob("*.sql"):
+        assert "${" not in path.read_text(encoding="utf-8"), path.name
+
+    shipped = (SQL_DIR / "010_schema.sql").read_text(encoding="utf-8")
+    assert shipped == render_schema_sql(embed_dimension=1536)
+
+
+@pytest.mark.parametrize(
+    ("distance", "operator_class", "operator"),
+    [
+        ("cosine", "vector_cosine_ops", "<=>"),
+        ("ip", "vector_ip_ops", "<#>"),
+        ("l2", "vector_l2_ops", "<->"),
+    ],
+)
+def test_render_vector_index_sql(
+    distance: str, operator_class: str, operator: str
+) -> None:
+    """Index DDL reflects operator class and build parameters."""
+    config = HNSWIndexConfig(
+        m=24,
+        ef_construction=128,
+        distance=distance,  # type: ignore[arg-type]
+    )
+    sql = render_vector_index_sql(config)
+
+    assert f"USING hnsw (embedding {operator_class})" in sql
+    assert "m = 24" in sql
+    assert "ef_construction = 128" in sql
+    assert config.distance_operator == operator
+
+
+def test_hnsw_index_config_validation() -> None:
+    """Invalid metrics and graph parameters are rejected."""
+    with pytest.raises(ValueError):
+        HNSWIndexConfig(distance="dot")  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        HNSWIndexConfig(m=16, ef_construction=16)
+
+
+def _unified_frame(descriptions: dict[str, str]) -> pl.DataFrame:
+    slugs = list(descriptions)
+    return pl.DataFrame(
+        {
+            "entity_type": ["weapon"] * len(slugs),
+            "slug": slugs,
+            "is_dlc": [False] * len(slugs),
+            "name": [slug.title() for slug in slugs],
+            "description": [descriptions[slug] for slug in slugs],
+            "meta_json": ['{"weight": 1}'] * len(slugs),
+            "sources": ['["kaggle_base"]'] * len(slugs),
+        }
+    )
+
+
+def test_prepare_chunk_rows_uses_stable_ids_and_hashes() -> None:
+    """Chunk ids and hashes are deterministic across loads."""
+    frame = _unified_frame({"moonveil": "A katana of glintstone."})
+
+    first = prepare_chunk_rows(frame)[0]
+    second = prepare_chunk_rows(frame)[0]
+
+    assert first.id == second.id == stable_chunk_id("weapon", "moonveil")
+    assert first.content_hash == second.content_hash
+    assert first.row_hash == second.row_hash
+    assert first.meta == {"weight": 1, "sources": ["kaggle_base"]}
+
+
+def test_prepare_chunk_rows_rejects_duplicate_entities() -> None:
+    """Two rows for the same entity would collide on the stable id."""
+    frame = pl.concat(
+        [
+            _unified_frame({"moonveil": "One"}),
+            _unified_frame({"moonveil": "Two"}),
+        ]
+    )
+    with pytest.raises(ValueError, match="Duplicate corpus entity"):
+        prepare_chunk_rows(frame)
+
+
+def test_plan_chunk_sync_classifies_changes() -> None:
+    """Only new/changed rows are written and changed text is re-embedded."""
+    previous = prepare_chunk_rows(
+        _unified_frame(
+            {
+                "moonveil": "A katana of glintstone.",
+                "rivers_of_blood": "Blade of the bloody finger.",
+                "dark_moon": "Ranni's greatsword.",
+                "uchigatana": "Katana of the Land of Reeds.",
+            }
+        )
+    )
+    existing = {
+        row.id: ExistingChunk(
+            content_hash=row.content_hash,
+            row_hash=row.row_hash,
+            has_embedding=True,
+        )
+        for row in previous
+    }
+
+    current_frame = _unified_frame(
+        {
+            "moonveil": "A katana of glintstone.",
+            "rivers_of_blood": "Blade of the bloody finger, rewritten.",
+            "dark_moon": "Ranni's greatsword.",
+            "nagakiba": "Katana with an exceedingly long blade.",
+        }
+    ).with_columns(
+        pl.when(pl.col("slug") == "dark_moon")
+        .then(pl.lit('{"weight": 2}'))
+        .otherwise(pl.col("meta_json"))
+        .alias("meta_json")
+    )
+    plan = plan_chunk_sync(
+        prepare_chunk_rows(current_frame), existing, embed=True
+    )
+
+    assert plan.report.inserted == 1
+    assert plan.report.updated == 2
+    assert plan.report.unchanged == 1
+    assert plan.report.deleted == 1
+    assert plan.deletes == [stable_chunk_id("weapon", "uchigatana")]
+    assert {row.game_entity_id for row in plan.upserts} == {
+        "rivers_of_blood",
+        "dark_moon",
+        "nagakiba",
+    }
+    # Metadata-only change keeps its stored vector
+    assert {row.game_entity_id for row in plan.needs_embedding} == {
+        "rivers_of_blood",
+        "nagakiba",
+    }
+
+
+def test_plan_chunk_sync_fills_missing_embeddings() -> None:
+    """Unchanged rows without a stored vector are embedded when requested."""
+    rows = prepare_chunk_rows(_unified_frame({"moonveil": "Glintstone."}))
+    existing = {
+        rows[0].id: ExistingChunk(
+            content_hash=rows[0].content_hash,
+            row_hash=rows[0].row_hash,
+            has_embedding=False,
+        )
+    }
+
+    without_embed = plan_chunk_sync(rows, existing)
+    assert without_embed.upserts == []
+    assert without_embed.needs_embedding == []
+
+    with_embed = plan_chunk_sync(rows, existing, embed=True)
+    assert with_embed.report.unchanged == 1
+    assert [row.id for row in with_embed.upserts] == [rows[0].id]
+    assert [row.id for row in with_embed.needs_embedding] == [rows[0].id]
+
+
+def test_build_hybrid_search_sql_pushes_filters_into_both_rankings() -> None:
+    """Filters are applied inside the vector and full-text CTEs."""
+    sql, params = build_hybrid_search_sql(
+        "<=>",
+        entity_type="weapon",
+        is_dlc=True,
+        meta={"damage_type": "magic"},
+    )
+
+    assert sql.count("entity_type = %(entity_type)s") == 2
+    assert sql.count("is_dlc = %(is_dlc)s") == 2
+    assert sql.count("meta @> %(meta)s::jsonb") == 2
+    assert "embedding <=> %(query_vector)b::vector" in sql
+    assert "websearch_to_tsquery('english', %(query_text)s)" in sql
+    assert "FULL OUTER JOIN" in sql
+    assert params == {
+        "entity_type": "weapon",
+        "is_dlc": True,
+        "meta": '{"damage_type": "magic"}',
+    }
+
+
+def test_build_hybrid_search_sql_without_filters() -> None:
+    """No filter parameters are emitted when no filters are requested."""
+    sql, params = build_hybrid_search_sql("<->")
+
+    assert params == {}
+    assert "%(entity_type)s" not in sql
+    with pytest.raises(ValueError):
+        build_hybrid_search_sql("; DROP TABLE")
+
+
+def test_search_cli_passes_filters(monkeypatch: pytest.MonkeyPatch) -> None:
+    """`corpus search` forwards filters to the hybrid search."""
+    captured: dict[str, object] = {}
+
+    class FakeLoader:
+        def __init__(self, dsn: str) -> None:
+            captured["dsn"] = dsn
+
+        def hybrid_search(
+            self, text: str, **kwargs: object
+        ) -> list[dict[str, object]]:
+            captured["text"] = text
+            captured.update(kwargs)
+            return [
+                {
+                    "name": "Moonveil",
+                    "entity_type": "weapon",
+                    "text": "A katana of glintstone.",
+                    "is_dlc": False,
+                    "score": 0.0328,
+                    "vector_rank": 1,
+                    "text_rank": None,
+                }
+            ]
+
+    monkeypatch.setattr(cli, "PgVectorLoader", FakeLoader)
+    result = CliRunner().invoke(
+        cli.main,
+        [
+            "search",
+            "glintstone katana",
+            "--dsn",
+            "postgresql://test",
+            "--base",
+            "--entity-type",
+            "weapon",
+            "--meta",
+            "weight=3",
+            "--meta",
+            "damage_type=magic",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert captured["text"] == "glintstone katana"
+    assert captured["is_dlc"] is False
+    assert captured["entity_type"] == "weapon"
+    assert captured["meta"] == {"weight": 3, "damage_type": "magic"}
+    assert "Moonveil" in result.output
+    assert "vec=1 fts=-" in result.output
+
+
+@pytest.mark.parametrize(
+    ("flags", "expected"),
+    [([], None), (["--partitioned"], True), (["--no-partitioned"], False)],
+)
+def test_load_cli_follows_existing_layout_by_default(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+    flags: list[str],
+    expected: bool | None,
+) -> None:
+    """Without a layout flag `corpus load` keeps the table it finds."""
+    captured: dict[str, object] = {}
+
+    def fake_load_to_postgres(**kwargs: object) -> SyncReport:
+        captured.update(kwargs)
+        return SyncReport()
+
+    parquet_path = tmp_path / "unified.parquet"
+    parquet_path.touch()
+    monkeypatch.setattr(cli, "load_to_postgres", fake_load_to_postgres)
+    result = CliRunner().invoke(
+        cli.main,
+        [
+            "load",
+            "--dsn",
+            "postgresql://test",
+            "--parquet",
+            str(parquet_path),
+            *flags,
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert captured["partitioned"] is expected
+
+
+def test_read_chunk_slice_filters_entity_type(tmp_path) -> None:
+    """Each partition worker only reads its own entity type."""
+    frame = pl.concat(
+        [
+            _unified_frame({"dagger": "A dagger."}),
+            _unified_frame({"godrick": "A boss."}).with_columns(
+                pl.lit("boss").alias("entity_type")
+            ),
+        ]
+    )
+    path = tmp_path / "unified.parquet"
+    frame.write_parquet(path)
+
+    assert read_chunk_slice(path, "boss").get_column("slug").to_list() == [
+        "godrick"
+    ]
+    assert read_chunk_slice(path).height == 2
+
+
+def test_vector_index_matches_pg_indexdef() -> None:
+    """A changed operator class or build parameter marks the index stale."""
+    definition = (
+        "CREATE INDEX corpus_chunk_embedding_hnsw_idx ON elden.corpus_chunk "
+        "USING hnsw (embedding vector_cosine_ops) "
+        "WITH (m='16', ef_construction='64') WHERE (embedding IS NOT NULL)"
+    )
+
+    assert vector_index_matches(definition, HNSWIndexConfig())
+    assert not vector_index_matches(None, HNSWIndexConfig())
+    assert not vector_index_matches(definition, HNSWIndexConfig(m=24))
+    assert not vector_index_matches(
+        definition, HNSWIndexConfig(ef_construction=128)
+    )
+    assert not vector_index_matches(definition, HNSWIndexConfig(distance="l2"))
+
+    # Indexes built without WITH (...) use pgvector's defaults
+    legacy = (
+        "CREATE INDEX corpus_chunk_embedding_hnsw_idx ON elden.corpus_chunk "
+        "USING hnsw (embedding vector_l2_ops)"
+    )
+    assert vector_index_matches(legacy, HNSWIndexConfig(distance="l2"))
@@ -150,6 +150,44 @@ class TestSchemas:
         assert is_valid
         assert error is None
 
+    def test_validate_fast_mode_matches_full(self):
+        """Fast validation returns the frame pandera would coerce."""
+        df = pd.DataFrame(
+            {
+                "item_id": pd.Series([3, 1], dtype="int32"),
+                "name": ["Flask", "Rune"],
+                "category": ["consumable", "material"],
+                "description": ["Heals HP", None],
+                "weight": [0, 0.5],
+                "sell_price": [0, 100],
+                "max_stack": [99.0, 999.0],
+                "rarity": [None, "rare"],
+            }
+        )
+
+        _, _, full = validate_dataframe(df, ITEMS_SCHEMA)
+        is_valid, error, fast = validate_dataframe(df, ITEMS_SCHEMA, "fast")
+        assert is_valid
+        assert error is None
+        pd.testing.assert_frame_equal(fast, full)
+
+    def test_validate_fast_mode_reports_like_full(self):
+        """Fast validation failures carry pandera's full report."""
+        df = pd.DataFrame(
+            {
+                "weapon_id": [1, 1],
+                "name": ["Longsword", ""],
+                "weapon_type": ["sword", "lance"],
+            }
+        )
+
+        _, full_error, _ = validate_dataframe(df, WEAPONS_SCHEMA)
+        is_valid, fast_error, _ = validate_dataframe(
+            df, WEAPONS_SCHEMA, "fast"
+        )
+        assert not is_valid
+        assert fast_error == full_error
+
 
 class TestUtils:
     """Test utility functions."""
@@ -97,3 +97,74 @@ def test_query_index_supports_filters(tmp_path: Path) -> None:
     assert len(results) == 1
     assert results.iloc[0]["category"] == "weapon"
     assert results.iloc[0]["score"] > 0
+
+
+def test_build_rag_index_reads_legacy_list_embeddings(tmp_path: Path) -> None:
+    lore_path = write_sample_lore_corpus(tmp_path)
+    embeddings_path = tmp_path / "lore_embeddings.parquet"
+    frame = build_lore_embeddings(
+        lore_path=lore_path,
+        output_path=embeddings_path,
+        provider="local",
+        model_name="test-model",
+        batch_size=2,
+        encoder=DeterministicEncoder(dim=4),
+        dry_run=True,
+    )
+    # Older runs wrote variable-size lists of Python floats
+    frame["embedding"] = [vector.tolist() for vector in frame["embedding"]]
+    frame.to_parquet(embeddings_path, index=False)
+
+    metadata = build_rag_index(
+        embeddings_path=embeddings_path,
+        index_path=tmp_path / "faiss_index.bin",
+        metadata_path=tmp_path / "rag_metadata.parquet",
+        info_path=tmp_path / "rag_index_meta.json",
+    )
+
+    assert len(metadata) == 3
+    assert "embedding" not in metadata.columns
+
+
+def test_reduced_dimension_index_projects_queries(tmp_path: Path) -> None:
+    lore_path = write_sample_lore_corpus(tmp_path)
+    embeddings_path = tmp_path / "lore_embeddings.parquet"
+    index_path = tmp_path / "faiss_index.bin"
+    metadata_path = tmp_path / "rag_metadata.parquet"
+    info_path = tmp_path / "rag_index_meta.json"
+    encoder = DeterministicEncoder(dim=8)
+    build_lore_embeddings(
+        lore_path=lore_path,
+        output_path=embeddings_path,
+        provider="local",
+        model_name="test-model",
+        batch_size=2,
+        encoder=encoder,
+    )
+
+    build_rag_index(
+        embeddings_path=embeddings_path,
+        index_path=index_path,
+        metadata_path=metadata_path,
+        info_path=info_path,
+        reduce_dimension=2,
+    )
+
+    info_payload = json.loads(info_path.read_text(encoding="utf-8"))
+    assert info_payload["dimension"] == 2
+    projection = info_payload["projection"]
+    assert projection["method"] == "pca"
+    assert projection["input_dimension"] == 8
+    assert (tmp_path / projection["path"]).exists()
+    assert 0.0 <= projection["recall_at_10"] <= 1.0
+
+    # The 8-dim query vector is projected to match the 2-dim index
+    results = query_index(
+        "Moonblade",
+        top_k=3,
+        index_path=index_path,
+        metadata_path=metadata_path,
+        info_path=info_path,
+        encoder=encoder,
+    )
+    assert len(results) == 3
@@ -104,3 +104,28 @@ def test_cross_encoder_reranker_orders_by_model_scores() -> None:
         "lore-1",
     ]
     assert reranker.candidate_pool_size == 3
+
+
+def test_default_cross_encoder_uses_reranker_precision(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from rag import reranker  # type: ignore[import]
+
+    requested: list[tuple[str, str | None, str | None]] = []
+
+    def fake_get(
+        model_name: str,
+        *,
+        device: str | None = None,
+        precision: str | None = None,
+    ) -> object:
+        requested.append((model_name, device, precision))
+        return object()
+
+    monkeypatch.setattr(reranker, "CrossEncoder", object)
+    monkeypatch.setattr(reranker, "get_cross_encoder", fake_get)
+    monkeypatch.setattr(reranker.settings, "embed_local_precision", "float16")
+
+    reranker._default_cross_encoder_factory("mini-ce", "cpu")
+
+    assert requested == [("mini-ce", "cpu", "float32")]